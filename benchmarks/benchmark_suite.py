@@ -0,0 +1,271 @@
+# benchmarks/benchmark_suite.py
+"""
+Benchmark Suite - Smart Expense Tracker
+---------------------------------------
+Times the core operations on synthetic ledgers of increasing size (see
+ledger_generator.py) so scaling problems show up before users hit them.
+
+Cases:
+    - load_expenses            (cold: parsed from CSV)
+    - add_expense_entry        (append one row)
+    - get_expenses_df          (category filter + amount sort, ledger in memory)
+    - monthly_summary, category_insight, yearly_overview, yearly_total_summary (cold)
+    - every plot_* chart       (cold, chart cache bypassed)
+
+"cold" cases drop every in-process and on-disk cache before each run;
+the other cases run once untimed to warm up first. Results are written as
+JSON and compared with a stored baseline: a case whose median grew by more
+than the tolerance (and by more than a small noise floor) is a regression.
+
+Everything runs in a scratch directory with config paths redirected there,
+so the real ledger, caches and /Visuals/ are never touched.
+
+Usage:
+    python benchmarks/benchmark_suite.py [--sizes 1k 10k 100k] [--repeat 3] [--only summary]
+    python benchmarks/benchmark_suite.py --sizes 1m --save-baseline
+    python benchmarks/benchmark_suite.py --sizes 1m            # compare with benchmarks/baseline.json
+
+Exits with status 1 when a regression against the baseline is found.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import matplotlib
+matplotlib.use("Agg")  # no GUI while timing charts
+
+from benchmarks.ledger_generator import DEFAULT_SEED, generate_ledger, parse_size
+
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = ("1k", "10k", "100k")
+DEFAULT_REPEAT = 3
+DEFAULT_TOLERANCE = 0.25      # +25% median is a regression...
+NOISE_FLOOR_SECONDS = 0.005   # ...unless it is smaller than this in absolute terms
+
+RESULTS_DIR = ROOT_DIR / "benchmarks" / "results"
+BASELINE_FILE = ROOT_DIR / "benchmarks" / "baseline.json"
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Environment
+# ----------------------------------------------------------------------------------------------------
+@contextlib.contextmanager
+def scratch_environment(workdir: Path):
+    """Point caches and chart output at `workdir` (test mode) for the duration of the run."""
+    from src import config
+
+    saved = {name: getattr(config, name) for name in ("CACHE_DIR", "TEST_MODE", "TEST_VISUALS_DIR")}
+    config.CACHE_DIR = workdir / "cache"
+    config.TEST_MODE = True
+    config.TEST_VISUALS_DIR = workdir / "visuals"
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(config, name, value)
+
+
+def reset_caches(ledger: Path) -> None:
+    """Drop the in-memory store, aggregates, search index and every on-disk cache."""
+    from src import config
+    from src.aggregates import invalidate_aggregates
+    from src.data_manager import expense_store
+    from src.search_index import invalidate_search_index
+
+    expense_store.clear()
+    invalidate_aggregates(ledger)
+    invalidate_search_index(ledger)
+    shutil.rmtree(config.CACHE_DIR, ignore_errors=True)
+
+
+def build_cases(ledger: Path) -> list[tuple[str, callable, bool]]:
+    """
+    Return the benchmark cases for a ledger.
+
+    Returns:
+        list[tuple[str, Callable, bool]]: (name, function, cold) triples.
+    """
+    from src.add_expense import add_expense_entry
+    from src.category_insight import category_insight
+    from src.data_manager import load_expenses
+    from src.monthly_summary import monthly_summary
+    from src.view_expenses import get_expenses_df
+    from src.visualization import CHARTS
+    from src.yearly_overview import yearly_overview, yearly_total_summary
+
+    cases = [
+        ("load_expenses", lambda: load_expenses(ledger), True),
+        ("add_expense_entry",
+         lambda: add_expense_entry("2025-12-31", "Food", "Benchmark lunch", 250.0, "UPI", file_path=ledger), False),
+        ("get_expenses_df",
+         lambda: get_expenses_df(category="Food", sort_by="Amount", descending=True, file_path=ledger), False),
+        ("monthly_summary", lambda: monthly_summary(ledger), True),
+        ("category_insight", lambda: category_insight(ledger), True),
+        ("yearly_overview", lambda: yearly_overview(ledger), True),
+        ("yearly_total_summary", lambda: yearly_total_summary(ledger), True),
+    ]
+    for plot in CHARTS.values():
+        cases.append((plot.__name__, lambda plot=plot: plot(file_path=ledger, cache=False), True))
+    return cases
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 Measurements
+# ----------------------------------------------------------------------------------------------------
+def time_case(func, ledger: Path, cold: bool, repeat: int) -> list[float]:
+    """Run one case `repeat` times (output silenced) and return wall-clock seconds per run."""
+    timings = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not cold:
+            func()
+        for _ in range(repeat):
+            if cold:
+                reset_caches(ledger)
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_suite(sizes: list[int], repeat: int = DEFAULT_REPEAT, only: list[str] | None = None,
+              workdir: Path | None = None, seed: int = DEFAULT_SEED) -> dict:
+    """
+    Benchmark every case on a fresh synthetic ledger of each size.
+
+    Args:
+        sizes (list[int]): Ledger sizes (rows).
+        repeat (int): Timed runs per case.
+        only (list[str] | None): Keep cases whose name contains one of these substrings.
+        workdir (Path | None): Scratch directory; generated ledgers are reused from here.
+        seed (int): Generator seed.
+
+    Returns:
+        dict: JSON-ready results document.
+    """
+    workdir = Path(workdir or tempfile.mkdtemp(prefix="expense-bench-"))
+    results = {}
+
+    with scratch_environment(workdir):
+        for rows in sizes:
+            pristine = workdir / f"ledger-{rows}-{seed}.csv"
+            if not pristine.exists():
+                print(f"🧪 Generating {rows:,}-row ledger...")
+                generate_ledger(pristine, rows, seed=seed)
+            ledger = workdir / "ledger.csv"
+            shutil.copyfile(pristine, ledger)
+            reset_caches(ledger)
+
+            print(f"⏱️ Benchmarking {rows:,} rows")
+            results[str(rows)] = {}
+            for name, func, cold in build_cases(ledger):
+                if only and not any(part in name for part in only):
+                    continue
+                timings = time_case(func, ledger, cold, repeat)
+                results[str(rows)][name] = {"median": statistics.median(timings), "min": min(timings),
+                                            "runs": timings, "cold": cold}
+                print(f"   {name:<36} {statistics.median(timings) * 1000:>10.1f} ms")
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE,
+            noise_floor: float = NOISE_FLOOR_SECONDS) -> list[dict]:
+    """
+    Find cases whose median regressed against the baseline.
+
+    Args:
+        current (dict): Results from run_suite().
+        baseline (dict): Stored results document.
+        tolerance (float): Allowed relative slow-down (0.25 = +25%).
+        noise_floor (float): Ignore slow-downs smaller than this many seconds.
+
+    Returns:
+        list[dict]: One entry per regression (size, case, baseline, current, ratio).
+    """
+    regressions = []
+    for size, cases in current.get("results", {}).items():
+        for name, result in cases.items():
+            reference = baseline.get("results", {}).get(size, {}).get(name)
+            if not reference:
+                continue
+            before, after = reference["median"], result["median"]
+            if after > before * (1 + tolerance) and after - before > noise_floor:
+                regressions.append({"size": int(size), "case": name, "baseline": before,
+                                    "current": after, "ratio": after / before if before else float("inf")})
+    return regressions
+
+
+def write_results(results: dict, path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧪 Standalone Execution
+# ----------------------------------------------------------------------------------------------------
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Smart Expense Tracker on synthetic ledgers.")
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES), help="ledger sizes, e.g. 1k 100k 10m")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per case")
+    parser.add_argument("--only", nargs="+", help="only cases whose name contains one of these")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="generator seed")
+    parser.add_argument("--workdir", type=Path, help="scratch directory (reuses generated ledgers)")
+    parser.add_argument("--output", type=Path, help="results JSON (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed relative slow-down")
+    args = parser.parse_args(argv)
+
+    results = run_suite([parse_size(size) for size in args.sizes], repeat=args.repeat, only=args.only,
+                        workdir=args.workdir, seed=args.seed)
+
+    output = args.output or RESULTS_DIR / f"benchmark_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+    print(f"💾 Results → {write_results(results, output)}")
+
+    if args.save_baseline:
+        print(f"📌 Baseline → {write_results(results, args.baseline)}")
+        return 0
+
+    if not args.baseline.exists():
+        print("ℹ️ No baseline to compare with (run with --save-baseline to create one).")
+        return 0
+
+    with args.baseline.open("r", encoding="utf-8") as f:
+        regressions = compare(results, json.load(f), tolerance=args.tolerance)
+
+    if regressions:
+        print("⚠️ Regressions against the baseline:")
+        for item in regressions:
+            print(f"   {item['size']:>10,} rows  {item['case']:<36} "
+                  f"{item['baseline'] * 1000:.1f} ms → {item['current'] * 1000:.1f} ms (×{item['ratio']:.2f})")
+        return 1
+    print("✅ No regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+# benchmarks/ledger_generator.py
+"""
+Synthetic Ledger Generator - Smart Expense Tracker
+--------------------------------------------------
+Writes deterministic, realistic expense ledgers of any size (1k → 10M rows)
+for benchmarks. The same seed and size always produce the same file.
+
+Distributions:
+    - Dates advance over `years` years in (nearly) the order they are
+      appended, with more entries on Saturdays.
+    - Categories follow everyday frequencies (Food most common, Rent once
+      a month-ish); amounts are log-normal per category.
+    - Payment modes depend on the category (Rent by Card/UPI, small Food
+      purchases often Cash).
+    - Descriptions combine a per-category item with a merchant name.
+
+Rows are generated and written in chunks, so memory stays bounded
+regardless of the ledger size.
+
+Usage:
+    python benchmarks/ledger_generator.py data/bench.csv --rows 1000000 [--seed 42]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_SEED = 42
+DEFAULT_START = "2016-01-01"
+DEFAULT_YEARS = 10
+CHUNK_ROWS = 500_000
+
+# category: (share of entries, median amount, log-normal sigma, payment mode weights Cash/UPI/Card)
+CATEGORY_PROFILES = {
+    "Food":          (0.30, 250, 0.6, (0.35, 0.50, 0.15)),
+    "Transport":     (0.14, 120, 0.7, (0.30, 0.60, 0.10)),
+    "Shopping":      (0.12, 1500, 0.9, (0.10, 0.40, 0.50)),
+    "Bills":         (0.09, 1200, 0.5, (0.05, 0.55, 0.40)),
+    "Entertainment": (0.09, 600, 0.7, (0.15, 0.45, 0.40)),
+    "Health":        (0.07, 800, 0.9, (0.20, 0.40, 0.40)),
+    "Travel":        (0.05, 4000, 1.0, (0.05, 0.35, 0.60)),
+    "Education":     (0.04, 2500, 0.8, (0.05, 0.45, 0.50)),
+    "Groceries":     (0.08, 900, 0.5, (0.25, 0.55, 0.20)),
+    "Rent":          (0.02, 18000, 0.15, (0.00, 0.40, 0.60)),
+}
+PAYMENT_MODES = ("Cash", "UPI", "Card")
+
+ITEMS = {
+    "Food": ["Lunch", "Dinner", "Breakfast", "Coffee", "Snacks", "Takeaway"],
+    "Transport": ["Bus", "Metro", "Cab", "Auto", "Fuel", "Parking"],
+    "Shopping": ["T-Shirt", "Shoes", "Headphones", "Backpack", "Jeans", "Watch"],
+    "Bills": ["Electricity", "Water", "Internet", "Mobile", "Gas"],
+    "Entertainment": ["Movie", "Concert", "Streaming", "Games", "Bowling"],
+    "Health": ["Pharmacy", "Doctor", "Gym", "Dental", "Lab Test"],
+    "Travel": ["Flight", "Train", "Hotel", "Tour", "Visa"],
+    "Education": ["Books", "Course", "Exam Fee", "Stationery"],
+    "Groceries": ["Vegetables", "Fruits", "Milk", "Rice", "Household"],
+    "Rent": ["Monthly Rent", "Maintenance"],
+}
+MERCHANTS = ["FreshMart", "CityMall", "QuickRide", "Hello Steel", "Metro Co", "BlueCafe",
+             "HealthPlus", "SkyWays", "BookHub", "PowerGrid", "StarCinema", "GreenGrocer"]
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def _chunk(rng: np.random.Generator, first_row: int, rows: int, total_rows: int,
+           start: pd.Timestamp, total_days: int) -> pd.DataFrame:
+    """Generate rows [first_row, first_row + rows) of a ledger with `total_rows` rows."""
+    names = list(CATEGORY_PROFILES)
+    shares = np.array([CATEGORY_PROFILES[name][0] for name in names])
+    category_codes = rng.choice(len(names), size=rows, p=shares / shares.sum())
+
+    # Nearly chronological dates with a small jitter; some weekday entries move to Saturday
+    position = (np.arange(first_row, first_row + rows) + rng.random(rows)) / total_rows
+    days = (position * total_days).astype(np.int64)
+    weekdays = (start.dayofweek + days) % 7
+    to_saturday = np.where(rng.random(rows) < 0.15, np.clip(5 - weekdays, 0, None), 0)
+    days = np.minimum(days + to_saturday, total_days - 1)
+    dates = start + pd.to_timedelta(days, unit="D")
+
+    medians = np.array([CATEGORY_PROFILES[name][1] for name in names])[category_codes]
+    sigmas = np.array([CATEGORY_PROFILES[name][2] for name in names])[category_codes]
+    amounts = np.round(medians * np.exp(rng.normal(0.0, 1.0, rows) * sigmas), 2).clip(min=1.0)
+
+    mode_weights = np.array([CATEGORY_PROFILES[name][3] for name in names])[category_codes]
+    modes = (rng.random(rows)[:, None] > np.cumsum(mode_weights, axis=1)).sum(axis=1).clip(max=2)
+
+    item_picks = rng.random(rows)
+    merchant_picks = rng.integers(0, len(MERCHANTS), rows)
+    descriptions = [
+        f"{ITEMS[names[code]][int(pick * len(ITEMS[names[code]]))]} at {MERCHANTS[merchant]}"
+        for code, pick, merchant in zip(category_codes, item_picks, merchant_picks)
+    ]
+
+    return pd.DataFrame({
+        "Date": dates.strftime("%Y-%m-%d"),
+        "Category": np.array(names)[category_codes],
+        "Description": descriptions,
+        "Amount": amounts,
+        "Payment_Mode": np.array(PAYMENT_MODES)[modes],
+    })
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+def iter_ledger_chunks(rows: int, seed: int = DEFAULT_SEED, start: str = DEFAULT_START,
+                       years: int = DEFAULT_YEARS, chunk_rows: int = CHUNK_ROWS):
+    """
+    Yield a synthetic ledger as DataFrame chunks (deterministic for a seed).
+
+    Args:
+        rows (int): Total number of expenses.
+        seed (int): Random seed.
+        start (str): First date (ISO).
+        years (int): Time span covered.
+        chunk_rows (int): Rows per yielded chunk.
+
+    Yields:
+        pd.DataFrame: Chunk with the ledger columns (Date as ISO text).
+    """
+    rng = np.random.default_rng(seed)
+    start_ts = pd.Timestamp(start)
+    total_days = (start_ts + pd.DateOffset(years=years) - start_ts).days
+    for first_row in range(0, rows, chunk_rows):
+        yield _chunk(rng, first_row, min(chunk_rows, rows - first_row), rows, start_ts, total_days)
+
+
+def generate_ledger(file_path: str | Path, rows: int, seed: int = DEFAULT_SEED, start: str = DEFAULT_START,
+                    years: int = DEFAULT_YEARS) -> Path:
+    """
+    Write a synthetic CSV ledger.
+
+    Args:
+        file_path (str | Path): Destination CSV (import it into .db / .parts ledgers if needed).
+        rows (int): Total number of expenses.
+        seed (int): Random seed.
+        start (str): First date (ISO).
+        years (int): Time span covered.
+
+    Returns:
+        Path: The written file.
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        header = True
+        for chunk in iter_ledger_chunks(rows, seed=seed, start=start, years=years):
+            chunk.to_csv(f, index=False, header=header)
+            header = False
+        if header:
+            f.write(",".join(["Date", "Category", "Description", "Amount", "Payment_Mode"]) + "\n")
+    return path
+
+
+def parse_size(text: str) -> int:
+    """Parse a row count such as "5000", "10k" or "1m"."""
+    text = text.strip().lower().replace("_", "")
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text[:-1] if multiplier > 1 else text) * multiplier)
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧪 Standalone Execution
+# ----------------------------------------------------------------------------------------------------
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic Smart Expense Tracker ledger.")
+    parser.add_argument("path", help="destination CSV file")
+    parser.add_argument("--rows", type=parse_size, default=10_000, help="number of expenses (e.g. 1k, 10m)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="random seed")
+    parser.add_argument("--start", default=DEFAULT_START, help="first date (YYYY-MM-DD)")
+    parser.add_argument("--years", type=int, default=DEFAULT_YEARS, help="years covered")
+    args = parser.parse_args(argv)
+
+    path = generate_ledger(args.path, args.rows, seed=args.seed, start=args.start, years=args.years)
+    print(f"✅ Wrote {args.rows:,} expenses → {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
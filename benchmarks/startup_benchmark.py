@@ -0,0 +1,117 @@
+# benchmarks/startup_benchmark.py
+"""
+Startup Benchmark - Smart Expense Tracker
+-----------------------------------------
+Measures time-to-menu: launching src/main.py (diagnostics skipped), showing
+the main menu and exiting straight away. Each run is a fresh interpreter so
+import costs are counted every time.
+
+Also reports which heavy modules were imported before the menu appeared;
+plotting, pandas and the test stack should only load on first use.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5] [--budget 0.25]
+
+Exits with status 1 when the median time-to-menu exceeds the budget (seconds)
+or a heavy module is imported at startup.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MAIN_SCRIPT = ROOT_DIR / "src" / "main.py"
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.main import EXIT_CHOICE  # noqa: E402  (stdlib-only import, cheap)
+
+# Default time-to-menu budget in seconds
+DEFAULT_BUDGET = 0.25
+
+# Modules that must not be imported before the menu is shown
+HEAVY_MODULES = ("pandas", "matplotlib", "seaborn", "pytest", "tabulate")
+
+_IMPORT_PROBE = (
+    "import sys; sys.path.insert(0, {root!r}); import src.main; "
+    "print(','.join(m for m in {heavy!r} if m in sys.modules))"
+)
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 Measurements
+# ----------------------------------------------------------------------------------------------------
+def time_to_menu(runs: int = 5) -> list[float]:
+    """
+    Launch the CLI `runs` times, choose Exit at the menu, and time each run.
+
+    Returns:
+        list[float]: Wall-clock seconds per run.
+    """
+    timings = []
+    with tempfile.TemporaryDirectory() as workdir:
+        # Throwaway ledger: launching the CLI must not create data/Expenses.csv in the checkout
+        env = {**os.environ, "EXPENSE_TRACKER_DATA_FILE": str(Path(workdir) / "Expenses.csv")}
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, str(MAIN_SCRIPT), "--no-diagnostics"],
+                input=f"{EXIT_CHOICE}\n", capture_output=True, text=True, encoding="utf-8", cwd=ROOT_DIR, env=env,
+            )
+            timings.append(time.perf_counter() - start)
+            if result.returncode != 0:
+                raise RuntimeError(f"main.py exited with {result.returncode}:\n{result.stderr}")
+    return timings
+
+
+def heavy_imports_at_startup() -> list[str]:
+    """Return the heavy modules imported by `import src.main`."""
+    probe = _IMPORT_PROBE.format(root=str(ROOT_DIR), heavy=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def interpreter_baseline(runs: int = 5) -> float:
+    """Median start-up time of a bare interpreter (the floor for time-to-menu)."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧪 Standalone Execution
+# ----------------------------------------------------------------------------------------------------
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure Smart Expense Tracker time-to-menu.")
+    parser.add_argument("--runs", type=int, default=5, help="number of launches to time")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="median budget in seconds")
+    args = parser.parse_args(argv)
+
+    timings = time_to_menu(args.runs)
+    median = statistics.median(timings)
+    heavy = heavy_imports_at_startup()
+
+    print(f"🐍 Bare interpreter:  {interpreter_baseline(args.runs):.3f}s")
+    print(f"⏱️ Time-to-menu:      {median:.3f}s median "
+          f"(min {min(timings):.3f}s, max {max(timings):.3f}s, {args.runs} runs)")
+    print(f"🎯 Budget:            {args.budget:.3f}s")
+    print(f"📦 Heavy imports:     {', '.join(heavy) if heavy else 'none'}")
+
+    if median > args.budget or heavy:
+        print("⚠️ Startup budget exceeded.")
+        return 1
+    print("✅ Startup within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,17 +6,47 @@ Handles adding a new expense entry to the system.
 
 Structure:
     1. add_expense_entry() → Pure, testable function (no user input).
-    2. add_expense_interactive() → CLI wrapper for interactive use.
+    2. add_expenses_bulk() → Batched insert for many records at once.
+    3. add_expense_interactive() → CLI wrapper for interactive use.
 
 Future-ready: This design will also work for GUI or API layers.
 """
 
-import csv
 from datetime import datetime
 from pathlib import Path
-import pandas as pd
-from src.data_manager import ensure_csv_exists,get_data_file
-from src.utils import parse_date
+from src.data_manager import append_expenses, ensure_csv_exists, get_data_file
+from src.utils import chunked, is_valid_amount, parse_date
+
+
+# -------------------------------------------------------------------------------------------------
+# 🧩 Internal Helper: Build & Validate Entry
+# -------------------------------------------------------------------------------------------------
+def _build_entry(date, category, description, amount, payment_mode="Cash"):
+    """
+    Validate raw field values and return a normalized expense entry.
+
+    Raises:
+        ValueError: If the amount is not a positive number or the date is not
+            in a recognised format (a blank date means today).
+    """
+    if not is_valid_amount(amount) or float(amount) <= 0:
+        raise ValueError("Amount must be positive.")
+
+    # Convert Date (recognised formats are stored as ISO YYYY-MM-DD)
+    if isinstance(date, datetime):
+        date_str = date.strftime("%Y-%m-%d")
+    else:
+        date_str = parse_date("" if date is None else str(date))
+        if date_str is None:
+            raise ValueError(f"Invalid date {date!r}.")
+
+    return {
+        "Date": date_str,
+        "Category": str(category or "").strip() or "Uncategorized",
+        "Description": str(description or "").strip(),
+        "Amount": float(amount),
+        "Payment Mode": str(payment_mode or "").strip() or "Cash"
+    }
 
 
 # -------------------------------------------------------------------------------------------------
@@ -37,32 +67,54 @@ def add_expense_entry(date, category, description, amount, payment_mode="Cash",
     Returns:
         dict: The expense entry added.
     """
-    if amount <= 0:
-        raise ValueError("Amount must be positive.")
-    
-    ensure_csv_exists()
+    entry = _build_entry(date, category, description, amount, payment_mode)
+
     file_path = Path(file_path or get_data_file())
+    ensure_csv_exists(file_path)
 
-    # Convert Date
-    if isinstance(date, datetime):
-        date_str = date.strftime("%Y-%m-%d")
-    else:
-        date_str = str(date)
+    # Append new entry to the end of the CSV (no full-file rewrite)
+    append_expenses([entry], file_path)
 
-    entry = {
-        "Date": date_str,
-        "Category": category.strip() or "Uncategorized",
-        "Description": description.strip(),
-        "Amount": float(amount),
-        "Payment Mode": payment_mode.strip() or "Cash"
-    }
+    return entry
 
-    # Append new entry to CSV
-    df = pd.read_csv(file_path)
-    df = pd.concat([df, pd.DataFrame([entry])], ignore_index=True)
-    df.to_csv(file_path, index=False)
 
-    return entry
+# -------------------------------------------------------------------------------------------------
+# 📦 BULK INSERT (Many records, one file open per chunk)
+# -------------------------------------------------------------------------------------------------
+def add_expenses_bulk(entries, file_path=None, chunksize=1000):
+    """
+    Add many expense records, writing them to the CSV in chunks.
+
+    Each chunk is fully validated before it is written, so an invalid record
+    never leaves a half-written chunk behind (earlier chunks stay saved).
+
+    Parameters:
+        entries (Iterable[dict]): Records with 'Date', 'Category', 'Description',
+                                  'Amount' and optionally 'Payment_Mode' keys.
+        file_path (Path or str, optional): Custom CSV file path for testing.
+        chunksize (int): Number of records written per chunk.
+
+    Returns:
+        int: Number of expense entries added.
+    """
+    file_path = Path(file_path or get_data_file())
+    ensure_csv_exists(file_path)
+
+    added = 0
+    for chunk in chunked(entries, chunksize):
+        rows = [
+            _build_entry(
+                row.get("Date"),
+                row.get("Category"),
+                row.get("Description"),
+                row.get("Amount"),
+                row.get("Payment_Mode", row.get("Payment Mode")),
+            )
+            for row in chunk
+        ]
+        added += append_expenses(rows, file_path)
+
+    return added
 
 
 # -------------------------------------------------------------------------------------------------
@@ -0,0 +1,452 @@
+# src/aggregates.py
+"""
+Module: aggregates
+------------------
+Incrementally maintained summary aggregates for the expense ledger.
+
+The month × category sums and counts are kept up to date on every append
+and edit made through data_manager instead of being recomputed from the
+full history. Month totals, year
+totals and category totals are all derived from those cells, so the
+summary screens cost O(months × categories) rather than O(expenses).
+
+Storage:
+    - In memory per ledger, tagged with the backend fingerprint.
+    - Persisted as a JSON sidecar under config.CACHE_DIR once the ledger
+      holds at least config.AGGREGATES_MIN_ROWS rows.
+    - Rebuilt (partition by partition) whenever the fingerprint no longer
+      matches, i.e. the ledger was edited out-of-band.
+
+For archives too large to hold in memory, aggregate_chunks() folds the same
+aggregates over data_manager.iter_expenses() chunks in constant memory; the
+result is identical to the in-memory one.
+
+AnalyticsBundle packages every view the summaries and charts need (month ×
+category pivot, month / year / category totals) derived from those cells,
+so a full report groups the data once instead of once per view.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import pandas as pd
+from pathlib import Path
+from src.data_manager import get_backend, get_data_file, iter_expense_frames, iter_expenses
+from src.date_parser import LOAD_DATE_FORMATS, parse_dates
+from src.instrumentation import instrumented
+
+
+AGGREGATES_VERSION = 3  # v3: totals include DD/MM/YYYY and other non-ISO dated rows
+
+# Category key used for rows without a category (kept in month totals only)
+NO_CATEGORY = ""
+
+# Amounts at or above this are summed as floats (keeps cents inside int64)
+MAX_CENTS_AMOUNT = 1e13
+
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+_MEMORY: dict[str, "SummaryAggregates"] = {}
+_BUNDLES: dict[str, "AnalyticsBundle"] = {}
+_LOCK = threading.Lock()
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧮 Aggregate State
+# ----------------------------------------------------------------------------------------------------
+class SummaryAggregates:
+    """
+    Month × category sums and counts, plus the ledger fingerprint they describe.
+
+    Amounts that are whole cents (the normal case) are summed as integer cents,
+    which is exact and order-independent, so aggregates folded chunk by chunk
+    equal aggregates of the whole frame bit for bit. Any sub-cent remainder is
+    kept in a separate float residual.
+    """
+
+    def __init__(self, cells: dict | None = None, fingerprint: str | None = None):
+        # cells[month][category] = [cents, residual, count]
+        self.cells: dict[str, dict[str, list]] = cells or {}
+        self.fingerprint = fingerprint
+
+    # ---------- Building ----------
+    @classmethod
+    @instrumented("aggregates.group_by", rows=lambda aggs: aggs.rows)
+    def from_frame(cls, df: pd.DataFrame) -> "SummaryAggregates":
+        """Aggregate a cleaned expense frame."""
+        aggs = cls()
+        if df.empty:
+            return aggs
+
+        amount = df["Amount"].astype(float)
+        cents = (amount * 100).round()
+        whole_cents = (amount.abs() < MAX_CENTS_AMOUNT) & ((cents / 100) == amount)
+        # Group on an integer YYYYMM key; only the distinct months are formatted
+        parts = pd.DataFrame({
+            "Month": df["Date"].dt.year * 100 + df["Date"].dt.month,
+            "Category": df["Category"].astype(object).where(df["Category"].notna(), NO_CATEGORY),
+            "cents": cents.where(whole_cents, 0).astype("int64"),
+            "residual": amount.where(~whole_cents, 0.0),
+        })
+        grouped = parts.groupby(["Month", "Category"], sort=False).agg(
+            cents=("cents", "sum"), residual=("residual", "sum"), count=("cents", "size"))
+
+        for (month, category), cell_cents, residual, count in zip(
+                grouped.index, grouped["cents"], grouped["residual"], grouped["count"]):
+            month_key = f"{month // 100:04d}-{month % 100:02d}"
+            aggs.cells.setdefault(month_key, {})[str(category)] = [int(cell_cents), float(residual), int(count)]
+        return aggs
+
+    def merge(self, other: "SummaryAggregates") -> "SummaryAggregates":
+        """Fold another set of aggregates into this one (in place)."""
+        for month, cats in other.cells.items():
+            target = self.cells.setdefault(month, {})
+            for category, (cell_cents, residual, count) in cats.items():
+                cell = target.setdefault(category, [0, 0.0, 0])
+                cell[0] += cell_cents
+                cell[1] += residual
+                cell[2] += count
+        return self
+
+    def add(self, date, category, amount, sign: int = 1) -> None:
+        """
+        Add one raw entry using the same cleaning rules as data_manager.clean_expenses().
+
+        sign=-1 removes a previously added entry (used for edits and deletions).
+        Raw dates are parsed with date_parser.parse_dates() and LOAD_DATE_FORMATS,
+        so DD/MM/YYYY text lands in the same month as after a rebuild.
+        """
+        timestamp = date if isinstance(date, pd.Timestamp) else parse_dates([date], LOAD_DATE_FORMATS)[0].iloc[0]
+        if pd.isna(timestamp):
+            return
+        amount = pd.to_numeric(amount, errors="coerce")
+        amount = 0.0 if pd.isna(amount) else float(amount)
+        category = NO_CATEGORY if category is None or pd.isna(category) or category == "" else str(category)
+
+        month = timestamp.strftime("%Y-%m")
+        cell = self.cells.setdefault(month, {}).setdefault(category, [0, 0.0, 0])
+        if abs(amount) < MAX_CENTS_AMOUNT and round(amount * 100) / 100 == amount:
+            cell[0] += sign * round(amount * 100)
+        else:
+            cell[1] += sign * amount
+        cell[2] += sign
+
+        if cell[2] <= 0:  # last entry of the cell removed
+            del self.cells[month][category]
+            if not self.cells[month]:
+                del self.cells[month]
+
+    # ---------- Derived views ----------
+    @staticmethod
+    def _total(cells) -> float:
+        cents = sum(cell[0] for cell in cells)
+        residual = sum(cell[1] for cell in cells)
+        return cents / 100 + residual
+
+    @property
+    def rows(self) -> int:
+        return sum(cell[2] for cats in self.cells.values() for cell in cats.values())
+
+    def month_totals(self) -> dict[str, float]:
+        """Total per `YYYY-MM`, oldest first."""
+        return {month: self._total(self.cells[month].values()) for month in sorted(self.cells)}
+
+    def year_month_totals(self) -> list[tuple[int, str, float]]:
+        """(Year, month name, total) rows in calendar order."""
+        return [(int(month[:4]), MONTH_NAMES[int(month[5:7]) - 1], total)
+                for month, total in self.month_totals().items()]
+
+    def year_totals(self) -> dict[int, float]:
+        """Total per year, oldest first."""
+        years: dict[int, list] = {}
+        for month in sorted(self.cells):
+            years.setdefault(int(month[:4]), []).extend(self.cells[month].values())
+        return {year: self._total(cells) for year, cells in years.items()}
+
+    def category_stats(self) -> dict[str, tuple[float, int]]:
+        """(total, entries) per category (rows without a category excluded), sorted by name."""
+        stats: dict[str, list] = {}
+        for cats in self.cells.values():
+            for category, cell in cats.items():
+                if category != NO_CATEGORY:
+                    stats.setdefault(category, []).append(cell)
+        return {category: (self._total(cells), sum(cell[2] for cell in cells))
+                for category, cells in sorted(stats.items())}
+
+    # ---------- Serialization ----------
+    def to_dict(self) -> dict:
+        return {"version": AGGREGATES_VERSION, "fingerprint": self.fingerprint, "cells": self.cells}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SummaryAggregates | None":
+        if not isinstance(data, dict) or data.get("version") != AGGREGATES_VERSION:
+            return None
+        return cls(cells=data.get("cells") or {}, fingerprint=data.get("fingerprint"))
+
+
+# ----------------------------------------------------------------------------------------------------
+# 📦 Analytics Bundle
+# ----------------------------------------------------------------------------------------------------
+class AnalyticsBundle:
+    """
+    Every summary view derived from one month × category aggregation.
+
+    Attributes:
+        pivot (pd.DataFrame): Month × Category totals (rows without a category excluded), 0 where empty.
+        counts (pd.DataFrame): Month × Category entry counts, same shape as `pivot`.
+        month_totals (dict[str, float]): Total per `YYYY-MM` (all rows), oldest first.
+        year_month_totals (list[tuple[int, str, float]]): (Year, month name, total) rows.
+        year_totals (dict[int, float]): Total per year, oldest first.
+        category_stats (dict[str, tuple[float, int]]): (total, entries) per category, sorted by name.
+    """
+
+    def __init__(self, aggs: SummaryAggregates):
+        self.fingerprint = aggs.fingerprint
+        months = sorted(aggs.cells)
+        categories = sorted({category for cats in aggs.cells.values() for category in cats} - {NO_CATEGORY})
+
+        totals, counts = [], []
+        for month in months:
+            cats = aggs.cells[month]
+            totals.append([SummaryAggregates._total([cats[c]]) if c in cats else 0.0 for c in categories])
+            counts.append([cats[c][2] if c in cats else 0 for c in categories])
+
+        index = pd.Index(months, name="Month")
+        columns = pd.Index(categories, name="Category")
+        self.pivot = pd.DataFrame(totals, index=index, columns=columns, dtype="float64")
+        self.counts = pd.DataFrame(counts, index=index, columns=columns, dtype="int64")
+
+        self.month_totals = aggs.month_totals()
+        self.year_month_totals = aggs.year_month_totals()
+        self.year_totals = aggs.year_totals()
+        self.category_stats = aggs.category_stats()
+
+    @property
+    def empty(self) -> bool:
+        return not self.month_totals
+
+    def chart_month_totals(self) -> pd.DataFrame:
+        """['Month', 'Amount'] totals over categorized rows (what the charts plot)."""
+        return pd.DataFrame({"Month": self.pivot.index.astype(str), "Amount": self.pivot.sum(axis=1).to_numpy()})
+
+    def chart_category_totals(self) -> pd.DataFrame:
+        """['Category', 'Amount'] totals, sorted by category name."""
+        return pd.DataFrame({"Category": list(self.category_stats),
+                             "Amount": [total for total, _ in self.category_stats.values()]})
+
+
+def analytics_bundle(df: pd.DataFrame) -> AnalyticsBundle:
+    """
+    Build every summary view from one grouping pass over a cleaned expense frame.
+
+    Args:
+        df (pd.DataFrame): Cleaned expense frame (Date as datetime).
+
+    Returns:
+        AnalyticsBundle: Pivot plus month / year / category totals.
+    """
+    return AnalyticsBundle(SummaryAggregates.from_frame(df))
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def _key(file_path) -> str:
+    return str(Path(file_path or get_data_file()).resolve())
+
+
+def fingerprint_token(fingerprint: tuple) -> str:
+    """Stable string form of a backend fingerprint (JSON-safe)."""
+    return hashlib.sha1(repr(fingerprint).encode("utf-8")).hexdigest()
+
+
+def sidecar_path(file_path) -> Path:
+    """Return the JSON sidecar used for a ledger."""
+    from src import config  # dynamic import keeps CACHE_DIR patchable
+
+    resolved = Path(_key(file_path))
+    digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()[:16]
+    return Path(config.CACHE_DIR) / f"{resolved.stem}-{digest}.aggregates.json"
+
+
+def _read_sidecar(file_path) -> SummaryAggregates | None:
+    try:
+        with sidecar_path(file_path).open("r", encoding="utf-8") as f:
+            return SummaryAggregates.from_dict(json.load(f))
+    except (OSError, ValueError):
+        return None
+
+
+def _persist(file_path, aggs: SummaryAggregates) -> None:
+    """Write the sidecar atomically once the ledger is big enough to benefit."""
+    from src import config
+
+    if aggs.rows < config.AGGREGATES_MIN_ROWS:
+        return
+    path = sidecar_path(file_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(aggs.to_dict(), f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ Could not write aggregates sidecar: {e}")
+
+
+def _current(file_path, token: str) -> SummaryAggregates | None:
+    """Return aggregates (memory, then sidecar) matching a fingerprint token."""
+    aggs = _MEMORY.get(_key(file_path))
+    if aggs is not None and aggs.fingerprint == token:
+        return aggs
+    aggs = _read_sidecar(file_path)
+    if aggs is not None and aggs.fingerprint == token:
+        _MEMORY[_key(file_path)] = aggs
+        return aggs
+    return None
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+@instrumented(rows=lambda aggs: aggs.rows)
+def rebuild_aggregates(file_path=None) -> SummaryAggregates:
+    """
+    Recompute the aggregates from the ledger (one partition at a time) and store them.
+
+    Args:
+        file_path (str | Path | None): Ledger path (defaults to the main data file).
+
+    Returns:
+        SummaryAggregates: Fresh aggregates.
+    """
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+    token = fingerprint_token(backend.fingerprint())
+
+    aggs = SummaryAggregates(fingerprint=token)
+    for df in iter_expense_frames(backend.path):
+        aggs.merge(SummaryAggregates.from_frame(df))
+
+    with _LOCK:
+        _MEMORY[_key(backend.path)] = aggs
+        _persist(backend.path, aggs)
+    return aggs
+
+
+@instrumented(rows=lambda aggs: aggs.rows)
+def aggregate_chunks(file_path=None, chunksize: int = 100_000) -> SummaryAggregates:
+    """
+    Compute aggregates by streaming the ledger in chunks (constant memory, not cached).
+
+    Args:
+        file_path (str | Path | None): Ledger path (defaults to the main data file).
+        chunksize (int): Rows per chunk.
+
+    Returns:
+        SummaryAggregates: Same totals and counts as the in-memory aggregates.
+    """
+    aggs = SummaryAggregates()
+    for chunk in iter_expenses(file_path, chunksize=chunksize):
+        aggs.merge(SummaryAggregates.from_frame(chunk))
+    return aggs
+
+
+def get_aggregates(file_path=None, chunksize: int | None = None) -> SummaryAggregates:
+    """
+    Return up-to-date aggregates for a ledger, rebuilding only if it changed out-of-band.
+
+    Args:
+        file_path (str | Path | None): Ledger path (defaults to the main data file).
+        chunksize (int | None): If given, stream the ledger with aggregate_chunks() instead.
+
+    Returns:
+        SummaryAggregates: Aggregates matching the current ledger contents.
+    """
+    if chunksize:
+        return aggregate_chunks(file_path, chunksize=chunksize)
+
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+    token = fingerprint_token(backend.fingerprint())
+
+    with _LOCK:
+        aggs = _current(backend.path, token)
+    return aggs if aggs is not None else rebuild_aggregates(backend.path)
+
+
+@instrumented()
+def get_analytics_bundle(file_path=None, chunksize: int | None = None) -> AnalyticsBundle:
+    """
+    Return the analytics bundle for a ledger, reused until the ledger changes.
+
+    Args:
+        file_path (str | Path | None): Ledger path (defaults to the main data file).
+        chunksize (int | None): If given, stream the ledger with aggregate_chunks() (not cached).
+
+    Returns:
+        AnalyticsBundle: Views matching the current ledger contents.
+    """
+    aggs = get_aggregates(file_path, chunksize=chunksize)
+    if chunksize:
+        return AnalyticsBundle(aggs)
+
+    key = _key(file_path)
+    with _LOCK:
+        bundle = _BUNDLES.get(key)
+        if bundle is None or bundle.fingerprint != aggs.fingerprint:
+            bundle = _BUNDLES[key] = AnalyticsBundle(aggs)
+    return bundle
+
+
+def record_append(file_path, entries, before: tuple, after: tuple) -> None:
+    """
+    Fold freshly appended entries into the aggregates in O(entries).
+
+    Called by data_manager.append_expenses() with the backend fingerprint taken
+    before and after the write. If the stored aggregates do not describe the
+    ledger as it was before the append, nothing is updated and the next read
+    rebuilds them.
+    """
+    with _LOCK:
+        aggs = _current(file_path, fingerprint_token(before))
+        if aggs is None:
+            return
+
+        normalized = [{str(k).strip().replace(" ", "_"): v for k, v in entry.items()} for entry in entries]
+        dates, _ = parse_dates([entry.get("Date") for entry in normalized], LOAD_DATE_FORMATS)
+        for entry, date in zip(normalized, dates):
+            aggs.add(date, entry.get("Category"), entry.get("Amount"))
+        aggs.fingerprint = fingerprint_token(after)
+        _MEMORY[_key(file_path)] = aggs
+        _persist(file_path, aggs)
+
+
+def record_edit(file_path, old: pd.DataFrame, new: pd.DataFrame, before: tuple, after: tuple) -> None:
+    """
+    Swap edited rows in the aggregates in O(changed rows).
+
+    Called by data_manager.edit_expenses() with the cleaned rows before the
+    edit (`old`) and the new versions of the updated ones (`new`; deleted
+    rows have none).
+    """
+    with _LOCK:
+        aggs = _current(file_path, fingerprint_token(before))
+        if aggs is None:
+            return
+
+        for date, category, amount in zip(old["Date"], old["Category"], old["Amount"]):
+            aggs.add(date, category, amount, sign=-1)
+        for date, category, amount in zip(new["Date"], new["Category"], new["Amount"]):
+            aggs.add(date, category, amount)
+        aggs.fingerprint = fingerprint_token(after)
+        _MEMORY[_key(file_path)] = aggs
+        _persist(file_path, aggs)
+
+
+def invalidate_aggregates(file_path=None) -> None:
+    """Forget in-memory aggregates for a ledger (the sidecar is re-validated on next read)."""
+    with _LOCK:
+        _MEMORY.pop(_key(file_path), None)
+        _BUNDLES.pop(_key(file_path), None)
@@ -0,0 +1,385 @@
+# src/api_server.py
+"""
+Module: api_server
+------------------
+Optional local HTTP/JSON API over the expense ledger (stdlib asyncio only).
+
+Lets scripts and other devices on the LAN add and query expenses through
+one long-running process that keeps the ledger parsed in memory, instead
+of each client starting Python and re-parsing the CSV.
+
+Endpoints:
+    GET  /health                      → {"status": "ok", "rows": N}
+    GET  /expenses?<filters>          → matching rows (query_engine filters, see below)
+    GET  /search?q=hello+steel        → Description search (search_index)
+    GET  /summary/monthly             → monthly_summary()
+    GET  /summary/category            → category_insight()
+    GET  /summary/yearly              → yearly_overview() + yearly_total_summary()
+    POST /expenses                    → add one expense  {"Date": ..., "Category": ..., "Amount": ...}
+    POST /expenses/bulk               → add many expenses [{...}, {...}]
+                                        (dates in any utils.parse_date() format, blank = today;
+                                         one invalid date or amount rejects the whole request)
+
+Query filters: category, categories, payment_modes (comma-separated),
+start, end, month, min_amount, max_amount, description, sort_by
+(comma-separated), descending (true/false, per key if comma-separated), limit.
+
+Concurrency:
+    - Reads run concurrently in worker threads against the shared in-memory
+      store (data_manager.expense_store), aggregates and search index.
+    - Writes are queued to a single writer task, so appends never interleave
+      and every client sees them in the order they were accepted.
+
+Usage:
+    python -m src.api_server [--host 127.0.0.1] [--port 8765] [--file data/Expenses.csv] [--token SECRET]
+
+Binds to localhost by default; use --host 0.0.0.0 (ideally with --token)
+to serve other devices on the LAN.
+"""
+
+import argparse
+import asyncio
+import hmac
+import json
+import math
+import sys
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 10_000_000
+MAX_HEADER_BYTES = 64_000
+
+STATUS_TEXT = {200: "OK", 201: "Created", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+               405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    """Error with an HTTP status, reported to the client as JSON."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def frame_to_records(df, with_id: bool = False) -> list[dict]:
+    """Convert a DataFrame to JSON-safe records (ISO dates, NaN → null)."""
+    import pandas as pd
+
+    if with_id:
+        df = df.rename_axis("id").reset_index()
+    df = df.copy()
+    for col in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = df[col].dt.strftime("%Y-%m-%d")
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+    return [{key: _json_value(value) for key, value in record.items()} for record in records]
+
+
+def _json_value(value):
+    if hasattr(value, "item"):  # numpy scalar
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _split(values: list[str] | None) -> list[str] | None:
+    if not values:
+        return None
+    parts = [part.strip() for value in values for part in value.split(",") if part.strip()]
+    return parts or None
+
+
+def _flag(text: str) -> bool:
+    return text.strip().lower() in ("1", "true", "yes", "desc")
+
+
+def parse_query_params(query: str) -> dict:
+    """
+    Translate a URL query string into query_engine.query_expenses() keywords.
+
+    Raises:
+        HTTPError: 400 for unknown parameters or malformed numbers.
+    """
+    params = parse_qs(query, keep_blank_values=False)
+    known = {"category", "categories", "payment_modes", "start", "end", "month", "min_amount", "max_amount",
+             "description", "sort_by", "descending", "limit"}
+    unknown = set(params) - known
+    if unknown:
+        raise HTTPError(400, f"Unknown query parameter(s): {', '.join(sorted(unknown))}")
+
+    first = {key: values[-1] for key, values in params.items()}
+    kwargs = {key: first[key] for key in ("start", "end", "month", "description") if key in first}
+    kwargs["categories"] = _split(params.get("categories", []) + params.get("category", []))
+    kwargs["payment_modes"] = _split(params.get("payment_modes"))
+    kwargs["sort_by"] = _split(params.get("sort_by"))
+
+    descending = _split(params.get("descending")) or []
+    kwargs["descending"] = [_flag(value) for value in descending] if len(descending) > 1 else \
+        bool(descending) and _flag(descending[0])
+    try:
+        for key in ("min_amount", "max_amount"):
+            if key in first:
+                kwargs[key] = float(first[key])
+        if "limit" in first:
+            kwargs["limit"] = int(first["limit"])
+    except ValueError as e:
+        raise HTTPError(400, f"Invalid number: {e}") from None
+    return kwargs
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🌐 Server
+# ----------------------------------------------------------------------------------------------------
+class ExpenseAPI:
+    """
+    Routes HTTP requests to the expense modules.
+
+    Args:
+        file_path (str | Path | None): Ledger path (defaults to the main data file).
+        token (str | None): If set, requests must send "Authorization: Bearer <token>".
+    """
+
+    def __init__(self, file_path: str | Path | None = None, token: str | None = None):
+        from src.data_manager import get_data_file
+
+        self.file_path = Path(file_path or get_data_file())
+        self.token = token
+        self._writes: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+
+    # ---- Lifecycle ----
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.base_events.Server:
+        """Warm the in-memory store, start the writer task and listen for connections."""
+        from src.data_manager import ensure_csv_exists, expense_store
+
+        ensure_csv_exists(self.file_path)
+        await asyncio.to_thread(expense_store.get, self.file_path, False)
+
+        self._writes = asyncio.Queue()
+        self._writer = asyncio.create_task(self._write_loop(), name="expense-writer")
+        return await asyncio.start_server(self._handle_connection, host, port, limit=MAX_HEADER_BYTES)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+
+    # ---- Single writer ----
+    async def _write_loop(self) -> None:
+        """Apply queued appends one at a time (the only code path that writes the ledger)."""
+        from src.add_expense import add_expenses_bulk
+
+        while True:
+            entries, done = await self._writes.get()
+            try:
+                # chunksize=len(entries): validate the whole request before writing any of it
+                added = await asyncio.to_thread(add_expenses_bulk, entries, self.file_path, max(len(entries), 1))
+                done.set_result(added)
+            except Exception as e:
+                done.set_exception(e)
+            finally:
+                self._writes.task_done()
+
+    async def submit(self, entries: list[dict]) -> int:
+        """Queue entries for the writer and wait until they are written."""
+        done = asyncio.get_running_loop().create_future()
+        await self._writes.put((entries, done))
+        return await done
+
+    # ---- Routing ----
+    async def route(self, method: str, target: str, body: bytes) -> tuple[int, object]:
+        """
+        Dispatch one request.
+
+        Returns:
+            tuple[int, object]: HTTP status and JSON-serializable payload.
+        """
+        from src import category_insight, monthly_summary, query_engine, search_index, yearly_overview
+        from src.data_manager import expense_store
+
+        url = urlsplit(target)
+        path = url.path.rstrip("/") or "/"
+        read = asyncio.to_thread  # reads run concurrently in worker threads
+
+        if path == "/expenses" and method == "POST":
+            entry = self._json_body(body)
+            if not isinstance(entry, dict):
+                raise HTTPError(400, "Expected a JSON object.")
+            return 201, {"added": await self.submit(self._with_iso_dates([entry]))}
+
+        if path == "/expenses/bulk" and method == "POST":
+            entries = self._json_body(body)
+            if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+                raise HTTPError(400, "Expected a JSON array of objects.")
+            return 201, {"added": await self.submit(self._with_iso_dates(entries)) if entries else 0}
+
+        if method != "GET":
+            raise HTTPError(405 if path in ("/expenses", "/expenses/bulk") else 404, f"{method} {path} not supported.")
+
+        if path == "/health":
+            df = await read(expense_store.get, self.file_path, False)
+            return 200, {"status": "ok", "rows": len(df)}
+        if path == "/expenses":
+            kwargs = parse_query_params(url.query)
+            df = await read(query_engine.query_expenses, self.file_path, **kwargs)
+            return 200, {"count": len(df), "expenses": frame_to_records(df, with_id=True)}
+        if path == "/search":
+            words = (parse_qs(url.query).get("q") or [""])[-1]
+            df = await read(search_index.search_expenses, words, self.file_path)
+            return 200, {"count": len(df), "expenses": frame_to_records(df, with_id=True)}
+        if path == "/summary/monthly":
+            return 200, frame_to_records(await read(monthly_summary.monthly_summary, self.file_path))
+        if path == "/summary/category":
+            return 200, frame_to_records(await read(category_insight.category_insight, self.file_path))
+        if path == "/summary/yearly":
+            overview = await read(yearly_overview.yearly_overview, self.file_path)
+            totals = await read(yearly_overview.yearly_total_summary, self.file_path, overview)
+            return 200, {"months": frame_to_records(overview), "years": frame_to_records(totals)}
+
+        raise HTTPError(404, f"No route for {path}.")
+
+    @staticmethod
+    def _with_iso_dates(entries: list[dict]) -> list[dict]:
+        """Normalize each entry's Date with utils.parse_date() (blank = today); 400 if any is invalid."""
+        from src.utils import parse_date
+
+        normalized = []
+        for position, entry in enumerate(entries):
+            value = entry.get("Date")
+            iso = parse_date("" if value is None else str(value))
+            if iso is None:
+                raise HTTPError(400, f"Invalid date {value!r} in entry {position}.")
+            normalized.append({**entry, "Date": iso})
+        return normalized
+
+    @staticmethod
+    def _json_body(body: bytes):
+        try:
+            return json.loads(body.decode("utf-8") or "null")
+        except (UnicodeDecodeError, ValueError) as e:
+            raise HTTPError(400, f"Invalid JSON body: {e}") from None
+
+    # ---- HTTP/1.1 plumbing ----
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 413, {"error": "Headers too large."}, keep_alive=False)
+                    return
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Malformed request line."}, keep_alive=False)
+                    return
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        key, value = line.split(":", 1)
+                        headers[key.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                length = headers.get("content-length", "0") or "0"
+                if not length.isdigit():  # also rejects negative lengths
+                    await self._respond(writer, 400, {"error": "Invalid Content-Length."}, keep_alive=False)
+                    return
+                length = int(length)
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "Body too large."}, keep_alive=False)
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self._dispatch(method.upper(), target, headers, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            return
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, target: str, headers: dict, body: bytes) -> tuple[int, object]:
+        if self.token and not hmac.compare_digest(headers.get("authorization", "").encode("latin-1"),
+                                                  f"Bearer {self.token}".encode("utf-8")):
+            return 401, {"error": "Missing or invalid token."}
+        try:
+            return await self.route(method, target, body)
+        except HTTPError as e:
+            return e.status, {"error": str(e)}
+        except (ValueError, TypeError) as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            print(f"⚠️ API error on {method} {target}: {e}")
+            return 500, {"error": "Internal server error."}
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+async def serve(file_path: str | Path | None = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                token: str | None = None) -> None:
+    """
+    Run the API until cancelled (Ctrl+C).
+
+    Args:
+        file_path (str | Path | None): Ledger path (defaults to the main data file).
+        host (str): Interface to bind (0.0.0.0 for the whole LAN).
+        port (int): TCP port.
+        token (str | None): Optional bearer token required on every request.
+    """
+    api = ExpenseAPI(file_path, token=token)
+    server = await api.start(host, port)
+    addresses = ", ".join(f"{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+    print(f"🌐 Expense API serving {api.file_path} on http://{addresses}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await api.close()
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧪 Standalone Execution
+# ----------------------------------------------------------------------------------------------------
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the Smart Expense Tracker ledger as a JSON API.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="interface to bind (0.0.0.0 for the LAN)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port")
+    parser.add_argument("--file", type=Path, help="ledger path (defaults to config.DATA_FILE)")
+    parser.add_argument("--token", help="require 'Authorization: Bearer <token>' on every request")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.file, args.host, args.port, args.token))
+    except KeyboardInterrupt:
+        print("\n👋 Expense API stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
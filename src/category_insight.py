@@ -15,48 +15,43 @@ Compatible with both CLI execution and pytest-based modular testing.
 import pandas as pd
 from pathlib import Path
 from tabulate import tabulate
-from src.data_manager import ensure_csv_exists
+from src.aggregates import get_analytics_bundle
+from src.instrumentation import instrumented
 from src.config import DATA_FILE
 
 
 # ------------------------------------------------------------------------
 # 🧠 PURE FUNCTION (Used in testing & backend)
 # ------------------------------------------------------------------------
-def category_insight(file_path: str | Path = DATA_FILE) -> pd.DataFrame:
+@instrumented()
+def category_insight(file_path: str | Path = DATA_FILE, chunksize: int | None = None) -> pd.DataFrame:
     """
     Generate insights on spending by category: total & average per category.
 
+    Rows are counted as loaded by the shared expense store, so a row whose Date
+    cannot be parsed (see date_parser.parse_dates()) is left out of Entries and
+    Total Spent, like in every other summary. Rows without a category are
+    left out as well.
+
     Args:
         file_path (str | Path): Path to the expense CSV file.
+        chunksize (int | None): Stream the file in chunks of this many rows (constant memory).
 
     Returns:
         pd.DataFrame: DataFrame with columns ['Category', 'Entries', 'Total Spent', 'Average Spent'].
                       Returns empty DataFrame if no valid expense data is found.
     """
-    file_path = Path(file_path)
-    ensure_csv_exists()
-
-    df = pd.read_csv(file_path)
+    # (total, entries) per category from the shared analytics bundle, rows without category excluded
+    stats = get_analytics_bundle(Path(file_path), chunksize=chunksize).category_stats
 
-    # Handle empty or missing columns
-    if df.empty or "Category" not in df.columns or "Amount" not in df.columns:
+    # Handle empty file
+    if not stats:
         return pd.DataFrame(columns=["Category", "Entries", "Total Spent", "Average Spent"])
-    
 
-    # Convert Amount Safely
-    df["Amount"] =  pd.to_numeric(df["Amount"], errors="coerce").fillna(0)
-
-    # Drop rows without category
-    df = df.dropna(subset=["Category"])
-    if df.empty:
-        return pd.DataFrame(columns=["Category", "Entries", "Total Spent", "Average Spent"])
-    
-    # Group and aggregate
-    insight_df = (
-        df.groupby("Category", as_index=False)["Amount"]
-        .agg(["sum", "mean", "count"])
-        .reset_index()
-        .rename(columns={"sum": "Total Spent", "mean": "Average Spent", "count": "Entries"})
+    # Build per-category totals and averages
+    insight_df = pd.DataFrame(
+        [(category, count, total, total / count) for category, (total, count) in stats.items()],
+        columns=["Category", "Entries", "Total Spent", "Average Spent"],
     )
 
 
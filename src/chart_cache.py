@@ -0,0 +1,156 @@
+# src/chart_cache.py
+"""
+Module: chart_cache
+-------------------
+Content-addressed cache for rendered chart PNGs.
+
+A chart is identified by (chart name, parameters, data fingerprint, style
+configuration). When the same key was rendered before, the stored PNG is
+copied into /Visuals/ instead of re-rendering. Entries live in
+config.CHART_CACHE_DIR (Visuals/.cache/) and are evicted when older than
+config.CHART_CACHE_MAX_AGE_DAYS or when the cache grows past
+config.CHART_CACHE_MAX_BYTES (least recently used first).
+
+Used by the visualization module's plot_* functions (not in test mode).
+"""
+
+import hashlib
+import os
+import shutil
+import time
+import pandas as pd
+from pathlib import Path
+
+
+CHART_CACHE_VERSION = 1
+
+# Rendering code whose changes must invalidate every cached chart
+_RENDER_SOURCES = ("visualization.py", "label_layout.py")
+_SOURCE_DIGEST: str | None = None
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def _cache_dir() -> Path:
+    from src import config  # dynamic import keeps CHART_CACHE_DIR patchable
+
+    return Path(config.CHART_CACHE_DIR)
+
+
+def _source_digest() -> str:
+    global _SOURCE_DIGEST
+    if _SOURCE_DIGEST is None:
+        hasher = hashlib.sha256()
+        for name in _RENDER_SOURCES:
+            hasher.update((Path(__file__).parent / name).read_bytes())
+        _SOURCE_DIGEST = hasher.hexdigest()
+    return _SOURCE_DIGEST
+
+
+def _entries() -> list[os.DirEntry]:
+    try:
+        return [entry for entry in os.scandir(_cache_dir()) if entry.name.endswith(".png")]
+    except OSError:
+        return []
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+def data_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Hash the contents of a prepared chart DataFrame (row order included, index ignored).
+
+    Args:
+        df (pd.DataFrame): Data the chart is rendered from.
+
+    Returns:
+        str: Hex digest.
+    """
+    hasher = hashlib.sha256(",".join(map(str, df.columns)).encode("utf-8"))
+    hasher.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return hasher.hexdigest()
+
+
+def chart_key(chart_name: str, data_digest: str, **params) -> str:
+    """
+    Build the cache key for a chart.
+
+    Args:
+        chart_name (str): Chart identifier.
+        data_digest (str): data_fingerprint() of the chart's data.
+        **params: Any rendering parameters that change the output.
+
+    Returns:
+        str: Hex digest used as the cache file name.
+    """
+    from src import config
+
+    style = (config.COLOR_PALETTE, config.DEFAULT_CURRENCY, config.APP_NAME, config.VERSION)
+    parts = (CHART_CACHE_VERSION, chart_name, sorted(params.items()), data_digest, style, _source_digest())
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def lookup(key: str) -> Path | None:
+    """Return the cached PNG for a key (marking it recently used), or None."""
+    path = _cache_dir() / f"{key}.png"
+    try:
+        os.utime(path)
+    except OSError:
+        return None
+    return path
+
+
+def store(key: str, png_path: str | Path) -> None:
+    """Copy a freshly saved chart into the cache, then apply eviction (best effort)."""
+    cache_dir = _cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_dir / f"{key}.tmp"
+        shutil.copyfile(png_path, tmp_path)
+        os.replace(tmp_path, cache_dir / f"{key}.png")
+    except OSError as e:
+        print(f"⚠️ Could not cache chart: {e}")
+        return
+    evict()
+
+
+def evict(max_bytes: int | None = None, max_age_days: float | None = None) -> int:
+    """
+    Remove expired entries, then least recently used ones until under the size budget.
+
+    Args:
+        max_bytes (int | None): Size budget (defaults to config.CHART_CACHE_MAX_BYTES).
+        max_age_days (float | None): Age limit (defaults to config.CHART_CACHE_MAX_AGE_DAYS).
+
+    Returns:
+        int: Number of entries removed.
+    """
+    from src import config
+
+    max_bytes = config.CHART_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    max_age_days = config.CHART_CACHE_MAX_AGE_DAYS if max_age_days is None else max_age_days
+    cutoff = time.time() - max_age_days * 86400
+
+    entries = sorted(((e.stat().st_mtime, e.stat().st_size, e.path) for e in _entries()), reverse=True)
+    kept_bytes, removed = 0, 0
+    for mtime, size, path in entries:
+        if mtime < cutoff or kept_bytes + size > max_bytes:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        else:
+            kept_bytes += size
+    return removed
+
+
+def clear() -> None:
+    """Delete every cached chart."""
+    for entry in _entries():
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
@@ -12,6 +12,7 @@ Future exxpansions:
     - Environment variables integration for production.
 """
 
+import os
 from pathlib import Path
 
 
@@ -23,14 +24,45 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 
 
 # Define the data directory and default expense file
+# (use a .db / .sqlite path to store the ledger in SQLite instead of CSV;
+#  EXPENSE_TRACKER_DATA_FILE overrides the path, e.g. for a throwaway ledger in tests)
 DATA_DIR = ROOT_DIR / "data"
-DATA_FILE = DATA_DIR / "Expenses.csv"
+DATA_FILE = Path(os.environ.get("EXPENSE_TRACKER_DATA_FILE") or DATA_DIR / "Expenses.csv")
 LOGS_DIR = ROOT_DIR / "logs"
 VISUALS_DIR = ROOT_DIR / "Visuals"
+CACHE_DIR = LOGS_DIR / "cache"
 
-# Ensure directories exist
-for folder in [DATA_DIR, LOGS_DIR, VISUALS_DIR]:
-    folder.mkdir(parents=True, exist_ok=True)
+# Directories are created on first use (see ensure_directories()) to keep imports cheap
+
+
+# ----------------------------------------------------------------------------------------------------
+# Cache Configuration
+# ----------------------------------------------------------------------------------------------------
+# Ledgers at least this large (bytes) are loaded through a persisted parsed snapshot
+SNAPSHOT_MIN_BYTES = 1_000_000
+
+# Ledgers with at least this many rows persist their summary aggregates sidecar
+AGGREGATES_MIN_ROWS = 10_000
+
+# Ledgers with at least this many rows persist their Description search index
+SEARCH_INDEX_MIN_ROWS = 10_000
+
+# Rendered chart cache (content-addressed PNGs), evicted by total size and age
+CHART_CACHE_DIR = VISUALS_DIR / ".cache"
+CHART_CACHE_MAX_BYTES = 50_000_000
+CHART_CACHE_MAX_AGE_DAYS = 30
+
+
+# ----------------------------------------------------------------------------------------------------
+# Write Safety Configuration
+# ----------------------------------------------------------------------------------------------------
+# fsync the write-ahead log and ledger on every append / rewrite (durable across power loss)
+WAL_FSYNC = True
+
+# Log-structured (*.lsm) ledgers: flush the append log into a segment at this size,
+# and merge segments in the background once there are this many
+LSM_FLUSH_BYTES = 4_000_000
+LSM_MAX_SEGMENTS = 4
 
 
 # ----------------------------------------------------------------------------------------------------
@@ -81,9 +113,14 @@ def get_currently_symbol(code: str) -> str:
     return SUPPORTED_CURRENCIES.get(code.upper(), DEFAULT_CURRENCY)
 
 
+def ensure_directories() -> None:
+    """Create the data, logs and visuals directories if they do not exist yet."""
+    for folder in [DATA_FILE.parent, LOGS_DIR, VISUALS_DIR]:
+        folder.mkdir(parents=True, exist_ok=True)
+
+
 # ----------------------------------------------------------------------------------------------------
 # Test Mode Configuration
 # ----------------------------------------------------------------------------------------------------
 TEST_MODE = False
 TEST_VISUALS_DIR = LOGS_DIR / "Visuals"
-TEST_VISUALS_DIR.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
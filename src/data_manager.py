@@ -7,17 +7,37 @@ This module ensures:
     - A consistent data directory and file path.
     - Automatic CSV creation with correct headers.
     - Safe loading/saving operations for both CLI and GUI use.
+    - A shared in-process cache (ExpenseStore) so the ledger is parsed once per change.
+    - Pluggable storage backends chosen from the ledger path
+      (flat CSV by default, SQLite for *.db / *.sqlite files,
+      month-partitioned CSVs for *.parts directories, segments plus an
+      append log for *.lsm directories).
+    - Multi-process-safe writes: appends are serialized by an advisory
+      ledger lock and journaled, rewrites are atomic (see write_ahead_log).
+    - A compact, explicitly typed fast-path loader (load_expenses_compact).
 """
 
 import csv
+import io
+import json
+import os
+import threading
 import pandas as pd
+from contextlib import contextmanager
 from pathlib import Path
 from src.config import DATA_FILE
+from src.date_parser import LOAD_DATE_FORMATS, parse_dates
+from src.instrumentation import instrumented
+from src.write_ahead_log import atomic_write, journaled_append, ledger_lock, needs_recovery, recover, recover_if_needed
 
 
 # -------------------- Global Constants --------------------
 DEFAULT_HEADERS = ["Date", "Category", "Description", "Amount", "Payment_Mode"]
 
+# Header cache for the append path: resolved path -> (file stat key, header columns).
+# Validated once per file and refreshed after every write made through this module.
+_HEADER_CACHE: dict[str, tuple[tuple, list[str]]] = {}
+
 
 # -------------------- File Handling --------------------
 def get_data_file() -> Path:
@@ -35,53 +55,480 @@ def get_data_file() -> Path:
 def ensure_csv_exists(file_path: Path | None = None) -> None:
     """
     Ensure the data CSV exists and has the proper headers.
-    If not, it will be created automatically.
+    If not, it will be created automatically (SQLite ledgers get their schema).
 
     Args:
-        file_path (Path | None): Optional custom CSV path.
+        file_path (Path | None): Optional custom ledger path.
     """
-    file_path = Path(file_path or get_data_file())
+    get_backend(file_path).ensure_exists()
 
-    if not file_path.exists() or file_path.stat().st_size == 0:
-        with file_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(DEFAULT_HEADERS)
-        print(f"✅ Created new data file: {file_path}")
 
+# -------------------- Data Cleaning --------------------
+# Free-text columns are always read as strings so every chunk of a file parses alike
+TEXT_DTYPES = {"Category": str, "Description": str, "Payment_Mode": str}
 
-# -------------------- Data Loading --------------------
-def load_expenses(file_path: Path | None = None) -> pd.DataFrame:
+
+# Rows rejected for their date during the current load_expenses() call (per thread)
+_LOAD_REJECTS = threading.local()
+
+
+def _collect_rejected_dates(stats: dict) -> None:
+    """Remember rows the cleaner dropped for their date, if a load is collecting them."""
+    pending = getattr(_LOAD_REJECTS, "rows", None)
+    if pending is not None and stats["rows_rejected"]:
+        pending.append(stats["rejected"])
+
+
+@contextmanager
+def _reporting_rejected_dates():
+    """Collect date rejects from every cleaned chunk of one load and warn about them once."""
+    if getattr(_LOAD_REJECTS, "rows", None) is not None:  # nested load: the outer one reports
+        yield
+        return
+
+    _LOAD_REJECTS.rows = []
+    try:
+        yield
+        rejected = pd.concat(_LOAD_REJECTS.rows) if _LOAD_REJECTS.rows else None
+    finally:
+        _LOAD_REJECTS.rows = None
+
+    if rejected is not None:
+        sample = ", ".join(f"row {row}: {value!r}" for row, value in rejected.head(3).items())
+        more = " ..." if len(rejected) > 3 else ""
+        print(f"⚠️ Skipped {len(rejected)} row(s) with an unrecognised date ({sample}{more})")
+
+
+@instrumented()
+def clean_expenses(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Load expense data into a DataFrame with validated columns and types.
+    Validate columns and cast types of a raw expense DataFrame.
+
+    Missing columns are added, Date/Amount are cast, and rows without a valid
+    date are dropped. Dates are parsed with date_parser.parse_dates(), so rows
+    in any utils.parse_date() format (e.g. DD/MM/YYYY from older exports) are
+    kept. Rows no format accepts are dropped and reported once per
+    load_expenses() / load_expenses_compact() call; chunked scans
+    (iter_expenses()) drop them without a warning. The index (raw row number)
+    is preserved.
+
+    Args:
+        df (pd.DataFrame): Frame as read from CSV.
+
+    Returns:
+        pd.DataFrame: Cleaned frame with DEFAULT_HEADERS columns.
+    """
+    # Ensure all expected columns exist
+    for col in DEFAULT_HEADERS:
+        if col not in df.columns:
+            df[col] = None
+
+    # Test Casting
+    if not pd.api.types.is_datetime64_any_dtype(df["Date"]):
+        df["Date"], date_stats = parse_dates(df["Date"], LOAD_DATE_FORMATS)
+        _collect_rejected_dates(date_stats)
+    df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0)
+
+    # Drop invalid rows (no data or amount)
+    df = df.dropna(subset=["Date"])
+    return df[DEFAULT_HEADERS]
+
+
+# -------------------- Compact Loading --------------------
+# Low-cardinality text columns become pandas categoricals (one code per row)
+COMPACT_DTYPES = {"Category": "category", "Description": str, "Payment_Mode": "category"}
+
+
+def compact_expenses(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast an expense frame to compact, explicit dtypes.
+
+    Same rules as clean_expenses() (missing columns added, Amount defaults to 0,
+    undated rows dropped) but Category / Payment_Mode are stored as categoricals.
+    Group by them with observed=True.
+
+    Args:
+        df (pd.DataFrame): Raw or cleaned expense frame.
+
+    Returns:
+        pd.DataFrame: Frame with DEFAULT_HEADERS columns.
+    """
+    for col in DEFAULT_HEADERS:
+        if col not in df.columns:
+            df[col] = None
+
+    if not pd.api.types.is_datetime64_any_dtype(df["Date"]):
+        df["Date"], date_stats = parse_dates(df["Date"], LOAD_DATE_FORMATS)
+        _collect_rejected_dates(date_stats)
+    df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0).astype("float64")
+
+    df = df.dropna(subset=["Date"])[DEFAULT_HEADERS]
+    return df.astype({"Category": "category", "Payment_Mode": "category"})
+
+
+def memory_footprint(df: pd.DataFrame) -> dict[str, float]:
+    """
+    Report the deep memory use of a frame in MB, per column plus "Total".
+
+    Args:
+        df (pd.DataFrame): Any DataFrame.
+
+    Returns:
+        dict[str, float]: Column name → MB, with the overall size under "Total".
+    """
+    usage = df.memory_usage(deep=True) / (1024 * 1024)
+    footprint = {str(col): float(mb) for col, mb in usage.items() if col != "Index"}
+    footprint["Total"] = float(usage.sum())
+    return footprint
+
+
+# -------------------- CSV Helpers --------------------
+def _stat_key(file_path: Path) -> tuple:
+    """Cheap identity of a file's current state (inode, size, mtime)."""
+    st = file_path.stat()
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def get_csv_header(file_path: Path | None = None) -> list[str]:
+    """
+    Return the column order of the CSV header, reading only the first line.
+
+    The result is cached per file and reused for as long as the file has
+    not been changed by anything other than this module's own appends.
 
     Args:
         file_path (Path | None): Optional custom CSV path.
 
     Returns:
-        pd.DataFrame: Expense DataFrame (empty if not found or invalid).
+        list[str]: Header columns in file order.
     """
     file_path = Path(file_path or get_data_file())
     ensure_csv_exists(file_path)
 
+    cache_key = str(file_path.resolve())
+    stat_key = _stat_key(file_path)
+    cached = _HEADER_CACHE.get(cache_key)
+    if cached and cached[0] == stat_key:
+        return cached[1]
+
+    with file_path.open("r", newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    header = [col.strip() for col in header] or list(DEFAULT_HEADERS)
+
+    _HEADER_CACHE[cache_key] = (stat_key, header)
+    return header
+
+
+def _entry_to_row(entry: dict, header: list[str]) -> list:
+    """Order an entry's values by the file header ('Payment Mode' matches 'Payment_Mode')."""
+    normalized = {str(k).strip().replace(" ", "_"): v for k, v in entry.items()}
+    return ["" if normalized.get(col) is None else normalized.get(col) for col in header]
+
+
+def filter_expenses(df: pd.DataFrame, category: str | None = None, month: str | None = None) -> pd.DataFrame:
+    """
+    Apply the standard category / month-prefix filters to a loaded frame.
+
+    Args:
+        df (pd.DataFrame): Cleaned expense DataFrame.
+        category (str | None): Case-insensitive category name.
+        month (str | None): Date prefix, e.g. "2025-10".
+
+    Returns:
+        pd.DataFrame: Matching rows.
+    """
+    from src.query_engine import apply_query  # lazy: query_engine imports this module's helpers
+
+    return apply_query(df, category=category, month=month)
+
+
+# -------------------- Storage Backends --------------------
+class CSVBackend:
+    """
+    Flat CSV ledger (the default backend).
+
+    Every backend exposes the same small interface used by this module:
+    ensure_exists(), fingerprint(), load(), iter_chunks(chunksize), save(df),
+    append(entries) and query(**query). Editable backends add fetch(row_ids)
+    and edit(updates, deletes).
+
+    query() accepts the keywords of query_engine.query_expenses(): filters
+    (categories, payment_modes, start/end, min/max amount, description,
+    month and the legacy single category) plus sort_by, descending and limit.
+
+    Row ids are the data-row numbers of the file. Edits are not written into
+    the CSV (that would mean a full rewrite); they are appended as put / del
+    records to a `<ledger>.edits.jsonl` sidecar and applied on load. A full
+    rewrite (save) folds them in and renumbers the rows.
+    """
+
+    name = "csv"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.edits_path = self.path.with_name(self.path.name + ".edits.jsonl")
+
+    def _recover(self) -> None:
+        recover_if_needed(self.path)
+        if needs_recovery(self.edits_path):
+            with ledger_lock(self.path):  # edits are journaled under the ledger's lock
+                recover(self.edits_path)
+
+    def _edit_layer(self) -> dict | None:
+        """Parsed edits sidecar (None when there are no edits)."""
+        from src.log_structured_backend import build_layer
+
+        try:
+            data = self.edits_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        data = data[:data.rfind(b"\n") + 1]
+        if not data:
+            return None
+        return build_layer(json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip())
+
+    def _apply_edits(self, df: pd.DataFrame, layer: dict | None) -> pd.DataFrame:
+        from src.log_structured_backend import apply_layer
+
+        return df if layer is None else apply_layer(df, layer)
+
+    def ensure_exists(self) -> None:
+        if self.path.exists() and self.path.stat().st_size > 0:
+            self._recover()
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with ledger_lock(self.path):
+            if self.path.exists() and self.path.stat().st_size > 0:
+                return  # another process created it first
+            atomic_write(self.path, lambda tmp: tmp.write_text(",".join(DEFAULT_HEADERS) + "\n", encoding="utf-8"))
+        print(f"✅ Created new data file: {self.path}")
+
+    def fingerprint(self) -> tuple:
+        try:
+            edits = self.edits_path.stat()
+        except FileNotFoundError:
+            return _stat_key(self.path)
+        return _stat_key(self.path) + ((edits.st_ino, edits.st_size, edits.st_mtime_ns),)
+
+    def load(self) -> pd.DataFrame:
+        from src import config  # dynamic import keeps the threshold patchable
+
+        self._recover()
+        with ledger_lock(self.path, shared=True):  # never parse a half-written append
+            if self.path.stat().st_size >= config.SNAPSHOT_MIN_BYTES:
+                from src.snapshot_cache import load_with_snapshot
+                df = load_with_snapshot(self.path)
+            else:
+                df = clean_expenses(pd.read_csv(self.path, dtype=TEXT_DTYPES))
+            return self._apply_edits(df, self._edit_layer())
+
+    def iter_chunks(self, chunksize: int):
+        # Same guarantees as load(): the shared lock is held until the last chunk is read,
+        # so writers wait (and this thread must not write the ledger while iterating)
+        self._recover()
+        with ledger_lock(self.path, shared=True):
+            layer = self._edit_layer()
+            with pd.read_csv(self.path, dtype=TEXT_DTYPES, chunksize=chunksize) as reader:
+                for chunk in reader:
+                    yield self._apply_edits(clean_expenses(chunk), layer)
+
+    def save(self, df: pd.DataFrame) -> None:
+        # Write a temporary file and rename it over the ledger: a crash leaves the old or the new file
+        try:
+            with ledger_lock(self.path):
+                atomic_write(self.path, lambda tmp: df.to_csv(tmp, index=False, encoding="utf-8"))
+                self.edits_path.unlink(missing_ok=True)  # folded into the rewrite
+        finally:
+            _HEADER_CACHE.pop(str(self.path.resolve()), None)
+
+    def append(self, entries) -> int:
+        with ledger_lock(self.path):
+            header = get_csv_header(self.path)
+
+            # Make sure the new rows start on their own line
+            with self.path.open("rb") as raw:
+                size = raw.seek(0, os.SEEK_END)
+                if size:
+                    raw.seek(-1, os.SEEK_END)
+                needs_newline = bool(size) and raw.read(1) not in (b"\n", b"\r")
+
+            buffer = io.StringIO()
+            if needs_newline:
+                buffer.write("\n")
+            writer = csv.writer(buffer, lineterminator="\n")
+            written = 0
+            for entry in entries:
+                writer.writerow(_entry_to_row(entry, header))
+                written += 1
+
+            # One journaled write: the rows land completely or not at all
+            journaled_append(self.path, buffer.getvalue().encode("utf-8"))
+            _HEADER_CACHE[str(self.path.resolve())] = (_stat_key(self.path), header)
+        return written
+
+    def query(self, **query) -> pd.DataFrame:
+        from src.query_engine import apply_query
+
+        # Filter the cached frame in place; only the (usually small) result is copied
+        return apply_query(expense_store.get(self.path, copy=False), **query).copy()
+
+    def fetch(self, row_ids) -> pd.DataFrame:
+        df = expense_store.get(self.path, copy=False)
+        return df.loc[df.index.intersection(row_ids)]
+
+    def edit(self, updates: dict, deletes) -> None:
+        from src.log_structured_backend import normalize_record
+
+        records = [{"op": "put", "id": int(row_id), **normalize_record(entry)} for row_id, entry in updates.items()]
+        records += [{"op": "del", "id": int(row_id)} for row_id in deletes]
+        payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with ledger_lock(self.path):
+            if not self.edits_path.exists():
+                self.edits_path.touch()
+            journaled_append(self.edits_path, payload.encode("utf-8"))
+
+
+# File suffixes served by the SQLite backend (see src/sqlite_backend.py)
+SQLITE_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+
+# Directory suffix for the month-partitioned layout (see src/partitioned_backend.py)
+PARTITIONED_SUFFIX = ".parts"
+
+# Directory suffix for the log-structured layout (see src/log_structured_backend.py)
+LOG_STRUCTURED_SUFFIX = ".lsm"
+
+
+def get_backend(file_path: Path | None = None):
+    """
+    Return the storage backend for a ledger path.
+
+    Args:
+        file_path (Path | None): Ledger path (defaults to config.DATA_FILE).
+
+    Returns:
+        CSVBackend | SQLiteBackend | PartitionedBackend | LogStructuredBackend: Backend bound to the path.
+    """
+    file_path = Path(file_path or get_data_file())
+    if file_path.suffix.lower() in SQLITE_SUFFIXES:
+        from src.sqlite_backend import SQLiteBackend
+        return SQLiteBackend(file_path)
+    if file_path.suffix.lower() == LOG_STRUCTURED_SUFFIX:
+        from src.log_structured_backend import LogStructuredBackend
+        return LogStructuredBackend(file_path)
+    if file_path.suffix.lower() == PARTITIONED_SUFFIX or file_path.is_dir():
+        from src.partitioned_backend import PartitionedBackend
+        return PartitionedBackend(file_path)
+    return CSVBackend(file_path)
+
+
+def iter_expense_frames(file_path: Path | None = None):
+    """
+    Yield the cleaned ledger one partition at a time.
+
+    Partitioned ledgers yield one frame per month (each cached separately);
+    single-file backends yield the whole ledger once.
+
+    Args:
+        file_path (Path | None): Optional custom ledger path.
+
+    Yields:
+        pd.DataFrame: Cleaned expense frames.
+    """
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+    if hasattr(backend, "iter_partitions"):
+        for _, df in backend.iter_partitions():
+            yield df
+    else:
+        yield expense_store.get(backend.path)
+
+
+# -------------------- Data Loading --------------------
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def iter_expenses(file_path: Path | None = None, chunksize: int = DEFAULT_CHUNKSIZE):
+    """
+    Stream the ledger as cleaned DataFrame chunks (constant memory).
+
+    Bypasses the in-memory store and snapshot so arbitrarily large archives
+    can be scanned without materializing them.
+
+    Args:
+        file_path (Path | None): Optional custom ledger path.
+        chunksize (int): Maximum rows per chunk.
+
+    Yields:
+        pd.DataFrame: Cleaned chunks with DEFAULT_HEADERS columns.
+    """
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+    yield from backend.iter_chunks(chunksize)
+
+
+@instrumented()
+def load_expenses_compact(file_path: Path | None = None, report: bool = False) -> pd.DataFrame:
+    """
+    Fast-path loader with dtypes declared up front (see compact_expenses()).
+
+    Reads CSV ledgers directly with categorical Category / Payment_Mode (under
+    the shared ledger lock, with the edits sidecar applied, like
+    CSVBackend.load()) and dates in any utils.parse_date() format; other
+    backends are loaded normally, then compacted.
+    The result is independent of the shared expense_store, so callers may
+    keep it as long-lived working data.
+
+    Args:
+        file_path (Path | None): Optional custom ledger path.
+        report (bool): Print the memory footprint after loading.
+
+    Returns:
+        pd.DataFrame: Compact expense DataFrame (empty if not found or invalid).
+    """
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+
     try:
-        df = pd.read_csv(file_path)
+        with _reporting_rejected_dates():
+            if isinstance(backend, CSVBackend):
+                backend._recover()
+                with ledger_lock(backend.path, shared=True):
+                    df = compact_expenses(pd.read_csv(backend.path, dtype=COMPACT_DTYPES))
+                    layer = backend._edit_layer()
+                if layer is not None:
+                    df = compact_expenses(backend._apply_edits(df, layer))  # edited rows arrive uncompacted
+            else:
+                df = compact_expenses(backend.load())
+    except Exception as e:
+        print(f"⚠️ Error loading expenses: {e}")
+        return compact_expenses(pd.DataFrame(columns=DEFAULT_HEADERS))
 
+    if report:
+        print(f"💾 {len(df)} rows in {memory_footprint(df)['Total']:.2f} MB")
+    return df
 
-        # Ensure all expected columns exist
-        for col in DEFAULT_HEADERS:
-            if col not in df.columns:
-                df[col] = None
 
-        
-        # Test Casting
-        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-        df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0)
+@instrumented()
+def load_expenses(file_path: Path | None = None) -> pd.DataFrame:
+    """
+    Load expense data into a DataFrame with validated columns and types.
 
+    Large CSV ledgers (>= config.SNAPSHOT_MIN_BYTES) are served from a persisted
+    parsed snapshot, parsing only rows appended since it was written.
 
-        # Drop invalid rows (no data or amount)
-        df = df.dropna(subset=["Date"])
-        return df[DEFAULT_HEADERS]
-    
+    Args:
+        file_path (Path | None): Optional custom ledger path.
+
+    Returns:
+        pd.DataFrame: Expense DataFrame (empty if not found or invalid).
+    """
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+
+    try:
+        with _reporting_rejected_dates():
+            return backend.load()
     except Exception as e:
         print(f"⚠️ Error loading expenses: {e}")
         return pd.DataFrame(columns=DEFAULT_HEADERS)
@@ -90,41 +537,253 @@ def load_expenses(file_path: Path | None = None) -> pd.DataFrame:
 # -------------------- Data Saving --------------------
 def save_expenses(df: pd.DataFrame, file_path: Path | None = None) -> None:
     """
-    Save expenses DataFrame safely to CSV.
+    Save expenses DataFrame safely to the ledger.
+
+    CSV ledgers are rewritten through a temporary file renamed over the
+    original, under the ledger lock, so readers and concurrent appenders
+    never see a truncated file.
 
     Args:
         df (pd.DataFrame): Data to save.
         file_path (Path | None): Optional custom path.
     """
-    file_path = Path(file_path or get_data_file())
-    ensure_csv_exists(file_path)
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+
+    from src.aggregates import invalidate_aggregates
+    from src.search_index import invalidate_search_index
 
     try:
-        df.to_csv(file_path, index=False, encoding="utf-8")
+        with ledger_lock(backend.path):
+            backend.save(df)
     except Exception as e:
         print(f"⚠️ Error saving expenses: {e}")
+    finally:
+        expense_store.invalidate(backend.path)
+        invalidate_aggregates(backend.path)
+        invalidate_search_index(backend.path)
 
 
 # -------------------- Data Appending --------------------
+@instrumented(rows=lambda written: written)
+def append_expenses(entries, file_path: Path | None = None) -> int:
+    """
+    Append expense records to the ledger without reading the existing rows.
+
+    For CSV only the header is inspected (and cached), so the cost depends on
+    the number of new rows, not on the size of the ledger. SQLite inserts run
+    in a single transaction. The summary aggregates and the Description
+    search index are updated in place.
+
+    The ledger lock is held from the "before" fingerprint to the "after" one,
+    so concurrent writers (threads or processes) never lose each other's rows
+    and the in-place updates always describe exactly this append.
+
+    Args:
+        entries (Iterable[dict]): Expense records keyed by column name.
+        file_path (Path | None): Optional custom ledger path.
+
+    Returns:
+        int: Number of rows written.
+    """
+    from src import aggregates, search_index
+
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+    entries = list(entries)
+
+    with ledger_lock(backend.path):
+        before = backend.fingerprint()
+        try:
+            written = backend.append(entries)
+        finally:
+            expense_store.invalidate(backend.path)
+
+        # Keep the summary aggregates and search index current without a rescan
+        after = backend.fingerprint()
+        aggregates.record_append(backend.path, entries, before, after)
+        search_index.record_append(backend.path, before, after)
+    return written
+
+
 def append_expense(entry: dict, file_path: Path | None = None) -> None:
     """
-    Append a new single expense record to the CSV file.
+    Append a new single expense record to the ledger.
 
     Args:
         entry (dict): A dictionary containing the expense record.
-        file_path (Path | None): Optional custom CSV path.
+        file_path (Path | None): Optional custom ledger path.
     """
-    file_path = Path(file_path or get_data_file())
-    ensure_csv_exists(file_path)
-
     try:
-        df = load_expenses(file_path)
-        df = pd.concat([df, pd.DataFrame([entry])], ignore_index=True)
-        save_expenses(df, file_path)
+        append_expenses([entry], file_path)
     except Exception as e:
         print(f"⚠️ Error appending new expenses: {e}")
 
 
+# -------------------- Editing --------------------
+@instrumented(rows=lambda changed: changed)
+def edit_expenses(updates: dict | None = None, deletes=None, file_path: Path | None = None) -> int:
+    """
+    Replace and/or delete expense rows by their stable row id (the frame index).
+
+    Only the change is written: an indexed UPDATE / DELETE for SQLite, put /
+    del records in a log for CSV and log-structured ledgers. The in-memory
+    store, summary aggregates and search index are patched with the old and
+    new rows instead of being rebuilt.
+
+    Args:
+        updates (dict | None): Row id → complete replacement entry.
+        deletes (Iterable[int] | None): Row ids to delete.
+        file_path (Path | None): Optional custom ledger path.
+
+    Returns:
+        int: Number of rows changed.
+
+    Raises:
+        ValueError: If the ledger does not support editing or an id does not exist.
+    """
+    from src import aggregates, search_index
+    from src.log_structured_backend import build_layer
+
+    updates = {int(row_id): entry for row_id, entry in (updates or {}).items()}
+    deletes = sorted({int(row_id) for row_id in (deletes or [])})
+    if set(updates) & set(deletes):
+        raise ValueError("A row cannot be both updated and deleted.")
+    row_ids = sorted(updates) + deletes
+    if not row_ids:
+        return 0
+
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+    if not hasattr(backend, "edit"):
+        raise ValueError(f"Editing rows is not supported for {backend.name} ledgers.")
+
+    with ledger_lock(backend.path):
+        before = backend.fingerprint()
+        old = backend.fetch(row_ids)
+        missing = sorted(set(row_ids) - set(old.index))
+        if missing:
+            raise ValueError(f"No expense with id {', '.join(map(str, missing))}.")
+
+        try:
+            backend.edit(updates, deletes)
+        except Exception:
+            expense_store.invalidate(backend.path)
+            raise
+        after = backend.fingerprint()
+
+        # New versions cleaned exactly as a load would clean them
+        new = build_layer([{"op": "put", "id": row_id, **entry} for row_id, entry in updates.items()])["rows"]
+        expense_store.apply_edit(backend.path, before, after, row_ids, new)
+        aggregates.record_edit(backend.path, old, new, before, after)
+        search_index.record_edit(backend.path, old, new, before, after)
+    return len(row_ids)
+
+
+# -------------------- Export --------------------
+def export_expenses_csv(dest: str | Path, file_path: Path | None = None) -> int:
+    """
+    Export a ledger (any backend) to a plain CSV file.
+
+    Args:
+        dest (str | Path): Output CSV path.
+        file_path (Path | None): Ledger to export (defaults to the main data file).
+
+    Returns:
+        int: Number of rows exported.
+    """
+    df = expense_store.get(file_path)
+    df = df.assign(Date=df["Date"].dt.strftime("%Y-%m-%d"))
+    df.to_csv(dest, index=False, encoding="utf-8")
+    return len(df)
+
+
+# -------------------- Shared In-Memory Store --------------------
+class ExpenseStore:
+    """
+    In-process cache of parsed, typed expense DataFrames.
+
+    Each ledger is parsed once and kept in memory together with the backend
+    fingerprint (e.g. device, inode, size, mtime) it was parsed from. The cached
+    frame is reused until the fingerprint changes or a write made through
+    this module invalidates it, so a menu session parses the ledger once
+    rather than once per screen.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[tuple, pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    @staticmethod
+    def _key(file_path: Path | None) -> Path:
+        return Path(file_path or get_data_file()).resolve()
+
+    @instrumented("data_manager.expense_store.get")
+    def get(self, file_path: Path | None = None, copy: bool = True) -> pd.DataFrame:
+        """
+        Return the parsed expenses for a ledger, re-reading only if it changed.
+
+        Args:
+            file_path (Path | None): Optional custom ledger path.
+            copy (bool): Return a copy (safe to modify). Read-only callers
+                may pass False to share the cached frame.
+
+        Returns:
+            pd.DataFrame: The cached DataFrame (a copy by default).
+        """
+        path = self._key(file_path)
+        backend = get_backend(path)
+        backend.ensure_exists()
+        fingerprint = backend.fingerprint()
+
+        with self._lock:
+            cached = self._entries.get(str(path))
+            if cached and cached[0] == fingerprint:
+                return cached[1].copy() if copy else cached[1]
+
+        df = load_expenses(path)
+        with self._lock:
+            self._entries[str(path)] = (fingerprint, df)
+            self.loads += 1
+        return df.copy() if copy else df
+
+    def apply_edit(self, file_path, before: tuple, after: tuple, row_ids, rows: pd.DataFrame) -> None:
+        """
+        Patch the cached frame after edit_expenses() instead of re-reading the ledger.
+
+        Args:
+            file_path (Path | None): Ledger path.
+            before, after (tuple): Backend fingerprints around the edit.
+            row_ids (Iterable[int]): Ids that were replaced or deleted.
+            rows (pd.DataFrame): Cleaned new versions of the replaced rows (indexed by id).
+        """
+        key = str(self._key(file_path))
+        with self._lock:
+            cached = self._entries.pop(key, None)
+            if cached is None or cached[0] != before:
+                return
+            df = cached[1]
+            df = df[~df.index.isin(list(row_ids))]
+            if len(rows):
+                df = pd.concat([df, rows[df.columns]]).sort_index(kind="stable")
+            self._entries[key] = (after, df)
+
+    def invalidate(self, file_path: Path | None = None) -> None:
+        """Drop the cached frame for a ledger (called after every app write)."""
+        with self._lock:
+            self._entries.pop(str(self._key(file_path)), None)
+
+    def clear(self) -> None:
+        """Drop all cached frames."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared store used by the analytics, view and chart modules
+expense_store = ExpenseStore()
+
+
 # -------------------- CLI Diagnostic --------------------
 if __name__ == "__main__":
     ensure_csv_exists()
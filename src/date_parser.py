@@ -0,0 +1,115 @@
+# src/date_parser.py
+"""
+Module: date_parser
+-------------------
+Vectorized parsing of whole Date columns in any of the utils.DATE_FORMATS.
+
+utils.parse_date() tries each format with strptime, one value at a time.
+For imports and ledger loads the same rules are applied to a whole Series:
+
+    1. Distinct values are parsed once (dates repeat heavily in a ledger).
+    2. They are taken in blocks of first appearance, so rows from one export
+       (e.g. an older DD/MM/YYYY file) are parsed together.
+    3. Each block tries the format that matched most rows in the previous
+       block first, then parses the remaining values with the next format,
+       one vectorized pd.to_datetime() call per format group.
+
+The formats never match the same text differently, so the order only affects
+speed. Rows no format accepts are returned with the parse statistics instead
+of being dropped silently.
+"""
+
+import time
+from datetime import date
+import numpy as np
+import pandas as pd
+from src.utils import DATE_FORMATS
+
+
+# Distinct values per format-detection block
+DATE_BLOCK_ROWS = 10_000
+
+# Stored ledgers may also hold full timestamps (e.g. "2025-10-01 09:30:00")
+LOAD_DATE_FORMATS = (*DATE_FORMATS, "ISO8601")
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helper: Parse Distinct Values
+# ----------------------------------------------------------------------------------------------------
+def _parse_distinct(text: pd.Series, formats, block_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Parse stripped distinct values block by block; returns (datetime64 values, format index or -1)."""
+    parsed = np.full(len(text), np.datetime64("NaT"), dtype="datetime64[ns]")
+    matched = np.full(len(text), -1, dtype=np.int16)
+    order = list(range(len(formats)))
+
+    for start in range(0, len(text), block_size):
+        block = text.iloc[start:start + block_size]
+        pending = (block != "").to_numpy()
+        hits = {}
+        for i in order:
+            if not pending.any():
+                break
+            positions = np.flatnonzero(pending)
+            result = pd.to_datetime(block.iloc[positions], format=formats[i], errors="coerce")
+            ok = result.notna().to_numpy()
+            if not ok.any():
+                continue
+            found = positions[ok]
+            parsed[start + found] = result.to_numpy(dtype="datetime64[ns]")[ok]
+            matched[start + found] = i
+            pending[found] = False
+            hits[i] = len(found)
+        order.sort(key=lambda i: -hits.get(i, 0))  # detected format of this block goes first next time
+
+    return parsed, matched
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+def parse_dates(values, formats=DATE_FORMATS, blank_as_today: bool = False,
+                block_size: int = DATE_BLOCK_ROWS) -> tuple[pd.Series, dict]:
+    """
+    Parse a column of date text with the same rules as utils.parse_date().
+
+    Args:
+        values (pd.Series | Iterable): Raw Date values (text, NaN/None for missing).
+        formats (tuple[str]): strptime formats tried per block (pandas "ISO8601" allowed).
+        blank_as_today (bool): Give blank values today's date, like parse_date() (else NaT).
+        block_size (int): Distinct values per format-detection block.
+
+    Returns:
+        tuple[pd.Series, dict]:
+            - datetime64 Series with the input's index (NaT where unparsable).
+            - Statistics with keys 'rows', 'parsed', 'blank', 'rows_rejected',
+              'formats' (format → rows parsed with it), 'rejected' (Series of the
+              raw rejected values, original index) and 'seconds'.
+    """
+    start = time.perf_counter()
+    values = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+
+    codes, uniques = pd.factorize(values)
+    text = pd.Series(np.asarray(uniques, dtype=object)).astype(str).str.strip()
+    parsed, matched = _parse_distinct(text, formats, max(1, block_size))
+
+    # Spread distinct results back to rows (code -1 = missing value → last slot)
+    codes = np.where(codes < 0, len(text), codes)
+    dates = pd.Series(np.append(parsed, np.datetime64("NaT"))[codes], index=values.index, name=values.name)
+    matched = np.append(matched, -1)[codes]
+    blank = np.append((text == "").to_numpy(), True)[codes]
+
+    if blank_as_today and blank.any():
+        dates[blank] = pd.Timestamp(date.today())
+
+    rejected = (matched < 0) & ~blank
+    counts = np.bincount(matched[matched >= 0], minlength=len(formats))
+    stats = {
+        "rows": len(values),
+        "parsed": int((matched >= 0).sum()),
+        "blank": int(blank.sum()),
+        "rows_rejected": int(rejected.sum()),
+        "formats": {fmt: int(n) for fmt, n in zip(formats, counts) if n},
+        "rejected": values[rejected],
+        "seconds": time.perf_counter() - start,
+    }
+    return dates, stats
@@ -0,0 +1,206 @@
+# src/diagnostics.py
+"""
+Module: diagnostics
+-------------------
+Start-up self-check ("BIOS" diagnostics) that never blocks the menu.
+
+How it works:
+    - A fingerprint is built from every source file under src/ and tests/,
+      the ledger schema (storage backend and columns) and this machine's
+      interpreter and checkout path, so a state file copied from another
+      checkout never matches.
+    - If it matches the last passing run recorded in logs/, nothing runs.
+    - Otherwise the pytest suite runs in a background process while the
+      menu stays usable; its output goes to logs/test_report_<timestamp>.txt
+      and a passing run records the fingerprint for the next launch.
+
+Only the standard library is imported here so launch latency does not
+depend on pandas, matplotlib or the size of the test suite.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import threading
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT_DIR / "src"
+TESTS_DIR = ROOT_DIR / "tests"
+STATE_FILE_NAME = "diagnostics_state.json"
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def _state_file() -> Path:
+    from src import config  # dynamic import keeps LOGS_DIR patchable
+
+    return Path(config.LOGS_DIR) / STATE_FILE_NAME
+
+
+def ledger_schema(data_file: str | Path) -> str:
+    """
+    Describe the ledger's storage layout and columns without loading it.
+
+    Args:
+        data_file (str | Path): Ledger path.
+
+    Returns:
+        str: e.g. "csv:Date,Category,Description,Amount,Payment_Mode".
+    """
+    path = Path(data_file)
+    if not path.exists():
+        return "missing"
+
+    if path.is_dir() and path.suffix.lower() == ".lsm":
+        try:
+            with (path / "manifest.json").open("r", encoding="utf-8") as f:
+                return f"log-structured:v{json.load(f).get('version')}"
+        except (OSError, ValueError):
+            return "log-structured:unknown"
+
+    if path.is_dir():
+        try:
+            with (path / "manifest.json").open("r", encoding="utf-8") as f:
+                return f"partitioned:v{json.load(f).get('version')}"
+        except (OSError, ValueError):
+            return "partitioned:unknown"
+
+    if path.suffix.lower() in {".db", ".sqlite", ".sqlite3"}:
+        try:
+            with closing(sqlite3.connect(path)) as conn:
+                columns = [row[1] for row in conn.execute("PRAGMA table_info(expenses)")]
+        except sqlite3.Error:
+            return "sqlite:unknown"
+        return "sqlite:" + ",".join(columns)
+
+    with path.open("r", newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    return "csv:" + ",".join(col.strip() for col in header)
+
+
+def diagnostics_fingerprint(data_file: str | Path | None = None, src_dir: str | Path = SRC_DIR,
+                            tests_dir: str | Path = TESTS_DIR) -> str:
+    """
+    Hash the application and test sources, the ledger schema and the local environment.
+
+    Args:
+        data_file (str | Path | None): Ledger path (defaults to config.DATA_FILE).
+        src_dir (str | Path): Source tree to hash.
+        tests_dir (str | Path): Test tree to hash.
+
+    Returns:
+        str: Hex digest that changes whenever code, tests, schema, interpreter or machine change.
+    """
+    from src import config
+
+    hasher = hashlib.sha256()
+    for tree in (Path(src_dir), Path(tests_dir)):
+        for source in sorted(tree.rglob("*.py")):
+            hasher.update(f"{tree.name}/{source.relative_to(tree).as_posix()}".encode("utf-8") + b"\0")
+            hasher.update(source.read_bytes() + b"\0")
+    hasher.update(ledger_schema(data_file or config.DATA_FILE).encode("utf-8") + b"\0")
+    # Per-machine state: another checkout or interpreter must run the suite itself
+    hasher.update(f"{platform.node()}|{sys.executable}|{sys.version}|{ROOT_DIR}".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def read_state() -> dict:
+    """Return the last recorded passing run ({} if none)."""
+    try:
+        with _state_file().open("r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def record_pass(fingerprint: str, report: str | Path | None = None) -> None:
+    """Record a passing run so unchanged launches can skip diagnostics."""
+    state_file = _state_file()
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_file.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump({"fingerprint": fingerprint, "passed_at": datetime.now().isoformat(timespec="seconds"),
+                   "report": str(report) if report else None}, f, indent=2)
+    os.replace(tmp_path, state_file)
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+def start_diagnostics(force: bool = False, data_file: str | Path | None = None) -> threading.Thread | None:
+    """
+    Launch the test suite in a background process unless the last passing run still applies.
+
+    Args:
+        force (bool): Run even if the fingerprint matches the last passing run.
+        data_file (str | Path | None): Ledger path (defaults to config.DATA_FILE).
+
+    Returns:
+        threading.Thread | None: Daemon thread reporting the result, or None if skipped.
+    """
+    from src import config
+
+    fingerprint = diagnostics_fingerprint(data_file)
+    state = read_state()
+    if not force and state.get("fingerprint") == fingerprint:
+        print(f"✅ Diagnostics up to date (last passed {state.get('passed_at', 'earlier')}).")
+        return None
+
+    logs_dir = Path(config.LOGS_DIR)
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    report = logs_dir / f"test_report_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt"
+
+    log = report.open("w", encoding="utf-8")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.diagnostics", fingerprint, str(report)],
+        cwd=ROOT_DIR, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+    )
+    log.close()
+    print("🩺 Diagnostics running in the background...")
+
+    def _report():
+        if process.wait() == 0:
+            print(f"\n✅ Background diagnostics passed (report: {report})")
+        else:
+            print(f"\n⚠️ Background diagnostics failed. Check the log file for details: {report}")
+
+    watcher = threading.Thread(target=_report, name="diagnostics", daemon=True)
+    watcher.start()
+    return watcher
+
+
+def run_diagnostics(fingerprint: str, report: str | Path | None = None) -> int:
+    """
+    Run the pytest suite in test mode and record the fingerprint if it passes.
+
+    Executed inside the background process started by start_diagnostics().
+
+    Returns:
+        int: pytest exit code.
+    """
+    import pytest
+    from src import config
+
+    config.TEST_MODE = True
+    result = int(pytest.main(["-q", "tests", "--tb=short"]))
+    if result == 0:
+        record_pass(fingerprint, report)
+    return result
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧪 Background Process Entry Point
+# ----------------------------------------------------------------------------------------------------
+if __name__ == "__main__":
+    sys.exit(run_diagnostics(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None))
@@ -0,0 +1,193 @@
+#src/edit_expense.py
+"""
+Module: edit_expense.py
+-----------------------
+Corrects or removes existing expenses by their stable row ID.
+
+Row IDs are the index of the loaded ledger (shown in the ID column of the
+View screen): CSV data-row numbers, SQLite primary keys, log-structured row
+ids. They are assigned at insert and never reused.
+
+Structure:
+    1. get_expense()    → Look up one expense by ID.
+    2. update_expense() → Change some fields of an expense (pure, testable).
+    3. delete_expense() → Remove an expense (pure, testable).
+    4. edit_expense_interactive() → CLI wrapper for interactive use.
+
+Edits are recorded as patches / tombstones (see data_manager.edit_expenses()),
+so a correction does not reload or rewrite the ledger.
+"""
+
+import pandas as pd
+from src.add_expense import _build_entry
+from src.data_manager import edit_expenses, ensure_csv_exists, get_backend
+from src.utils import parse_date
+
+
+# -------------------------------------------------------------------------------------------------
+# 🧩 Internal Helper
+# -------------------------------------------------------------------------------------------------
+def _row_to_entry(row: pd.Series) -> dict:
+    """Turn a loaded ledger row back into an entry dict."""
+    return {
+        "Date": row["Date"].strftime("%Y-%m-%d"),
+        "Category": None if pd.isna(row["Category"]) else row["Category"],
+        "Description": None if pd.isna(row["Description"]) else row["Description"],
+        "Amount": float(row["Amount"]),
+        "Payment Mode": None if pd.isna(row["Payment_Mode"]) else row["Payment_Mode"],
+    }
+
+
+# -------------------------------------------------------------------------------------------------
+# 🧠 PURE FUNCTIONS (Used in unit tests and backend operations)
+# -------------------------------------------------------------------------------------------------
+def get_expense(row_id, file_path=None) -> dict:
+    """
+    Return one expense by its row ID.
+
+    Parameters:
+        row_id (int): Stable row ID.
+        file_path (Path or str, optional): Custom ledger path for testing.
+
+    Returns:
+        dict: The expense entry.
+
+    Raises:
+        ValueError: If no expense has this ID.
+    """
+    backend = get_backend(file_path)
+    if not hasattr(backend, "fetch"):
+        raise ValueError(f"Editing rows is not supported for {backend.name} ledgers.")
+    found = backend.fetch([int(row_id)])
+    if found.empty:
+        raise ValueError(f"No expense with id {row_id}.")
+    return _row_to_entry(found.iloc[0])
+
+
+def update_expense(row_id, date=None, category=None, description=None, amount=None, payment_mode=None,
+                   file_path=None) -> dict:
+    """
+    Change one or more fields of an existing expense (fields left as None are kept).
+
+    Parameters:
+        row_id (int): Stable row ID.
+        date, category, description, amount, payment_mode: New values.
+        file_path (Path or str, optional): Custom ledger path for testing.
+
+    Returns:
+        dict: The updated expense entry.
+
+    Raises:
+        ValueError: If the ID does not exist or a new value is invalid.
+    """
+    current = get_expense(row_id, file_path)
+    if date is not None and not isinstance(date, str):
+        date = date.strftime("%Y-%m-%d")
+    if date is not None and not parse_date(date):
+        raise ValueError(f"Invalid date: {date}")
+
+    entry = _build_entry(
+        current["Date"] if date is None else date,
+        current["Category"] if category is None else category,
+        current["Description"] if description is None else description,
+        current["Amount"] if amount is None else amount,
+        current["Payment Mode"] if payment_mode is None else payment_mode,
+    )
+    edit_expenses(updates={int(row_id): entry}, file_path=file_path)
+    return entry
+
+
+def delete_expense(row_id, file_path=None) -> dict:
+    """
+    Delete an expense by its row ID.
+
+    Parameters:
+        row_id (int): Stable row ID.
+        file_path (Path or str, optional): Custom ledger path for testing.
+
+    Returns:
+        dict: The deleted expense entry.
+
+    Raises:
+        ValueError: If no expense has this ID.
+    """
+    entry = get_expense(row_id, file_path)
+    edit_expenses(deletes=[int(row_id)], file_path=file_path)
+    return entry
+
+
+# -------------------------------------------------------------------------------------------------
+# 💬 INTERACTIVE WRAPPER (Used in CLI - main.py)
+# -------------------------------------------------------------------------------------------------
+def _describe(row_id, entry: dict) -> str:
+    return (f"#{row_id} {entry['Date']} | {entry['Category']} | {entry['Description'] or '-'} | "
+            f"₹{entry['Amount']:.2f} | {entry['Payment Mode'] or '-'}")
+
+
+def edit_expense_interactive():
+    """
+    CLI-based interactive function for correcting or deleting an expense.
+    IDs are shown in the ID column of the View / Filter Expenses screen.
+    """
+    try:
+        ensure_csv_exists()
+
+        print("\n=== Edit / Delete Expense ===")
+        print("1. Edit an Expense")
+        print("2. Delete an Expense")
+        print("3. Return to Main Menu")
+        choice = input("Choose an option (1-3): ").strip()
+        if choice not in ("1", "2"):
+            return
+
+        try:
+            row_id = int(input("Enter the expense ID (see View Expenses): ").strip())
+        except ValueError:
+            print("⚠️ Invalid ID. Please enter a number.")
+            return
+        try:
+            entry = get_expense(row_id)
+        except ValueError as e:
+            print(f"⚠️ {e}")
+            return
+        print(f"📄 {_describe(row_id, entry)}")
+
+        if choice == "2":
+            if input("Delete this expense? (Y/N): ").strip().lower() == "y":
+                delete_expense(row_id)
+                print(f"🗑️ Expense #{row_id} deleted.")
+            return
+
+        # ----- Edit: blank keeps the current value -----
+        print("Press Enter to keep the current value.")
+        date_input = input(f"Date [{entry['Date']}]: ").strip()
+        category = input(f"Category [{entry['Category']}]: ").strip()
+        description = input(f"Description [{entry['Description'] or ''}]: ").strip()
+        amount_input = input(f"Amount [{entry['Amount']:.2f}]: ").strip()
+        payment_mode = input(f"Payment mode [{entry['Payment Mode'] or ''}]: ").strip()
+
+        try:
+            updated = update_expense(
+                row_id,
+                date=parse_date(date_input) or date_input if date_input else None,
+                category=category or None,
+                description=description or None,
+                amount=float(amount_input) if amount_input else None,
+                payment_mode=payment_mode or None,
+            )
+        except ValueError as e:
+            print(f"⚠️ {e} Expense not changed.")
+            return
+        print(f"✅ Expense updated: {_describe(row_id, updated)}")
+
+    except KeyboardInterrupt:
+        print("\n❌ Operation cancelled by user.")
+    except Exception as e:
+        print(f"❌ Error editing expense: {e}")
+
+
+# -------------------------------------------------------------------------------------------------
+# 🧪 Standalone Testing
+# -------------------------------------------------------------------------------------------------
+if __name__ == "__main__":
+    edit_expense_interactive()
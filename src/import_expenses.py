@@ -0,0 +1,183 @@
+# src/import_expenses.py
+"""
+Module: import_expenses
+-----------------------
+Streams an external CSV (e.g. a bank export) into the expense ledger.
+
+Structure:
+    1. import_expenses_csv()          → Core logic (pure/testable)
+    2. import_expenses_interactive()  → CLI wrapper (used in main.py)
+
+The source file is read and written in chunks, so files of any size are
+imported with bounded memory and without rewriting the ledger. Each chunk is
+validated column-wise: dates with date_parser.parse_dates() (mixed formats,
+e.g. DD/MM/YYYY rows from older exports, are detected per block) and amounts
+with one numeric conversion.
+
+Usage:
+    python -m src.import_expenses path/to/export.csv
+"""
+
+import csv
+import sys
+import time
+import pandas as pd
+from pathlib import Path
+from src.data_manager import DEFAULT_HEADERS, append_expenses, ensure_csv_exists, get_data_file
+from src.date_parser import parse_dates
+
+
+# Maximum number of rejected rows kept for reporting
+MAX_REJECTED_SAMPLES = 10
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helper: Column Mapping
+# ----------------------------------------------------------------------------------------------------
+def _map_columns(fieldnames) -> dict:
+    """Map source header names to ledger columns (case/space insensitive)."""
+    lookup = {col.lower(): col for col in DEFAULT_HEADERS}
+    sources = {}
+    for name in fieldnames or []:
+        key = name.strip().replace(" ", "_").lower()
+        if key in lookup:
+            sources[lookup[key]] = name  # the last matching column wins
+    return {name: col for col, name in sources.items()}
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helper: Chunk Validation
+# ----------------------------------------------------------------------------------------------------
+def _text(chunk: pd.DataFrame, col: str) -> pd.Series:
+    if col not in chunk.columns:
+        return pd.Series("", index=chunk.index)
+    return chunk[col].fillna("").str.strip()
+
+
+def _validate_chunk(chunk: pd.DataFrame) -> tuple[list[dict], pd.Series, dict]:
+    """
+    Validate one chunk of source rows (ledger column names) in bulk.
+
+    Returns:
+        tuple: (entries normalized like add_expense._build_entry(),
+                rejection reason per invalid row (source index),
+                date parse statistics).
+    """
+    date_text, amount_text = _text(chunk, "Date"), _text(chunk, "Amount")
+    dates, date_stats = parse_dates(date_text, blank_as_today=True)
+    amounts = pd.to_numeric(amount_text.str.replace(",", "", regex=False), errors="coerce")
+
+    bad_date = dates.isna()
+    bad_amount = ~bad_date & ~(amounts > 0)
+    reasons = pd.concat([
+        "invalid date " + date_text[bad_date].map(repr),
+        "invalid amount " + amount_text[bad_amount].map(repr),
+    ]).sort_index()
+
+    valid = ~(bad_date | bad_amount)
+    entries = pd.DataFrame({
+        "Date": dates[valid].dt.strftime("%Y-%m-%d"),
+        "Category": _text(chunk, "Category")[valid].replace("", "Uncategorized"),
+        "Description": _text(chunk, "Description")[valid],
+        "Amount": amounts[valid].astype(float),
+        "Payment Mode": _text(chunk, "Payment_Mode")[valid].replace("", "Cash"),
+    })
+    return entries.to_dict("records"), reasons, date_stats
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PURE FUNCTION (Testable Core)
+# ----------------------------------------------------------------------------------------------------
+def import_expenses_csv(source: str | Path, file_path: str | Path | None = None, chunksize: int = 5000) -> dict:
+    """
+    Import expenses from an external CSV into the ledger.
+
+    Rows are validated with the same rules as manual entry: the date must be
+    accepted by utils.parse_date() (checked for a whole chunk at once with
+    date_parser.parse_dates()) and the amount must be a number greater than 0.
+    Invalid rows are skipped and reported.
+
+    Args:
+        source (str | Path): CSV file to import (needs at least Date and Amount columns).
+        file_path (str | Path | None): Ledger to import into (defaults to the main data file).
+        chunksize (int): Number of rows validated and written per chunk.
+
+    Returns:
+        dict: Import statistics with keys 'rows_read', 'rows_imported', 'rows_rejected',
+              'rejected' (sample of (line, reason) tuples), 'date_formats' (format → rows),
+              'seconds' and 'rows_per_sec'.
+
+    Raises:
+        ValueError: If the source file has no Date or Amount column.
+    """
+    source = Path(source)
+    stats = {"rows_read": 0, "rows_imported": 0, "rows_rejected": 0, "rejected": [], "date_formats": {}}
+
+    start = time.perf_counter()
+    with source.open("r", newline="", encoding="utf-8-sig") as f:
+        mapping = _map_columns(next(csv.reader(f), None))
+    if not {"Date", "Amount"}.issubset(mapping.values()):
+        raise ValueError(f"Source file must contain 'Date' and 'Amount' columns: {source}")
+
+    file_path = Path(file_path or get_data_file())
+    ensure_csv_exists(file_path)
+
+    reader = pd.read_csv(source, usecols=list(mapping), dtype=str, keep_default_na=False,
+                         encoding="utf-8-sig", chunksize=max(1, chunksize))
+    for chunk in reader:
+        entries, reasons, date_stats = _validate_chunk(chunk.rename(columns=mapping))
+
+        stats["rows_read"] += len(chunk)
+        stats["rows_rejected"] += len(reasons)
+        for index, reason in reasons.iloc[:MAX_REJECTED_SAMPLES - len(stats["rejected"])].items():
+            stats["rejected"].append((index + 2, reason))  # + header line, 1-based
+        for fmt, rows in date_stats["formats"].items():
+            stats["date_formats"][fmt] = stats["date_formats"].get(fmt, 0) + rows
+
+        if entries:
+            stats["rows_imported"] += append_expenses(entries, file_path)
+
+    elapsed = time.perf_counter() - start
+    stats["seconds"] = elapsed
+    stats["rows_per_sec"] = stats["rows_imported"] / elapsed if elapsed > 0 else 0.0
+    return stats
+
+
+# ----------------------------------------------------------------------------------------------------
+# 💬 CLI WRAPPER (Used in main.py)
+# ----------------------------------------------------------------------------------------------------
+def import_expenses_interactive(source: str | Path | None = None):
+    """
+    Interactive CLI import of an external CSV file.
+    Prints a short report with throughput and rejected rows.
+    """
+    try:
+        if source is None:
+            source = input("Enter path of the CSV file to import: ").strip().strip('"')
+        if not source or not Path(source).exists():
+            print("⚠️ File not found. Nothing imported.")
+            return
+
+        print(f"\n📥 Importing expenses from {source} ...")
+        stats = import_expenses_csv(source)
+
+        print(f"✅ Imported {stats['rows_imported']} of {stats['rows_read']} rows "
+              f"in {stats['seconds']:.2f}s ({stats['rows_per_sec']:,.0f} rows/sec)")
+        if len(stats["date_formats"]) > 1:
+            print("🗓️ Date formats: " + ", ".join(f"{fmt} ({rows})" for fmt, rows in stats["date_formats"].items()))
+        if stats["rows_rejected"]:
+            print(f"⚠️ Skipped {stats['rows_rejected']} invalid rows:")
+            for line_no, reason in stats["rejected"]:
+                print(f"   • line {line_no}: {reason}")
+
+    except KeyboardInterrupt:
+        print("\n❌ Import cancelled by user.")
+    except Exception as e:
+        print(f"❌ Error importing expenses: {e}")
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧪 Standalone Execution
+# ----------------------------------------------------------------------------------------------------
+if __name__ == "__main__":
+    import_expenses_interactive(sys.argv[1] if len(sys.argv) > 1 else None)
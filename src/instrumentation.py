@@ -0,0 +1,212 @@
+# src/instrumentation.py
+"""
+Module: instrumentation
+-----------------------
+Lightweight timing of the application's hot paths.
+
+Entry points in data_manager, aggregates, the summary modules, the query
+engine and visualization are wrapped with @instrumented (or a `timed()`
+block), which records per name:
+    - calls, total / max latency
+    - rows processed (when the wrapped code reports them)
+
+Recording costs two perf_counter() calls and a dict update, so it is always
+on. The table is shown in the "Testing & Debugging" menu; launching with
+`python src/main.py --profile` additionally runs cProfile for the whole
+session and writes both reports to logs/ on exit.
+
+Only the standard library is imported here so start-up latency is not affected.
+"""
+
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+
+_STATS: dict[str, list] = {}   # name → [calls, total_seconds, max_seconds, rows]
+_LOCK = threading.Lock()
+_PROFILER = None
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Recording
+# ----------------------------------------------------------------------------------------------------
+def record(name: str, seconds: float, rows: int = 0) -> None:
+    """Add one call to the statistics for `name`."""
+    with _LOCK:
+        stats = _STATS.get(name)
+        if stats is None:
+            _STATS[name] = [1, seconds, seconds, rows]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+            stats[3] += rows
+
+
+def _result_rows(result) -> int:
+    """Rows in a DataFrame-like result (0 for anything else)."""
+    shape = getattr(result, "shape", None)
+    return int(shape[0]) if shape else 0
+
+
+def instrumented(name: str | None = None, rows=None):
+    """
+    Decorator recording the latency of every call.
+
+    Args:
+        name (str | None): Statistic name (default: "<module>.<qualname>").
+        rows (Callable | None): Maps the return value to rows processed
+            (default: row count of a returned DataFrame).
+    """
+    def decorator(func):
+        label = name or f"{func.__module__.removeprefix('src.')}.{func.__qualname__}"
+        count_rows = rows or _result_rows
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            processed = 0
+            try:
+                result = func(*args, **kwargs)
+                try:
+                    processed = count_rows(result) or 0
+                except Exception:
+                    processed = 0
+                return result
+            finally:
+                record(label, time.perf_counter() - start, processed)  # failed calls are timed too
+
+        return wrapper
+    return decorator
+
+
+class _Span:
+    rows = 0
+
+
+@contextmanager
+def timed(name: str):
+    """
+    Context manager recording the latency of a block.
+
+    Usage:
+        with timed("aggregates.rebuild") as span:
+            ...
+            span.rows = len(df)
+    """
+    span = _Span()
+    start = time.perf_counter()
+    try:
+        yield span
+    finally:
+        record(name, time.perf_counter() - start, span.rows)
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+def snapshot() -> list[dict]:
+    """
+    Return the recorded statistics, slowest total first.
+
+    Returns:
+        list[dict]: name, calls, total_ms, mean_ms, max_ms, rows.
+    """
+    with _LOCK:
+        items = [(name, list(stats)) for name, stats in _STATS.items()]
+    report = [
+        {"name": name, "calls": calls, "total_ms": total * 1000, "mean_ms": total * 1000 / calls,
+         "max_ms": slowest * 1000, "rows": rows}
+        for name, (calls, total, slowest, rows) in items
+    ]
+    return sorted(report, key=lambda item: item["total_ms"], reverse=True)
+
+
+def reset() -> None:
+    """Forget all recorded statistics."""
+    with _LOCK:
+        _STATS.clear()
+
+
+def format_report(limit: int | None = 20) -> str:
+    """Render the statistics as a fixed-width table."""
+    items = snapshot()[:limit]
+    if not items:
+        return "No instrumented calls recorded yet."
+    width = max(len("Operation"), *(len(item["name"]) for item in items))
+    lines = [f"{'Operation':<{width}}  {'Calls':>7}  {'Total ms':>10}  {'Mean ms':>9}  {'Max ms':>9}  {'Rows':>11}"]
+    lines.append("-" * len(lines[0]))
+    for item in items:
+        lines.append(f"{item['name']:<{width}}  {item['calls']:>7}  {item['total_ms']:>10.1f}  "
+                     f"{item['mean_ms']:>9.2f}  {item['max_ms']:>9.1f}  {item['rows']:>11,}")
+    return "\n".join(lines)
+
+
+def write_json_report(path: str | Path | None = None) -> Path:
+    """
+    Write the statistics as JSON (default: logs/timings_<timestamp>.json).
+
+    Returns:
+        Path: The written report.
+    """
+    from src import config  # dynamic import keeps LOGS_DIR patchable
+
+    path = Path(path or Path(config.LOGS_DIR) / f"timings_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump({"created": datetime.now().isoformat(timespec="seconds"), "operations": snapshot()}, f, indent=2)
+    return path
+
+
+def start_profiling() -> None:
+    """Start a session-wide cProfile run (used by `main.py --profile`)."""
+    import cProfile
+
+    global _PROFILER
+    if _PROFILER is None:
+        _PROFILER = cProfile.Profile()
+        _PROFILER.enable()
+
+
+def profiling_active() -> bool:
+    return _PROFILER is not None
+
+
+def stop_profiling(logs_dir: str | Path | None = None) -> list[Path]:
+    """
+    Stop cProfile and write the reports to logs/.
+
+    Writes profile_<timestamp>.prof (for snakeviz / pstats), a text summary
+    of the top functions by cumulative time, and the JSON timing report.
+
+    Returns:
+        list[Path]: Files written (empty if profiling was not running).
+    """
+    import io
+    import pstats
+    from src import config
+
+    global _PROFILER
+    if _PROFILER is None:
+        return []
+    profiler, _PROFILER = _PROFILER, None
+    profiler.disable()
+
+    logs_dir = Path(logs_dir or config.LOGS_DIR)
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+    prof_path = logs_dir / f"profile_{stamp}.prof"
+    profiler.dump_stats(prof_path)
+
+    text = io.StringIO()
+    pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(40)
+    text_path = logs_dir / f"profile_{stamp}.txt"
+    text_path.write_text(text.getvalue(), encoding="utf-8")
+
+    return [prof_path, text_path, write_json_report(logs_dir / f"timings_{stamp}.json")]
@@ -0,0 +1,129 @@
+# src/label_layout.py
+"""
+Module: label_layout
+--------------------
+Collision-free placement of chart value labels.
+
+Each label is measured once, then placed bottom-up in a single greedy pass:
+a label that would overlap an already placed one is nudged upward by a fixed
+step until it fits. Placed boxes are kept in a uniform grid (spatial hash)
+so each collision check only looks at the few labels in neighbouring
+cells instead of every earlier label.
+
+Used by visualization.plot_monthly_spending_by_category().
+"""
+
+import math
+from collections import defaultdict
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧮 Layout Engine (pure geometry, data coordinates)
+# ----------------------------------------------------------------------------------------------------
+class LabelLayout:
+    """
+    Greedy bottom-up label placement backed by a grid-bucket spatial index.
+
+    Boxes are (x0, y0, x1, y1) tuples; two boxes collide only if their
+    interiors overlap (touching edges is fine, like matplotlib's Bbox.overlaps).
+    """
+
+    def __init__(self, cell_width: float, cell_height: float):
+        self.cell_width = cell_width if cell_width > 0 else 1.0
+        self.cell_height = cell_height if cell_height > 0 else 1.0
+        self._grid: dict[tuple[int, int], list[tuple]] = defaultdict(list)
+
+    def _cells(self, box: tuple):
+        x0, y0, x1, y1 = box
+        for col in range(math.floor(x0 / self.cell_width), math.floor(x1 / self.cell_width) + 1):
+            for row in range(math.floor(y0 / self.cell_height), math.floor(y1 / self.cell_height) + 1):
+                yield col, row
+
+    def overlaps(self, box: tuple) -> bool:
+        """Return True if `box` overlaps any placed box."""
+        x0, y0, x1, y1 = box
+        for cell in self._cells(box):
+            for px0, py0, px1, py1 in self._grid.get(cell, ()):
+                if x0 < px1 and px0 < x1 and y0 < py1 and py0 < y1:
+                    return True
+        return False
+
+    def add(self, box: tuple) -> None:
+        for cell in self._cells(box):
+            self._grid[cell].append(box)
+
+    def place(self, x: float, y: float, width: float, height: float, step: float) -> float:
+        """
+        Place a bottom-centred box at (x, y), moving it up by `step` until it fits.
+
+        Returns:
+            float: Final y position of the label's anchor.
+        """
+        half = width / 2
+        while True:
+            box = (x - half, y, x + half, y + height)
+            if step <= 0 or not self.overlaps(box):
+                self.add(box)
+                return y
+            y += step
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🖋️ Matplotlib Adapter
+# ----------------------------------------------------------------------------------------------------
+def measure_texts(ax, texts, **text_kwargs) -> dict[str, tuple[float, float]]:
+    """
+    Measure each distinct string once, in data units of `ax`.
+
+    Args:
+        ax (matplotlib.axes.Axes): Target axes (limits must already be final).
+        texts (Iterable[str]): Label strings.
+        **text_kwargs: Font properties used for the real labels.
+
+    Returns:
+        dict[str, tuple[float, float]]: text → (width, height).
+    """
+    fig = ax.figure
+    renderer = fig.canvas.get_renderer()
+    to_data = ax.transData.inverted()
+
+    sizes = {}
+    for text in dict.fromkeys(texts):
+        probe = ax.text(0, 0, text, ha="center", va="bottom", **text_kwargs)
+        extent = probe.get_window_extent(renderer=renderer).transformed(to_data)
+        probe.remove()
+        sizes[text] = (extent.width, extent.height)
+    return sizes
+
+
+def place_labels(ax, labels, step: float, **text_kwargs) -> list:
+    """
+    Draw bottom-centred labels on `ax`, nudging overlapping ones upward.
+
+    Labels are placed in the given order; earlier labels keep their spot.
+
+    Args:
+        ax (matplotlib.axes.Axes): Target axes.
+        labels (list[tuple[float, float, str]]): (x, y, text) in data coordinates.
+        step (float): Upward nudge (data units) applied per collision.
+        **text_kwargs: Passed to ax.text() (fontsize, color, zorder, ...).
+
+    Returns:
+        list[matplotlib.text.Text]: Created text artists, in input order.
+    """
+    if not labels:
+        return []
+
+    # Settle autoscaled limits before converting pixel sizes to data units
+    ax.get_xlim()
+    ax.get_ylim()
+
+    sizes = measure_texts(ax, (text for _, _, text in labels), **text_kwargs)
+    layout = LabelLayout(max(w for w, _ in sizes.values()), max(h for _, h in sizes.values()))
+
+    artists = []
+    for x, y, text in labels:
+        width, height = sizes[text]
+        final_y = layout.place(x, y, width, height, step)
+        artists.append(ax.text(x, final_y, text, ha="center", va="bottom", **text_kwargs))
+    return artists
@@ -0,0 +1,500 @@
+# src/log_structured_backend.py
+"""
+Module: log_structured_backend
+------------------------------
+Log-structured ledger: immutable sorted segment files plus an append log.
+
+Layout:
+    Expenses.lsm/
+        manifest.json            → segment order, current log, id counter
+        segment-<tag>.pkl        → immutable rows sorted by row id, plus tombstones
+        log-<tag>.jsonl          → one JSON record per change, appended in place
+
+Every row has a stable integer id (the frame index, as for SQLite ledgers),
+which data_manager.edit_expenses() uses to correct or delete it.
+A change is one log record: {"op": "put", "id": 7, "Date": ..., ...}
+writes (or supersedes) row 7, {"op": "del", "id": 7} deletes it. Readers
+apply the segments oldest → newest and then the log, so the newest record
+for an id wins.
+
+Writes cost O(change): a journaled append to the log under the ledger lock
+(see write_ahead_log). Reads cost O(segments): each segment is parsed once
+per process and cached (segments never change once written).
+
+A background compaction thread (started after writes) keeps both bounded:
+    - the log is flushed into a new segment once it reaches config.LSM_FLUSH_BYTES;
+    - once there are config.LSM_MAX_SEGMENTS segments they are merged into
+      one, dropping superseded rows and tombstones.
+The merge runs without blocking writers; only the manifest swap takes the
+exclusive lock. Readers hold the shared lock while they read, so they always
+see one consistent manifest and never a deleted file.
+
+Selected automatically by data_manager.get_backend() for paths ending in
+`.lsm`. Migrate an existing CSV with:
+    import_expenses_csv("data/Expenses.csv", file_path="data/Expenses.lsm")
+"""
+
+import json
+import pickle
+import threading
+import time
+import uuid
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from src.data_manager import DEFAULT_HEADERS, clean_expenses, expense_store
+from src.query_engine import apply_query
+from src.write_ahead_log import atomic_write, journaled_append, ledger_lock, needs_recovery, recover
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+SEGMENT_VERSION = 1
+ORPHAN_MAX_AGE_SECONDS = 3600
+
+# Parsed segments by absolute path (immutable files, so never stale)
+_SEGMENTS: dict[str, dict] = {}
+# Per log file: (log path, bytes scanned, next free id) so appends never rescan the log
+_LOG_IDS: dict[str, tuple[str, int, int]] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Background compaction threads by ledger
+_COMPACTORS: dict[str, threading.Thread] = {}
+_RERUN: set[str] = set()
+_COMPACTOR_LOCK = threading.Lock()
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def _tag() -> str:
+    return f"{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+def _empty_rows() -> pd.DataFrame:
+    return clean_expenses(pd.DataFrame(columns=DEFAULT_HEADERS))
+
+
+def normalize_record(entry: dict) -> dict:
+    """Entry keyed by ledger columns with JSON-safe values ('Payment Mode' matches 'Payment_Mode')."""
+    normalized = {str(k).strip().replace(" ", "_"): v for k, v in entry.items()}
+    record = {}
+    for col in DEFAULT_HEADERS:
+        value = normalized.get(col)
+        if hasattr(value, "item"):  # numpy scalar
+            value = value.item()
+        if value is not None and not isinstance(value, (str, int, float, bool)):
+            value = value.strftime("%Y-%m-%d") if hasattr(value, "strftime") else str(value)
+        if isinstance(value, float) and value != value:  # NaN
+            value = None
+        record[col] = value
+    return record
+
+
+def build_layer(records) -> dict:
+    """
+    Collapse change records (oldest first) into one layer.
+
+    Returns:
+        dict: {"rows": cleaned frame indexed by id (sorted), "tombstones": int64 ids}.
+              Ids whose last record is a delete, or whose row has no valid date,
+              become tombstones so they still hide older versions.
+    """
+    latest = {}
+    for record in records:
+        latest[int(record["id"])] = record if record.get("op", "put") == "put" else None
+
+    puts = {row_id: record for row_id, record in latest.items() if record is not None}
+    if puts:
+        raw = pd.DataFrame.from_records([{col: record.get(col) for col in DEFAULT_HEADERS} for record in puts.values()],
+                                        index=np.fromiter(puts, dtype=np.int64, count=len(puts)))
+        raw = raw.astype({"Category": object, "Description": object, "Payment_Mode": object})
+        rows = clean_expenses(raw).sort_index()
+    else:
+        rows = _empty_rows()
+
+    dead = [row_id for row_id in latest if row_id not in puts or row_id not in rows.index]
+    return {"rows": rows, "tombstones": np.array(sorted(dead), dtype=np.int64)}
+
+
+def apply_layer(df: pd.DataFrame, layer: dict) -> pd.DataFrame:
+    """
+    Apply a layer of edits to the rows of `df` it touches (puts for other ids are ignored).
+
+    Used for CSV ledgers, whose edits live in a sidecar log over the file rows.
+    """
+    rows, dead = layer["rows"], layer["tombstones"]
+    touched = df.index.isin(dead) | df.index.isin(rows.index)
+    if not touched.any():
+        return df
+    replacements = rows[rows.index.isin(df.index[touched])]
+    df = pd.concat([df[~touched], replacements]) if len(replacements) else df[~touched]
+    return df.sort_index(kind="stable")
+
+
+def merge_layers(layers: list[dict]) -> pd.DataFrame:
+    """Apply layers oldest → newest and return the visible rows, sorted by id."""
+    frames = []
+    for layer in layers:
+        rows, dead = layer["rows"], layer["tombstones"]
+        if frames and (len(dead) or len(rows)):
+            hidden = np.union1d(dead, rows.index.to_numpy(dtype=np.int64))
+            frames = [frame[~frame.index.isin(hidden)] for frame in frames]
+        if len(rows):
+            frames.append(rows)
+
+    frames = [frame for frame in frames if len(frame)]
+    if not frames:
+        return _empty_rows()
+    df = pd.concat(frames) if len(frames) > 1 else frames[0].copy()
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind="stable")
+    df.index.name = None
+    return df
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🗂️ Backend
+# ----------------------------------------------------------------------------------------------------
+class LogStructuredBackend:
+    """Segments + append log with the same interface as data_manager.CSVBackend."""
+
+    name = "log"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.manifest_path = self.path / MANIFEST_NAME
+
+    # ---------- Manifest ----------
+    def read_manifest(self) -> dict:
+        with self.manifest_path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest: dict) -> None:
+        """Swap in a new manifest (caller holds the exclusive lock)."""
+        manifest = dict(manifest, generation=manifest.get("generation", 0) + 1)
+        atomic_write(self.manifest_path, lambda tmp: tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8"))
+
+    def log_path(self, manifest: dict) -> Path:
+        return self.path / manifest["log"]
+
+    def _recover_log(self) -> None:
+        """Replay a log append interrupted by a crash (journaled under the ledger lock)."""
+        if needs_recovery(self.log_path(self.read_manifest())):
+            with ledger_lock(self.path):
+                recover(self.log_path(self.read_manifest()))
+
+    # ---------- Segments & log ----------
+    def _write_segment(self, layer: dict) -> str:
+        name = f"segment-{_tag()}.pkl"
+        payload = {"version": SEGMENT_VERSION, "rows": layer["rows"], "tombstones": layer["tombstones"]}
+
+        def write(tmp: Path) -> None:
+            with tmp.open("wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        atomic_write(self.path / name, write)
+        with _CACHE_LOCK:
+            _SEGMENTS[str((self.path / name).resolve())] = payload
+        return name
+
+    def read_segment(self, name: str) -> dict:
+        """Return a parsed segment (cached: segments are immutable)."""
+        key = str((self.path / name).resolve())
+        with _CACHE_LOCK:
+            cached = _SEGMENTS.get(key)
+        if cached is not None:
+            return cached
+        with (self.path / name).open("rb") as f:
+            segment = pickle.load(f)
+        with _CACHE_LOCK:
+            _SEGMENTS[key] = segment
+        return segment
+
+    def read_log(self, manifest: dict) -> list[dict]:
+        """Parse the complete records of the current log."""
+        try:
+            data = self.log_path(manifest).read_bytes()
+        except FileNotFoundError:
+            return []
+        data = data[:data.rfind(b"\n") + 1]
+        return [json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip()]
+
+    def _next_id(self, manifest: dict) -> int:
+        """First unused row id (scans only log bytes not seen before)."""
+        log = self.log_path(manifest)
+        size = log.stat().st_size
+        key = str(self.path.resolve())
+        with _CACHE_LOCK:
+            cached = _LOG_IDS.get(key)
+        start, next_id = 0, manifest["next_id"]
+        if cached and cached[0] == str(log) and cached[1] <= size:
+            start, next_id = cached[1], max(next_id, cached[2])
+
+        if size > start:
+            with log.open("rb") as f:
+                f.seek(start)
+                for line in f.read(size - start).splitlines():
+                    if line.strip():
+                        next_id = max(next_id, int(json.loads(line)["id"]) + 1)
+        with _CACHE_LOCK:
+            _LOG_IDS[key] = (str(log), size, next_id)
+        return next_id
+
+    def write_records(self, records: list[dict]) -> None:
+        """Append change records to the log (O(records)) and schedule compaction if it is due."""
+        from src import config  # dynamic import keeps the thresholds patchable
+
+        if not records:
+            return
+        with ledger_lock(self.path):
+            manifest = self.read_manifest()
+            log = self.log_path(manifest)
+            payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+            journaled_append(log, payload.encode("utf-8"))
+
+            highest = max(int(record["id"]) for record in records)
+            key = str(self.path.resolve())
+            with _CACHE_LOCK:
+                cached = _LOG_IDS.get(key)
+                if cached and cached[0] == str(log):
+                    _LOG_IDS[key] = (str(log), log.stat().st_size, max(cached[2], highest + 1))
+
+            due = log.stat().st_size >= config.LSM_FLUSH_BYTES or len(manifest["segments"]) >= config.LSM_MAX_SEGMENTS
+        if due:
+            schedule_compaction(self.path)
+
+    # ---------- Compaction ----------
+    def flush_log(self) -> bool:
+        """
+        Turn the current log into a new segment and start an empty log.
+
+        Returns:
+            bool: False if the log was empty.
+        """
+        with ledger_lock(self.path):
+            manifest = self.read_manifest()
+            log = self.log_path(manifest)
+            records = self.read_log(manifest)
+            if not records:
+                return False
+
+            layer = build_layer(records)
+            segment = self._write_segment(layer)
+            new_log = f"log-{_tag()}.jsonl"
+            (self.path / new_log).touch()
+            highest = max(int(record["id"]) for record in records)
+            self._write_manifest(dict(
+                manifest,
+                segments=manifest["segments"] + [segment],
+                log=new_log,
+                next_id=max(manifest["next_id"], highest + 1),
+                flushed_bytes=manifest["flushed_bytes"] + log.stat().st_size,
+            ))
+            log.unlink(missing_ok=True)
+            with _CACHE_LOCK:
+                _LOG_IDS.pop(str(self.path.resolve()), None)
+        return True
+
+    def merge_segments(self) -> bool:
+        """
+        Merge all current segments into one, dropping superseded rows and tombstones.
+
+        The merge itself runs without the lock; the manifest swap fails over
+        (returns False) if another compaction replaced these segments first.
+        """
+        with ledger_lock(self.path, shared=True):
+            manifest = self.read_manifest()
+            inputs = list(manifest["segments"])
+            if len(inputs) < 2:
+                return False
+            layers = [self.read_segment(name) for name in inputs]
+
+        # Everything older than the inputs is gone, so tombstones have nothing left to hide
+        rows = merge_layers(layers)
+        merged = self._write_segment({"rows": rows, "tombstones": np.array([], dtype=np.int64)})
+
+        with ledger_lock(self.path):
+            current = self.read_manifest()
+            if current["segments"][:len(inputs)] != inputs:
+                (self.path / merged).unlink(missing_ok=True)
+                return False
+            self._write_manifest(dict(current, segments=[merged] + current["segments"][len(inputs):]))
+            for name in inputs:
+                (self.path / name).unlink(missing_ok=True)
+            self._remove_orphans()
+        with _CACHE_LOCK:
+            for name in inputs:
+                _SEGMENTS.pop(str((self.path / name).resolve()), None)
+        return True
+
+    def _remove_orphans(self) -> None:
+        """Delete old segment / log files no manifest refers to (left by a crash mid-compaction)."""
+        manifest = self.read_manifest()
+        live = set(manifest["segments"]) | {manifest["log"]}
+        cutoff = time.time() - ORPHAN_MAX_AGE_SECONDS
+        for pattern in ("segment-*.pkl", "log-*.jsonl"):
+            for path in self.path.glob(pattern):
+                if path.name not in live and path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+
+    def compact(self) -> None:
+        """Flush the log if it is due, then merge segments if there are too many."""
+        from src import config
+
+        manifest = self.read_manifest()
+        if self.log_path(manifest).stat().st_size >= config.LSM_FLUSH_BYTES:
+            self.flush_log()
+        if len(self.read_manifest()["segments"]) >= config.LSM_MAX_SEGMENTS:
+            self.merge_segments()
+
+    # ---------- Backend interface ----------
+    def ensure_exists(self) -> None:
+        if self.manifest_path.exists():
+            self._recover_log()
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        with ledger_lock(self.path):
+            if self.manifest_path.exists():
+                return
+            log = f"log-{_tag()}.jsonl"
+            (self.path / log).touch()
+            self._write_manifest({"version": MANIFEST_VERSION, "ledger_id": uuid.uuid4().hex, "segments": [],
+                                  "log": log, "next_id": 0, "flushed_bytes": 0, "rewrites": 0})
+        print(f"✅ Created new log-structured ledger: {self.path}")
+
+    def fingerprint(self) -> tuple:
+        # Logical version: unchanged by flushes and merges, so caches survive compaction
+        with ledger_lock(self.path, shared=True):
+            manifest = self.read_manifest()
+            log_size = self.log_path(manifest).stat().st_size
+        return (manifest["ledger_id"], manifest["rewrites"], manifest["flushed_bytes"] + log_size)
+
+    def load(self) -> pd.DataFrame:
+        self._recover_log()
+        with ledger_lock(self.path, shared=True):
+            manifest = self.read_manifest()
+            layers = [self.read_segment(name) for name in manifest["segments"]]
+            layers.append(build_layer(self.read_log(manifest)))
+        return merge_layers(layers)
+
+    def iter_chunks(self, chunksize: int):
+        df = self.load()
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize]
+
+    def query(self, **query) -> pd.DataFrame:
+        return apply_query(expense_store.get(self.path), **query)
+
+    def fetch(self, row_ids) -> pd.DataFrame:
+        df = expense_store.get(self.path, copy=False)
+        return df.loc[df.index.intersection(row_ids)]
+
+    def edit(self, updates: dict, deletes) -> None:
+        """Record replacements (row id → entry) and deletions as put / del log records."""
+        records = [{"op": "put", "id": int(row_id), **normalize_record(entry)} for row_id, entry in updates.items()]
+        records += [{"op": "del", "id": int(row_id)} for row_id in deletes]
+        self.write_records(records)
+
+    def append(self, entries) -> int:
+        entries = [normalize_record(entry) for entry in entries]
+        with ledger_lock(self.path):
+            next_id = self._next_id(self.read_manifest())
+            self.write_records([{"op": "put", "id": next_id + offset, **entry} for offset, entry in enumerate(entries)])
+        return len(entries)
+
+    def save(self, df: pd.DataFrame) -> None:
+        """Replace the ledger with `df` as a single segment (integer index values are kept as row ids)."""
+        rows = clean_expenses(df.copy())
+        with ledger_lock(self.path):
+            manifest = self.read_manifest()
+            keep_ids = pd.api.types.is_integer_dtype(rows.index) and rows.index.is_unique and \
+                (len(rows) == 0 or rows.index.min() >= 0)
+            if not keep_ids:
+                rows.index = np.arange(manifest["next_id"], manifest["next_id"] + len(rows), dtype=np.int64)
+            rows = rows.sort_index()
+
+            segment = self._write_segment({"rows": rows, "tombstones": np.array([], dtype=np.int64)})
+            new_log = f"log-{_tag()}.jsonl"
+            (self.path / new_log).touch()
+            old_files = manifest["segments"] + [manifest["log"]]
+            self._write_manifest(dict(
+                manifest,
+                segments=[segment],
+                log=new_log,
+                next_id=max(manifest["next_id"], int(rows.index.max()) + 1 if len(rows) else 0),
+                rewrites=manifest["rewrites"] + 1,
+            ))
+            for name in old_files:
+                (self.path / name).unlink(missing_ok=True)
+            with _CACHE_LOCK:
+                _LOG_IDS.pop(str(self.path.resolve()), None)
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+def _compaction_worker(path: Path) -> None:
+    key = str(path.resolve())
+    while True:
+        try:
+            LogStructuredBackend(path).compact()
+        except Exception as e:
+            print(f"⚠️ Background compaction of {path.name} failed: {e}")
+        with _COMPACTOR_LOCK:
+            if key not in _RERUN:
+                _COMPACTORS.pop(key, None)
+                return
+            _RERUN.discard(key)
+
+
+def schedule_compaction(file_path: str | Path) -> threading.Thread:
+    """
+    Run compaction for a ledger on a background thread (at most one per ledger).
+
+    Returns:
+        threading.Thread: The running compaction thread.
+    """
+    path = Path(file_path)
+    key = str(path.resolve())
+    with _COMPACTOR_LOCK:
+        thread = _COMPACTORS.get(key)
+        if thread is not None and thread.is_alive():
+            _RERUN.add(key)  # writes arrived while it ran: go round once more
+            return thread
+        thread = threading.Thread(target=_compaction_worker, args=(path,), name=f"compact-{path.name}", daemon=True)
+        _COMPACTORS[key] = thread
+        thread.start()
+        return thread
+
+
+def wait_for_compaction(file_path: str | Path, timeout: float | None = None) -> None:
+    """Block until the background compaction of a ledger (if any) has finished."""
+    key = str(Path(file_path).resolve())
+    while True:
+        with _COMPACTOR_LOCK:
+            thread = _COMPACTORS.get(key)
+        if thread is None:
+            return
+        thread.join(timeout)
+        if timeout is not None:
+            return
+
+
+def compact_ledger(file_path: str | Path) -> dict:
+    """
+    Fully compact a ledger now: flush the log and merge every segment into one.
+
+    Args:
+        file_path (str | Path): Log-structured ledger directory.
+
+    Returns:
+        dict: Segment count and visible rows after compaction.
+    """
+    backend = LogStructuredBackend(Path(file_path))
+    backend.ensure_exists()
+    wait_for_compaction(backend.path)
+    backend.flush_log()
+    backend.merge_segments()
+    manifest = backend.read_manifest()
+    return {"segments": len(manifest["segments"]), "rows": len(backend.load())}
@@ -10,11 +10,14 @@ and manages start-up diagnostics and data readiness.
 
 Modules Integrated:
     • add_expense.py
+    • import_expenses.py
+    • edit_expense.py
     • view_expenses.py
     • monthly_summary.py
     • category_insight.py
     • yearly_overview.py
     • visualization.py
+    • diagnostics.py
     • config.py
 """
 
@@ -28,48 +31,46 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-# Imports for test diagnostics
-try:
-    from tests.test_integration import run_all_tests
-except ImportError:
-    run_all_tests = lambda: print("⚠️ Skipping diagnostics: test suite not found.")
-
-# Core Configuration
+# Core Configuration (lightweight: no pandas / matplotlib / pytest here)
 from src.config import (
     APP_NAME,
     VERSION,
     AUTHOR,
     DATA_FILE,
     DEFAULT_CURRENCY,
+    ensure_directories,
     get_currently_symbol,
 )
 
-# Functional modules
-from src import (
-    add_expense,
-    view_expenses,
-    monthly_summary,
-    category_insight,
-    yearly_overview,
-    visualization,
-)
-from src.data_manager import load_expenses
+# Menu choice that leaves the app (also sent by tests/test_main.py and benchmarks/startup_benchmark.py)
+EXIT_CHOICE = "10"
+
+# Functional modules (pandas, tabulate, matplotlib, seaborn, pytest) are imported on
+# first use inside the menu handlers so the menu appears without paying for them.
+# benchmarks/startup_benchmark.py tracks the resulting time-to-menu.
 
 
 # ----------------------------------------------------------------------------------------------------
 # Start-Up Diagnostics
 # ----------------------------------------------------------------------------------------------------
-def bios_self_check():
-    from src import config
-    """Run integrated test diagnostics."""
-    print("\n🩺 Running system diagnostics...")
+def bios_self_check(force: bool = False):
+    """
+    Start integrated test diagnostics without blocking the menu.
+
+    The suite runs in a background process and is skipped entirely when the
+    sources and ledger schema match the last passing run (see diagnostics.py).
+    """
+    from src.diagnostics import start_diagnostics
+
+    if not (ROOT_DIR / "tests").is_dir():
+        print("⚠️ Skipping diagnostics: test suite not found.")
+        return None
+
     try:
-        config.TEST_MODE = True
-        run_all_tests()
-        config.TEST_MODE = False
+        return start_diagnostics(force=force)
     except Exception as e:
         print(f"⚠️ Diagnostics skipped or failed: {e}")
-    print("✅ Diagnostics Complete.\n")
+        return None
 
 
 
@@ -100,12 +101,6 @@ def show_header():
     print("=" * 60)
 
 
-# # ----------------------------------------------------------------------------------------------------
-# # Visualization Menu
-# # ----------------------------------------------------------------------------------------------------
-from src.visualization import visualization_interactive
-
-
 # ----------------------------------------------------------------------------------------------------
 # Testing & Debugging Menu
 # ----------------------------------------------------------------------------------------------------
@@ -117,9 +112,12 @@ def run_testing_debugging():
     print(f"Exists: {Path(DATA_FILE).exists()}")
     print(f"Default Currency: {DEFAULT_CURRENCY} ({get_currently_symbol(DEFAULT_CURRENCY)})")
 
-    df = load_expenses(DATA_FILE)
+    from src.data_manager import expense_store, memory_footprint
+
+    df = expense_store.get(DATA_FILE)
     print(f"Rows in dataset: {len(df)}")
     print(f"Columns: {list(df.columns)}")
+    print(f"Memory footprint: {memory_footprint(df)['Total']:.2f} MB")
 
     if not df.empty:
         print("\n📘 Sample Data Preview:")
@@ -127,6 +125,16 @@ def run_testing_debugging():
     else:
         print("\n⚠️ Dataset is empty. Add some exxpenses first.")
 
+    from src import instrumentation
+
+    print("\n⏱️ Hot Paths (this session):")
+    print(instrumentation.format_report())
+    if instrumentation.profiling_active():
+        print("\n🔬 cProfile is running; reports are written to logs/ on exit.")
+
+    if input("\nSave timing report to logs/ (Y/N): ").strip().lower() == "y":
+        print(f"💾 Timing report → {instrumentation.write_json_report()}")
+
     input("\nPress Enter to return to the Main Menu...")
 
 
@@ -146,35 +154,70 @@ def main_menu():
         print("5. 📆 Yearly Overview")
         print("6. 📈 Visualization Dashboard")
         print("7. 🧠 Testing & Debugging")
-        print("8. 🚪 Exit")
+        print("8. 📥 Import Expenses from CSV")
+        print("9. ✏️ Edit / Delete Expense")
+        print(f"{EXIT_CHOICE}. 🚪 Exit")
 
-        choice = input("\nEnter your Choice (1-8): ").strip()
+        choice = input(f"\nEnter your Choice (1-{EXIT_CHOICE}): ").strip()
 
         if choice == "1":
-            add_expense.add_expense_interactive()
+            from src.add_expense import add_expense_interactive
+            add_expense_interactive()
         elif choice == "2":
-            view_expenses.view_expenses_interactive()
+            from src.view_expenses import view_expenses_interactive
+            view_expenses_interactive()
         elif choice == "3":
-            monthly_summary.monthly_summary_interactive()
+            from src.monthly_summary import monthly_summary_interactive
+            monthly_summary_interactive()
         elif choice == "4":
-            category_insight.category_insight_interactive()
+            from src.category_insight import category_insight_interactive
+            category_insight_interactive()
         elif choice == "5":
-            yearly_overview.yearly_overview_interactive()
+            from src.yearly_overview import yearly_overview_interactive
+            yearly_overview_interactive()
         elif choice == "6":
+            from src.visualization import visualization_interactive
             visualization_interactive()
         elif choice == "7":
             run_testing_debugging()
         elif choice == "8":
+            from src.import_expenses import import_expenses_interactive
+            import_expenses_interactive()
+        elif choice == "9":
+            from src.edit_expense import edit_expense_interactive
+            edit_expense_interactive()
+        elif choice == EXIT_CHOICE:
             print("\nThank you for using Smart Expense Tracker! 👋")
             break
         else:
             print("⚠️ Invalid choice, please try again.\n")
 
 
+# ----------------------------------------------------------------------------------------------------
+# Profile Mode
+# ----------------------------------------------------------------------------------------------------
+def enable_profiling():
+    """Profile the whole session (--profile); cProfile and timing reports go to logs/ on exit."""
+    import atexit
+    from src import instrumentation
+
+    def _write_reports():
+        for path in instrumentation.stop_profiling():
+            print(f"🔬 Profile report → {path}")
+
+    instrumentation.start_profiling()
+    atexit.register(_write_reports)
+    print("🔬 Profiling enabled.")
+
+
 # ----------------------------------------------------------------------------------------------------
 # Entry Point
 # ----------------------------------------------------------------------------------------------------
 if __name__ == "__main__":
-    bios_self_check()
+    ensure_directories()
+    if "--profile" in sys.argv[1:]:
+        enable_profiling()
+    if "--no-diagnostics" not in sys.argv[1:]:
+        bios_self_check()
     ensure_csv_exists()
     main_menu()
\ No newline at end of file
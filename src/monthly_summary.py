@@ -17,52 +17,34 @@ import pandas as pd
 from pathlib import Path
 from tabulate import tabulate
 from src.config import DATA_FILE
-from src.data_manager import ensure_csv_exists
+from src.aggregates import get_analytics_bundle
+from src.instrumentation import instrumented
 
 
 # ----------------------------------------------------------------------------------------------------
 # 🧠 PURE FUNCTION (Testable Core)
 # ----------------------------------------------------------------------------------------------------
-def monthly_summary(file_path: str | Path = DATA_FILE) -> pd.DataFrame:
+@instrumented()
+def monthly_summary(file_path: str | Path = DATA_FILE, chunksize: int | None = None) -> pd.DataFrame:
     """
     Generate a monthly summary of total expenses.
 
     Args:
         file_path (str | Path): Path to the CSV file containing expenses.
+        chunksize (int | None): Stream the file in chunks of this many rows (constant memory).
 
     Returns:
         pd.DataFrame: DataFrame with columns ['Month', 'Total'].
                       Returns an empty DataFrame if no valid data is found.
     """
-    file_path = Path(file_path)
-    ensure_csv_exists()
-
-    df = pd.read_csv(file_path)
+    # Month totals from the shared analytics bundle (no rescan of the ledger)
+    month_totals = get_analytics_bundle(Path(file_path), chunksize=chunksize).month_totals
 
     # Handle empty CSV file
-    if df.empty or "Date" not in df.columns or "Amount" not in df.columns:
+    if not month_totals:
         return pd.DataFrame(columns=["Month", "Total"])
-    
-    # Convert data types safely
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df["Amount"] = pd.to_numeric(df['Amount'], errors="coerce").fillna(0)
 
-    # Drop Invalid Dates
-    df = df.dropna(subset=["Date"])
-    if df.empty:
-        return pd.DataFrame(columns=["Month", "Total"])
-    
-    # Extract Month
-    df["Month"] = df["Date"].dt.to_period("M").astype(str)
-
-    # Aggregate totals
-    summary_df = (
-        df.groupby("Month", as_index=False)["Amount"]
-        .sum()
-        .rename(columns={"Amount": "Total"})
-        .sort_values("Month")
-        .reset_index(drop=True)
-    )
+    summary_df = pd.DataFrame({"Month": list(month_totals), "Total": list(month_totals.values())})
 
     return summary_df
 
@@ -0,0 +1,195 @@
+# src/partitioned_backend.py
+"""
+Module: partitioned_backend
+---------------------------
+Month-partitioned ledger layout: one CSV file per `YYYY-MM` plus a small
+JSON manifest.
+
+Layout:
+    Expenses.parts/
+        manifest.json     → {"version": 1, "partitions": {"2025-10": {"file": "2025-10.csv", "rows": 12}}}
+        2025-09.csv
+        2025-10.csv
+        undated.csv       → rows whose date could not be parsed (kept, never loaded)
+
+Selected automatically by data_manager.get_backend() for existing
+directories and paths ending in `.parts`. Month / date-range queries only
+open the matching partitions, and appends only touch the current month's
+file (plus the manifest). Each partition is cached separately by the shared
+expense_store, so re-opening a month is free until that month changes.
+
+Migrate an existing CSV with:
+    import_expenses_csv("data/Expenses.csv", file_path="data/Expenses.parts")
+"""
+
+import json
+import os
+from collections import defaultdict
+from datetime import date, datetime
+from pathlib import Path
+import pandas as pd
+from src.data_manager import CSVBackend, clean_expenses, expense_store
+from src.query_engine import apply_query, to_timestamp
+from src.utils import parse_date
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+UNDATED_KEY = "undated"
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def partition_key(value) -> str:
+    """Return the `YYYY-MM` partition for a raw date value (or 'undated')."""
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m")
+    text = "" if value is None else str(value).strip()
+    iso = parse_date(text) if text else None
+    return iso[:7] if iso else UNDATED_KEY
+
+
+def _normalize_entry(entry: dict) -> tuple[str, dict]:
+    """Return (partition key, entry with an ISO date)."""
+    normalized = {str(k).strip().replace(" ", "_"): v for k, v in entry.items()}
+    key = partition_key(normalized.get("Date"))
+    if key != UNDATED_KEY:
+        raw = normalized.get("Date")
+        normalized["Date"] = raw.strftime("%Y-%m-%d") if isinstance(raw, (datetime, date)) else parse_date(str(raw))
+    return key, normalized
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🗂️ Backend
+# ----------------------------------------------------------------------------------------------------
+class PartitionedBackend:
+    """Directory of monthly CSV partitions with the same interface as data_manager.CSVBackend."""
+
+    name = "partitioned"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.manifest_path = self.path / MANIFEST_NAME
+
+    # ---------- Manifest ----------
+    def read_manifest(self) -> dict:
+        try:
+            with self.manifest_path.open("r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault("version", MANIFEST_VERSION)
+        manifest.setdefault("partitions", {})
+        return manifest
+
+    def _write_manifest(self, manifest: dict) -> None:
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def partition_path(self, key: str) -> Path:
+        return self.path / f"{key}.csv"
+
+    def months(self) -> list[str]:
+        """Sorted list of dated partitions (YYYY-MM)."""
+        return sorted(key for key in self.read_manifest()["partitions"] if key != UNDATED_KEY)
+
+    # ---------- Backend interface ----------
+    def ensure_exists(self) -> None:
+        if self.manifest_path.exists():
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._write_manifest({"version": MANIFEST_VERSION, "partitions": {}})
+        print(f"✅ Created new partitioned ledger: {self.path}")
+
+    def fingerprint(self) -> tuple:
+        parts = []
+        for key in sorted(self.read_manifest()["partitions"]):
+            st = self.partition_path(key).stat()
+            parts.append((key, st.st_ino, st.st_size, st.st_mtime_ns))
+        return tuple(parts)
+
+    def select_months(self, month: str | None = None, start=None, end=None) -> list[str]:
+        """
+        Return the partitions that can contain matching rows.
+
+        Args:
+            month (str | None): Date prefix such as "2025" or "2025-10".
+            start, end (date-like | None): Inclusive date range bounds.
+        """
+        selected = self.months()
+        if month:
+            prefix = month[:7]
+            selected = [key for key in selected if key.startswith(prefix)]
+        if start is not None:
+            start_key = pd.Timestamp(start).strftime("%Y-%m")
+            selected = [key for key in selected if key >= start_key]
+        if end is not None:
+            end_key = pd.Timestamp(end).strftime("%Y-%m")
+            selected = [key for key in selected if key <= end_key]
+        return selected
+
+    def iter_partitions(self, month: str | None = None, start=None, end=None):
+        """Yield (YYYY-MM, cleaned DataFrame) for each selected partition, oldest first."""
+        for key in self.select_months(month=month, start=start, end=end):
+            yield key, expense_store.get(self.partition_path(key))
+
+    def iter_chunks(self, chunksize: int):
+        for key in self.months():
+            yield from CSVBackend(self.partition_path(key)).iter_chunks(chunksize)
+
+    def load(self) -> pd.DataFrame:
+        frames = [df for _, df in self.iter_partitions() if not df.empty]
+        if not frames:
+            return clean_expenses(pd.DataFrame())
+        return pd.concat(frames, ignore_index=True)
+
+    def query(self, **query) -> pd.DataFrame:
+        # Prune partitions on the date filters before anything is loaded
+        start, end = to_timestamp(query.get("start")), to_timestamp(query.get("end"))
+        frames = [df for _, df in self.iter_partitions(month=query.get("month"), start=start, end=end) if not df.empty]
+        if not frames:
+            return clean_expenses(pd.DataFrame())
+        return apply_query(pd.concat(frames, ignore_index=True), **query)
+
+    def append(self, entries) -> int:
+        groups = defaultdict(list)
+        for entry in entries:
+            key, normalized = _normalize_entry(entry)
+            groups[key].append(normalized)
+
+        manifest = self.read_manifest()
+        written = 0
+        for key, rows in groups.items():
+            part = CSVBackend(self.partition_path(key))
+            part.ensure_exists()
+            count = part.append(rows)
+            expense_store.invalidate(part.path)
+            info = manifest["partitions"].setdefault(key, {"file": part.path.name, "rows": 0})
+            info["rows"] += count
+            written += count
+
+        if groups:
+            self._write_manifest(manifest)
+        return written
+
+    def save(self, df: pd.DataFrame) -> None:
+        df = df.copy()
+        if pd.api.types.is_datetime64_any_dtype(df["Date"]):
+            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
+        keys = df["Date"].map(partition_key)
+
+        old = self.read_manifest()["partitions"]
+        manifest = {"version": MANIFEST_VERSION, "partitions": {}}
+        for key, part_df in df.groupby(keys, sort=True):
+            part = CSVBackend(self.partition_path(key))
+            part.save(part_df)
+            expense_store.invalidate(part.path)
+            manifest["partitions"][key] = {"file": part.path.name, "rows": len(part_df)}
+
+        self._write_manifest(manifest)
+        for key in set(old) - set(manifest["partitions"]):
+            self.partition_path(key).unlink(missing_ok=True)
+            expense_store.invalidate(self.partition_path(key))
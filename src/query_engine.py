@@ -0,0 +1,235 @@
+# src/query_engine.py
+"""
+Module: query_engine
+--------------------
+Composable, vectorized expense queries.
+
+Filters (all optional, combined with AND):
+    categories      → one or more category names (case-insensitive)
+    payment_modes   → one or more payment modes (case-insensitive)
+    start, end      → inclusive date range (ISO or any utils.parse_date format)
+    min_amount,
+    max_amount      → inclusive amount range
+    description     → case-insensitive substring of Description
+    month           → date prefix such as "2025" or "2025-10"
+
+Results can be sorted by several columns and limited to the first N rows.
+
+Each storage backend's query() accepts the same keywords: CSV and
+partitioned ledgers evaluate them as boolean masks over the cached frame
+(partitions outside the date range are never opened), SQLite pushes them
+down as indexed SQL.
+"""
+
+import numpy as np
+import pandas as pd
+from datetime import date, datetime
+from pathlib import Path
+from src.instrumentation import instrumented
+from src.utils import parse_date
+
+
+FILTER_KEYS = ("categories", "payment_modes", "start", "end", "min_amount", "max_amount", "description", "month")
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def as_list(value) -> list | None:
+    """Normalize a single value or an iterable of values to a list (None / empty → None)."""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    values = [value] if isinstance(value, str) else list(value)
+    values = [v for v in values if v is not None and str(v).strip()]
+    return values or None
+
+
+def to_timestamp(value) -> pd.Timestamp | None:
+    """Convert a date-like value to a Timestamp (blank → None, unparsable → ValueError)."""
+    if value is None:
+        return None
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return pd.Timestamp(value)
+    text = str(value).strip()
+    if not text:
+        return None
+    iso = parse_date(text)
+    if iso is None:
+        raise ValueError(f"Invalid date: {value!r}")
+    return pd.Timestamp(iso)
+
+
+def month_bounds(prefix: str) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+    """
+    Translate a date prefix into a half-open [start, end) range.
+
+    Returns:
+        tuple | None: Range for "YYYY", "YYYY-MM" or "YYYY-MM-DD"; None for other prefixes.
+    """
+    try:
+        if len(prefix) == 4:
+            start = pd.Timestamp(f"{prefix}-01-01")
+            return start, start + pd.DateOffset(years=1)
+        if len(prefix) == 7:
+            start = pd.Timestamp(f"{prefix}-01")
+            return start, start + pd.DateOffset(months=1)
+        if len(prefix) == 10:
+            start = pd.Timestamp(prefix)
+            return start, start + pd.Timedelta(days=1)
+    except ValueError:
+        return None
+    return None
+
+
+def _isin_casefold(column: pd.Series, wanted: list) -> np.ndarray:
+    """Case-insensitive membership, evaluated once per distinct value."""
+    wanted = {str(v).strip().lower() for v in wanted}
+    uniques = pd.unique(column.dropna())
+    matches = [u for u in uniques if str(u).lower() in wanted]
+    return column.isin(matches).to_numpy()
+
+
+def _contains_casefold(column: pd.Series, needle: str) -> np.ndarray:
+    """Case-insensitive substring match, evaluated once per distinct value."""
+    codes, uniques = pd.factorize(column)
+    if len(uniques) == 0:
+        return np.zeros(len(column), dtype=bool)
+    hits = pd.Series(uniques).astype(str).str.contains(needle, case=False, regex=False).to_numpy()
+    return np.where(codes >= 0, hits[codes], False)
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+def build_mask(df: pd.DataFrame, categories=None, payment_modes=None, start=None, end=None,
+               min_amount=None, max_amount=None, description=None, month=None) -> np.ndarray:
+    """
+    Combine every given filter into one boolean row mask.
+
+    Args:
+        df (pd.DataFrame): Cleaned expense frame.
+        (filters): See the module docstring.
+
+    Returns:
+        np.ndarray: Boolean mask aligned with `df`.
+    """
+    mask = np.ones(len(df), dtype=bool)
+
+    categories = as_list(categories)
+    if categories:
+        mask &= _isin_casefold(df["Category"], categories)
+
+    payment_modes = as_list(payment_modes)
+    if payment_modes:
+        mask &= _isin_casefold(df["Payment_Mode"], payment_modes)
+
+    dates = df["Date"]
+    start, end = to_timestamp(start), to_timestamp(end)
+    if start is not None:
+        mask &= (dates >= start).to_numpy()
+    if end is not None:
+        mask &= (dates < end.normalize() + pd.Timedelta(days=1)).to_numpy()
+
+    if month:
+        bounds = month_bounds(month)
+        if bounds:
+            mask &= ((dates >= bounds[0]) & (dates < bounds[1])).to_numpy()
+        else:
+            mask &= dates.dt.strftime("%Y-%m-%d").str.startswith(month).to_numpy()
+
+    if min_amount is not None:
+        mask &= (df["Amount"] >= float(min_amount)).to_numpy()
+    if max_amount is not None:
+        mask &= (df["Amount"] <= float(max_amount)).to_numpy()
+
+    if description:
+        mask &= _contains_casefold(df["Description"], description)
+
+    return mask
+
+
+def sort_and_limit(df: pd.DataFrame, sort_by=None, descending=False, limit: int | None = None) -> pd.DataFrame:
+    """
+    Stable multi-key sort plus an optional row limit.
+
+    Args:
+        df (pd.DataFrame): Frame to order.
+        sort_by (str | list[str] | None): Column(s) to sort by (unknown columns are ignored).
+        descending (bool | list[bool]): Direction, globally or per key.
+        limit (int | None): Keep only the first N rows.
+
+    Returns:
+        pd.DataFrame: Ordered (and limited) frame, original index kept.
+    """
+    keys = [key for key in (as_list(sort_by) or []) if key in df.columns]
+    if isinstance(descending, (list, tuple)):
+        directions = [bool(d) for d in descending] + [False] * (len(keys) - len(descending))
+    else:
+        directions = [bool(descending)] * len(keys)
+
+    if keys:
+        key = keys[0]
+        numeric = pd.api.types.is_numeric_dtype(df[key]) or pd.api.types.is_datetime64_any_dtype(df[key])
+        if limit is not None and len(keys) == 1 and numeric:
+            # Top-k selection instead of a full sort
+            return df.nlargest(limit, key) if directions[0] else df.nsmallest(limit, key)
+        df = df.sort_values(by=keys, ascending=[not d for d in directions], kind="stable")
+
+    return df.head(limit) if limit is not None else df
+
+
+def normalize_filters(category=None, **filters) -> dict:
+    """
+    Validate filter keywords and fold the legacy single `category` into `categories`.
+
+    Raises:
+        TypeError: If an unknown filter is given.
+        ValueError: If both `category` and `categories` are given.
+    """
+    unknown = set(filters) - set(FILTER_KEYS)
+    if unknown:
+        raise TypeError(f"Unknown query filter(s): {', '.join(sorted(unknown))}")
+    if category and as_list(filters.get("categories")):
+        raise ValueError("Pass either `category` or `categories`, not both.")
+    if category:
+        filters["categories"] = category
+    return filters
+
+
+@instrumented()
+def apply_query(df: pd.DataFrame, sort_by=None, descending=False, limit: int | None = None, **filters) -> pd.DataFrame:
+    """
+    Filter, sort and limit a loaded frame.
+
+    Args:
+        df (pd.DataFrame): Cleaned expense frame.
+        sort_by, descending, limit: See sort_and_limit().
+        **filters: Any of FILTER_KEYS (plus the legacy `category`).
+
+    Returns:
+        pd.DataFrame: Matching rows (original index kept).
+    """
+    filters = normalize_filters(**filters)
+    mask = build_mask(df, **filters)
+    result = df if mask.all() else df[mask]
+    return sort_and_limit(result, sort_by=sort_by, descending=descending, limit=limit)
+
+
+def query_expenses(file_path: str | Path | None = None, sort_by=None, descending=False,
+                   limit: int | None = None, **filters) -> pd.DataFrame:
+    """
+    Run a query against a ledger through its storage backend.
+
+    Args:
+        file_path (str | Path | None): Ledger path (defaults to the main data file).
+        sort_by, descending, limit: See sort_and_limit().
+        **filters: Any of FILTER_KEYS (plus the legacy `category`).
+
+    Returns:
+        pd.DataFrame: Matching rows.
+    """
+    from src.data_manager import get_backend
+
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+    return backend.query(sort_by=sort_by, descending=descending, limit=limit, **filters)
@@ -0,0 +1,360 @@
+# src/search_index.py
+"""
+Module: search_index
+--------------------
+Inverted index for full-text search over the Description column.
+
+Each lower-cased word of a description maps to the sorted row ids (labels of
+the loaded ledger frame: CSV row numbers, SQLite ids) that contain it.
+A query is split into words; every word is looked up (as a prefix by
+default, via bisect over the sorted vocabulary) and the posting lists are
+intersected, so "hel ste" finds every "Hello Steel" row. Lookups cost
+O(matching postings), not O(ledger).
+
+Maintenance:
+    - Built from the loaded frame on first search, then kept in memory per
+      ledger, tagged with the backend fingerprint (like aggregates.py).
+    - data_manager.append_expenses() advances the fingerprint; the appended
+      rows (always at the end of the frame) are tokenized on the next search.
+    - data_manager.edit_expenses() re-indexes just the edited rows.
+    - Out-of-band edits or rewrites change the fingerprint → full rebuild.
+    - Persisted under config.CACHE_DIR once the ledger holds at least
+      config.SEARCH_INDEX_MIN_ROWS rows: a pickle with the postings and a
+      tiny JSON state file that appends update instead of the pickle.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+from bisect import bisect_left
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from src.aggregates import fingerprint_token
+from src.data_manager import expense_store, get_backend, get_data_file
+from src.instrumentation import instrumented, timed
+
+
+SEARCH_INDEX_VERSION = 2  # v2: postings cover rows with non-ISO dates
+TOKEN_PATTERN = re.compile(r"\w+")
+
+_EMPTY = np.empty(0, dtype=np.int64)
+_MEMORY: dict[str, "DescriptionIndex"] = {}
+_LOCK = threading.Lock()
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🔎 Index State
+# ----------------------------------------------------------------------------------------------------
+def tokenize(text) -> list[str]:
+    """Split text into lower-case word tokens."""
+    if text is None or (isinstance(text, float) and np.isnan(text)):
+        return []
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class DescriptionIndex:
+    """Token → sorted row-id postings for the first `rows` rows of a ledger frame."""
+
+    def __init__(self, fingerprint: str | None = None):
+        self.fingerprint = fingerprint   # ledger fingerprint the index is current for
+        self.base = None                 # fingerprint stored in the persisted pickle
+        self.rows = 0
+        self.last_label = None           # highest row id indexed so far
+        self.postings: dict[str, np.ndarray] = {}
+        self.vocabulary: list[str] = []
+
+    def add_frame(self, df: pd.DataFrame) -> None:
+        """Index rows appended after the ones already covered (labels must be integers)."""
+        with timed("search_index.tokenize") as span:
+            codes, descriptions = pd.factorize(df["Description"])
+
+            # Tokenize each distinct description once → (token id, description code) pairs
+            token_ids: dict[str, int] = {}
+            pair_tokens, pair_codes = [], []
+            for code, text in enumerate(descriptions):
+                for token in dict.fromkeys(tokenize(text)):
+                    pair_tokens.append(token_ids.setdefault(token, len(token_ids)))
+                    pair_codes.append(code)
+
+            if pair_tokens:
+                # Expand pairs to rows: each row gets the tokens of its description
+                pair_tokens, pair_codes = np.asarray(pair_tokens), np.asarray(pair_codes)
+                per_code = np.bincount(pair_codes, minlength=len(descriptions))
+                first_pair = np.concatenate([[0], np.cumsum(per_code)[:-1]])
+
+                valid = codes >= 0
+                row_codes = codes[valid]
+                repeats = per_code[row_codes]
+                row_labels = np.repeat(df.index.to_numpy(dtype=np.int64)[valid], repeats)
+                offsets = np.arange(repeats.sum()) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+                row_tokens = pair_tokens[np.repeat(first_pair[row_codes], repeats) + offsets]
+
+                # Group row labels by token (stable, so each posting stays in ledger order)
+                order = np.argsort(row_tokens, kind="stable")
+                bounds = np.searchsorted(row_tokens[order], np.arange(len(token_ids) + 1))
+                row_labels = row_labels[order]
+                for token, token_id in token_ids.items():
+                    new = row_labels[bounds[token_id]:bounds[token_id + 1]]
+                    old = self.postings.get(token)
+                    self.postings[token] = new if old is None else np.concatenate([old, new])
+                self.vocabulary = sorted(self.postings)
+            self.rows += len(df)
+            if len(df):
+                highest = int(df.index.max())
+                self.last_label = highest if self.last_label is None else max(self.last_label, highest)
+            span.rows = len(df)
+
+    def replace_rows(self, labels, old_descriptions, new_descriptions) -> None:
+        """
+        Re-index edited rows in place (new description None = row deleted).
+
+        Each label is removed from the postings of words it lost and inserted,
+        in order, into the postings of words it gained.
+        """
+        vocabulary_changed = False
+        for label, old, new in zip(labels, old_descriptions, new_descriptions):
+            label = np.int64(label)
+            old_tokens, new_tokens = set(tokenize(old)), set(tokenize(new))
+            for token in old_tokens - new_tokens:
+                posting = self.postings.get(token, _EMPTY)
+                position = np.searchsorted(posting, label)
+                if position < len(posting) and posting[position] == label:
+                    posting = np.delete(posting, position)
+                    if len(posting):
+                        self.postings[token] = posting
+                    else:
+                        del self.postings[token]
+                        vocabulary_changed = True
+            for token in new_tokens - old_tokens:
+                posting = self.postings.get(token)
+                if posting is None:
+                    self.postings[token] = np.array([label], dtype=np.int64)
+                    vocabulary_changed = True
+                else:
+                    position = np.searchsorted(posting, label)
+                    if position == len(posting) or posting[position] != label:
+                        self.postings[token] = np.insert(posting, position, label)
+        if vocabulary_changed:
+            self.vocabulary = sorted(self.postings)
+
+    def lookup(self, term: str, prefix: bool = True) -> np.ndarray:
+        """Return the row ids containing `term` (or any word starting with it)."""
+        if not prefix:
+            return self.postings.get(term, _EMPTY)
+        lo = bisect_left(self.vocabulary, term)
+        hi = bisect_left(self.vocabulary, term[:-1] + chr(ord(term[-1]) + 1))
+        matches = [self.postings[token] for token in self.vocabulary[lo:hi]]
+        if len(matches) <= 1:
+            return matches[0] if matches else _EMPTY
+        return np.unique(np.concatenate(matches))
+
+    def search(self, query: str, prefix: bool = True) -> np.ndarray:
+        """
+        Return sorted row ids whose description contains every word of `query`.
+
+        Args:
+            query (str): One or more words (AND semantics).
+            prefix (bool): Treat each word as a prefix.
+
+        Returns:
+            np.ndarray: Matching row ids.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return _EMPTY
+        postings = sorted((self.lookup(term, prefix) for term in dict.fromkeys(terms)), key=len)
+        result = postings[0]
+        for other in postings[1:]:
+            if not len(result):
+                break
+            # Binary-search the shortest list into the longer ones: O(k log n)
+            positions = np.minimum(np.searchsorted(other, result), len(other) - 1)
+            result = result[other[positions] == result]
+        return result
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def _key(file_path) -> str:
+    return str(Path(file_path or get_data_file()).resolve())
+
+
+def sidecar_paths(file_path) -> tuple[Path, Path]:
+    """Return the (postings pickle, state JSON) files used for a ledger."""
+    from src import config  # dynamic import keeps CACHE_DIR patchable
+
+    resolved = Path(_key(file_path))
+    digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()[:16]
+    base = Path(config.CACHE_DIR) / f"{resolved.stem}-{digest}"
+    return base.with_name(base.name + ".search.pkl"), base.with_name(base.name + ".search.json")
+
+
+def _write_atomic(path: Path, write) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def _write_state(file_path, index: DescriptionIndex) -> None:
+    _, state_path = sidecar_paths(file_path)
+    state = {"fingerprint": index.fingerprint, "base": index.base}
+    _write_atomic(state_path, lambda f: f.write(json.dumps(state).encode("utf-8")))
+
+
+def _persist(file_path, index: DescriptionIndex) -> None:
+    """Write postings and state once the ledger is big enough to benefit."""
+    from src import config
+
+    if index.rows < config.SEARCH_INDEX_MIN_ROWS:
+        return
+    postings_path, _ = sidecar_paths(file_path)
+    payload = {"version": SEARCH_INDEX_VERSION, "fingerprint": index.fingerprint,
+               "rows": index.rows, "last_label": index.last_label, "postings": index.postings}
+    try:
+        _write_atomic(postings_path, lambda f: pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL))
+        index.base = index.fingerprint
+        _write_state(file_path, index)
+    except OSError as e:
+        print(f"⚠️ Could not write search index: {e}")
+
+
+def _read_sidecar(file_path) -> DescriptionIndex | None:
+    postings_path, state_path = sidecar_paths(file_path)
+    try:
+        with postings_path.open("rb") as f:
+            payload = pickle.load(f)
+        with state_path.open("r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+        return None
+    if payload.get("version") != SEARCH_INDEX_VERSION or state.get("base") != payload.get("fingerprint"):
+        return None
+
+    index = DescriptionIndex(state.get("fingerprint"))
+    index.base = payload["fingerprint"]
+    index.rows = payload["rows"]
+    index.last_label = payload.get("last_label")
+    index.postings = payload["postings"]
+    index.vocabulary = sorted(index.postings)
+    return index
+
+
+def _current(file_path, token: str) -> DescriptionIndex | None:
+    """Return the index (memory, then sidecar) matching a fingerprint token."""
+    index = _MEMORY.get(_key(file_path))
+    if index is not None and index.fingerprint == token:
+        return index
+    index = _read_sidecar(file_path)
+    if index is not None and index.fingerprint == token:
+        _MEMORY[_key(file_path)] = index
+        return index
+    return None
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+def get_search_index(file_path=None) -> tuple[DescriptionIndex, pd.DataFrame]:
+    """
+    Return the up-to-date index for a ledger together with the frame it describes.
+
+    Args:
+        file_path (str | Path | None): Ledger path (defaults to the main data file).
+
+    Returns:
+        tuple[DescriptionIndex, pd.DataFrame]: Index and the shared (read-only) ledger frame.
+    """
+    backend = get_backend(file_path)
+    backend.ensure_exists()
+    token = fingerprint_token(backend.fingerprint())
+    df = expense_store.get(backend.path, copy=False)
+
+    with _LOCK:
+        index = _current(backend.path, token)
+        if index is not None and len(df) > index.rows:
+            index.add_frame(df.iloc[index.rows:])  # catch up on appended rows
+            _persist(backend.path, index)
+        elif index is None or len(df) < index.rows:
+            index = DescriptionIndex(token)
+            index.add_frame(df)
+            _persist(backend.path, index)
+        _MEMORY[_key(backend.path)] = index
+    return index, df
+
+
+@instrumented()
+def search_expenses(query: str, file_path=None, prefix: bool = True) -> pd.DataFrame:
+    """
+    Find expenses whose Description contains every word of `query`.
+
+    Args:
+        query (str): Words to search for, e.g. "hello steel".
+        file_path (str | Path | None): Ledger path (defaults to the main data file).
+        prefix (bool): Match words by prefix ("ste" finds "steel").
+
+    Returns:
+        pd.DataFrame: Matching rows in ledger order.
+    """
+    index, df = get_search_index(file_path)
+    positions = df.index.get_indexer(index.search(query, prefix=prefix))
+    return df.iloc[np.sort(positions[positions >= 0])]
+
+
+def record_append(file_path, before: tuple, after: tuple) -> None:
+    """
+    Advance the index past an append made through data_manager.append_expenses().
+
+    Appended rows land at the end of the frame for CSV and SQLite ledgers, so
+    they are indexed on the next search. Partitioned ledgers may insert into
+    earlier months, so their index is left to rebuild.
+    """
+    if get_backend(file_path).name == "partitioned":
+        return
+    with _LOCK:
+        index = _current(file_path, fingerprint_token(before))
+        if index is None:
+            return
+        index.fingerprint = fingerprint_token(after)
+        if index.base is not None:
+            try:
+                _write_state(file_path, index)
+            except OSError as e:
+                print(f"⚠️ Could not write search index: {e}")
+
+
+def record_edit(file_path, old: pd.DataFrame, new: pd.DataFrame, before: tuple, after: tuple) -> None:
+    """
+    Re-index rows changed by data_manager.edit_expenses() in O(changed rows).
+
+    The persisted sidecar no longer matches the in-memory index afterwards,
+    so its state file is dropped; the next process rebuilds from the ledger.
+    """
+    with _LOCK:
+        index = _current(file_path, fingerprint_token(before))
+        if index is None:
+            return
+        if index.last_label is None or (len(old) and int(old.index.max()) > index.last_label):
+            _MEMORY.pop(_key(file_path), None)  # edited rows not indexed yet: rebuild on next search
+            return
+
+        replacements = new["Description"].reindex(old.index).astype(object)
+        replacements = replacements.where(replacements.notna(), None)
+        index.replace_rows(old.index, old["Description"], replacements)
+        index.rows += len(new) - len(old)
+        index.fingerprint = fingerprint_token(after)
+        index.base = None
+        _MEMORY[_key(file_path)] = index
+        sidecar_paths(file_path)[1].unlink(missing_ok=True)
+
+
+def invalidate_search_index(file_path=None) -> None:
+    """Forget the in-memory index for a ledger (the sidecar is re-validated on next search)."""
+    with _LOCK:
+        _MEMORY.pop(_key(file_path), None)
@@ -0,0 +1,204 @@
+# src/snapshot_cache.py
+"""
+Module: snapshot_cache
+----------------------
+Persists the parsed expense DataFrame between runs so a cold start does not
+re-parse the whole CSV.
+
+How it works:
+    - A pickled snapshot under config.CACHE_DIR stores the cleaned DataFrame,
+      the byte offset of the CSV it covers and a hash of those bytes.
+    - On load, if the file prefix still hashes the same, only the bytes
+      appended after that offset are parsed and added to the snapshot.
+    - If the prefix changed (hand edit, rewrite), the snapshot is rebuilt.
+
+Used by data_manager.load_expenses() for large ledgers.
+"""
+
+import hashlib
+import io
+import os
+import pickle
+import pandas as pd
+from pathlib import Path
+from src.data_manager import DEFAULT_HEADERS, TEXT_DTYPES, clean_expenses
+
+
+SNAPSHOT_VERSION = 2  # v2: snapshots hold rows kept by the multi-format date parser
+HASH_BLOCK_SIZE = 1 << 20
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def snapshot_path(file_path: str | Path) -> Path:
+    """Return the snapshot file used for a given ledger."""
+    from src import config  # dynamic import keeps CACHE_DIR patchable
+
+    resolved = Path(file_path).resolve()
+    digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()[:16]
+    return Path(config.CACHE_DIR) / f"{resolved.stem}-{digest}.snapshot.pkl"
+
+
+def _fingerprint(file_path: Path) -> tuple:
+    st = file_path.stat()
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _hash_prefix(file_path: Path, length: int):
+    """Return a blake2b hasher fed with the first `length` bytes of the file."""
+    hasher = hashlib.blake2b(digest_size=20)
+    remaining = length
+    with file_path.open("rb") as f:
+        while remaining > 0:
+            block = f.read(min(HASH_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            hasher.update(block)
+            remaining -= len(block)
+    return hasher
+
+
+def _parse_block(data: bytes, header: list[str] | None, start_row: int) -> tuple[pd.DataFrame, int, list[str]]:
+    """
+    Parse a block of CSV bytes into a cleaned DataFrame.
+
+    Args:
+        data (bytes): CSV content (with a header line if `header` is None).
+        header (list[str] | None): Column names for headerless tail blocks.
+        start_row (int): Raw row number of the first data row (keeps the index stable).
+
+    Returns:
+        tuple: (cleaned DataFrame, number of raw rows parsed, header columns)
+    """
+    if not data.strip():
+        return pd.DataFrame(columns=header or []), 0, header or []
+
+    if header is None:
+        raw = pd.read_csv(io.BytesIO(data), dtype=TEXT_DTYPES)
+    else:
+        raw = pd.read_csv(io.BytesIO(data), header=None, names=header, dtype=TEXT_DTYPES)
+
+    raw.index = pd.RangeIndex(start_row, start_row + len(raw))
+    columns = list(raw.columns)
+    return clean_expenses(raw), len(raw), columns
+
+
+def _concat(frames: list[pd.DataFrame], header: list[str]) -> pd.DataFrame:
+    """Stack cleaned frames, keeping columns absent from the file as None (like a full parse)."""
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return clean_expenses(pd.DataFrame())
+    if len(frames) == 1:
+        return frames[0]
+
+    df = pd.concat(frames)
+    for col in DEFAULT_HEADERS:
+        if col not in header:
+            df[col] = None
+    return df
+
+
+def _read_snapshot(path: Path) -> dict | None:
+    try:
+        with path.open("rb") as f:
+            snap = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    return snap if isinstance(snap, dict) and snap.get("version") == SNAPSHOT_VERSION else None
+
+
+def _write_snapshot(path: Path, snap: dict) -> None:
+    """Write the snapshot atomically (best effort; a failed write only costs a re-parse)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(snap, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ Could not write snapshot cache: {e}")
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🔁 Snapshot Build / Replay
+# ----------------------------------------------------------------------------------------------------
+def _full_rebuild(file_path: Path) -> tuple[dict | None, bytes]:
+    """Parse the complete file and return (snapshot, trailing partial line bytes)."""
+    data = file_path.read_bytes()
+    covered = data.rfind(b"\n") + 1
+    if covered == 0:
+        return None, data
+
+    df, raw_rows, header = _parse_block(data[:covered], None, 0)
+    snap = {
+        "version": SNAPSHOT_VERSION,
+        "source": str(file_path),
+        "fingerprint": None,
+        "offset": covered,
+        "prefix_hash": hashlib.blake2b(data[:covered], digest_size=20).hexdigest(),
+        "header": header,
+        "raw_rows": raw_rows,
+        "df": df,
+    }
+    return snap, data[covered:]
+
+
+def load_with_snapshot(file_path: str | Path) -> pd.DataFrame:
+    """
+    Load a ledger through its persisted snapshot, parsing only the new tail.
+
+    Args:
+        file_path (str | Path): Path to the expense CSV.
+
+    Returns:
+        pd.DataFrame: Cleaned expense DataFrame (same result as a full parse).
+    """
+    file_path = Path(file_path).resolve()
+    snap_file = snapshot_path(file_path)
+    fingerprint = _fingerprint(file_path)
+    snap = _read_snapshot(snap_file)
+    remainder = b""
+
+    usable = snap is not None and snap["source"] == str(file_path)
+
+    if usable and snap["fingerprint"] == fingerprint:
+        # Unchanged since the snapshot was written: only a trailing partial line may remain
+        with file_path.open("rb") as f:
+            f.seek(snap["offset"])
+            remainder = f.read()
+    else:
+        hasher = None
+        if usable and fingerprint[2] >= snap["offset"]:
+            hasher = _hash_prefix(file_path, snap["offset"])
+
+        if hasher is not None and hasher.hexdigest() == snap["prefix_hash"]:
+            # Prefix intact: replay only the appended bytes
+            with file_path.open("rb") as f:
+                f.seek(snap["offset"])
+                tail = f.read()
+            covered = tail.rfind(b"\n") + 1
+            tail_df, tail_rows, _ = _parse_block(tail[:covered], snap["header"], snap["raw_rows"])
+            hasher.update(tail[:covered])
+
+            snap.update(
+                offset=snap["offset"] + covered,
+                prefix_hash=hasher.hexdigest(),
+                raw_rows=snap["raw_rows"] + tail_rows,
+                df=_concat([snap["df"], tail_df], snap["header"]),
+                fingerprint=fingerprint,
+            )
+            _write_snapshot(snap_file, snap)
+            remainder = tail[covered:]
+        else:
+            # Missing, stale or edited out-of-band: rebuild from scratch
+            snap, remainder = _full_rebuild(file_path)
+            if snap is None:
+                return clean_expenses(pd.read_csv(file_path, dtype=TEXT_DTYPES))
+            snap["fingerprint"] = fingerprint
+            _write_snapshot(snap_file, snap)
+
+    if remainder.strip():
+        partial_df, _, _ = _parse_block(remainder, snap["header"], snap["raw_rows"])
+        return _concat([snap["df"], partial_df], snap["header"])
+    return snap["df"]
@@ -0,0 +1,274 @@
+# src/sqlite_backend.py
+"""
+Module: sqlite_backend
+----------------------
+SQLite storage backend for the expense ledger (stdlib sqlite3 only).
+
+Selected automatically by data_manager.get_backend() when the ledger path
+ends in .db / .sqlite / .sqlite3, e.g. set config.DATA_FILE to
+DATA_DIR / "Expenses.db".
+
+Features:
+    - Indexed on Date, Category (case-insensitive) and Payment_Mode.
+    - Inserts run inside a single transaction.
+    - Query filters, sort keys and limits are pushed down as indexed SQL.
+    - Row ids (the primary key) are AUTOINCREMENT, so the id of a deleted
+      expense is never handed out again (older databases are migrated).
+    - CSV stays the import/export format (see import_expenses.py and
+      data_manager.export_expenses_csv()).
+"""
+
+import sqlite3
+from contextlib import closing
+from datetime import date, datetime
+from pathlib import Path
+import pandas as pd
+from src.data_manager import DEFAULT_HEADERS, clean_expenses
+from src.query_engine import as_list, normalize_filters, to_timestamp
+from src.utils import parse_date
+
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS expenses (
+        id           INTEGER PRIMARY KEY AUTOINCREMENT,
+        Date         TEXT,
+        Category     TEXT,
+        Description  TEXT,
+        Amount       REAL NOT NULL DEFAULT 0,
+        Payment_Mode TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses (Date)",
+    "CREATE INDEX IF NOT EXISTS idx_expenses_category ON expenses (Category COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS idx_expenses_payment_mode ON expenses (Payment_Mode)",
+)
+
+SELECT_COLUMNS = ", ".join(["id", *DEFAULT_HEADERS])
+
+# Databases whose schema was already created in this process
+_READY: set[str] = set()
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def _normalize_date(value):
+    """Store dates as ISO text so range queries can use the Date index."""
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m-%d")
+    text = "" if value is None else str(value).strip()
+    if not text:
+        return None
+    return parse_date(text) or text
+
+
+def _entry_to_params(entry: dict) -> tuple:
+    normalized = {str(k).strip().replace(" ", "_"): v for k, v in entry.items()}
+    values = [None if normalized.get(col) in (None, "") else normalized.get(col) for col in DEFAULT_HEADERS]
+    values[0] = _normalize_date(values[0])
+    return tuple(values)
+
+
+def _needs_autoincrement(conn: sqlite3.Connection) -> bool:
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'expenses'").fetchone()
+    return row is not None and "AUTOINCREMENT" not in row[0].upper()
+
+
+def _migrate_autoincrement(conn: sqlite3.Connection) -> bool:
+    """
+    Rebuild an expenses table created without AUTOINCREMENT, keeping every id.
+
+    Without it SQLite reuses the highest id after that row is deleted, so a
+    client holding the id of a deleted expense could edit a new one.
+
+    Returns:
+        bool: True if the table was migrated.
+    """
+    if not _needs_autoincrement(conn):
+        return False
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if not _needs_autoincrement(conn):  # another process migrated it first
+            conn.rollback()
+            return False
+        conn.execute("ALTER TABLE expenses RENAME TO expenses_old")
+        for statement in SCHEMA[:1]:
+            conn.execute(statement)
+        conn.execute(f"INSERT INTO expenses ({SELECT_COLUMNS}) SELECT {SELECT_COLUMNS} FROM expenses_old")
+        conn.execute("DROP TABLE expenses_old")  # drops the old indexes with it
+        for statement in SCHEMA[1:]:
+            conn.execute(statement)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return True
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with `prefix`."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🗄️ Backend
+# ----------------------------------------------------------------------------------------------------
+class SQLiteBackend:
+    """SQLite ledger with the same interface as data_manager.CSVBackend."""
+
+    name = "sqlite"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def ensure_exists(self) -> None:
+        key = str(self.path.resolve())
+        if key in _READY and self.path.exists():
+            return
+
+        created = not self.path.exists()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self.connect()) as conn:
+            with conn:
+                for statement in SCHEMA:
+                    conn.execute(statement)
+            _migrate_autoincrement(conn)
+        _READY.add(key)
+        if created:
+            print(f"✅ Created new database: {self.path}")
+
+    def fingerprint(self) -> tuple:
+        """File identity plus SQLite's header change counter (bumped on every commit)."""
+        st = self.path.stat()
+        with self.path.open("rb") as f:
+            f.seek(24)
+            change_counter = f.read(4)
+        wal = self.path.with_name(self.path.name + "-wal")
+        wal_key = (wal.stat().st_size, wal.stat().st_mtime_ns) if wal.exists() else None
+        return (st.st_dev, st.st_ino, st.st_size, change_counter, wal_key)
+
+    def _read(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        with closing(self.connect()) as conn:
+            df = pd.read_sql_query(sql, conn, params=params, index_col="id")
+        df.index.name = None
+        return clean_expenses(df)
+
+    def load(self) -> pd.DataFrame:
+        return self._read(f"SELECT {SELECT_COLUMNS} FROM expenses ORDER BY id")
+
+    def iter_chunks(self, chunksize: int):
+        with closing(self.connect()) as conn:
+            sql = f"SELECT {SELECT_COLUMNS} FROM expenses ORDER BY id"
+            for chunk in pd.read_sql_query(sql, conn, index_col="id", chunksize=chunksize):
+                chunk.index.name = None
+                yield clean_expenses(chunk)
+
+    def save(self, df: pd.DataFrame) -> None:
+        df = df.copy()
+        if "Date" in df.columns and pd.api.types.is_datetime64_any_dtype(df["Date"]):
+            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
+        rows = (_entry_to_params(record) for record in df.to_dict("records"))
+
+        with closing(self.connect()) as conn, conn:
+            conn.execute("DELETE FROM expenses")
+            conn.executemany(f"INSERT INTO expenses ({', '.join(DEFAULT_HEADERS)}) VALUES (?, ?, ?, ?, ?)", rows)
+
+    def fetch(self, row_ids) -> pd.DataFrame:
+        row_ids = [int(row_id) for row_id in row_ids]
+        placeholders = ", ".join("?" * len(row_ids))
+        return self._read(f"SELECT {SELECT_COLUMNS} FROM expenses WHERE id IN ({placeholders}) ORDER BY id",
+                          tuple(row_ids))
+
+    def edit(self, updates: dict, deletes) -> None:
+        """Apply replacements (id → entry) and deletions by primary key in one transaction."""
+        assignments = ", ".join(f"{col} = ?" for col in DEFAULT_HEADERS)
+        with closing(self.connect()) as conn, conn:
+            conn.executemany(f"UPDATE expenses SET {assignments} WHERE id = ?",
+                             [(*_entry_to_params(entry), int(row_id)) for row_id, entry in updates.items()])
+            conn.executemany("DELETE FROM expenses WHERE id = ?", [(int(row_id),) for row_id in deletes])
+
+    def append(self, entries) -> int:
+        with closing(self.connect()) as conn, conn:
+            cursor = conn.executemany(
+                f"INSERT INTO expenses ({', '.join(DEFAULT_HEADERS)}) VALUES (?, ?, ?, ?, ?)",
+                (_entry_to_params(entry) for entry in entries),
+            )
+            return cursor.rowcount
+
+    def select_sql(self, sort_by=None, descending=False, limit: int | None = None, **filters) -> tuple[str, tuple]:
+        """
+        Build the filtered SELECT (kept separate so the plan can be inspected).
+
+        Accepts the same keywords as query_engine.query_expenses(); every
+        filter, the sort keys and the limit are pushed down to SQLite.
+
+        Returns:
+            tuple[str, tuple]: SQL text and its parameters.
+        """
+        filters = normalize_filters(**filters)
+        clauses, params = [], []
+
+        categories = as_list(filters.get("categories"))
+        if categories and len(categories) == 1:
+            clauses.append("Category = ? COLLATE NOCASE")
+            params.append(str(categories[0]).strip())
+        elif categories:
+            clauses.append(f"Category COLLATE NOCASE IN ({', '.join('?' * len(categories))})")
+            params.extend(str(c).strip() for c in categories)
+
+        payment_modes = as_list(filters.get("payment_modes"))
+        if payment_modes:
+            clauses.append(f"Payment_Mode COLLATE NOCASE IN ({', '.join('?' * len(payment_modes))})")
+            params.extend(str(m).strip() for m in payment_modes)
+
+        month = filters.get("month")
+        if month:
+            clauses.append("Date >= ? AND Date < ?")
+            params.extend([month, _prefix_upper_bound(month)])
+
+        start, end = to_timestamp(filters.get("start")), to_timestamp(filters.get("end"))
+        if start is not None:
+            clauses.append("Date >= ?")
+            params.append(start.strftime("%Y-%m-%d"))
+        if end is not None:
+            clauses.append("Date < ?")
+            params.append((end.normalize() + pd.Timedelta(days=1)).strftime("%Y-%m-%d"))
+
+        if filters.get("min_amount") is not None:
+            clauses.append("Amount >= ?")
+            params.append(float(filters["min_amount"]))
+        if filters.get("max_amount") is not None:
+            clauses.append("Amount <= ?")
+            params.append(float(filters["max_amount"]))
+
+        description = filters.get("description")
+        if description:
+            escaped = description.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("Description LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+
+        if limit is not None:
+            # Undated rows are dropped after reading, so keep them out of the limit
+            clauses.append("Date IS NOT NULL")
+
+        keys = [key for key in (as_list(sort_by) or []) if key in DEFAULT_HEADERS]
+        if isinstance(descending, (list, tuple)):
+            directions = [bool(d) for d in descending] + [False] * (len(keys) - len(descending))
+        else:
+            directions = [bool(descending)] * len(keys)
+        order = [f"{key} {'DESC' if desc else 'ASC'}" for key, desc in zip(keys, directions)] + ["id"]
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT {SELECT_COLUMNS} FROM expenses{where} ORDER BY {', '.join(order)}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return sql, tuple(params)
+
+    def query(self, **query) -> pd.DataFrame:
+        sql, params = self.select_sql(**query)
+        return self._read(sql, params)
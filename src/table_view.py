@@ -0,0 +1,171 @@
+# src/table_view.py
+"""
+Module: table_view
+------------------
+Fast fixed-width table output for expense frames.
+
+Unlike tabulate(), which builds the whole table as one string, rows are
+formatted a chunk at a time and written straight to the output stream, so
+printing starts immediately and memory stays bounded by the chunk size.
+
+Structure:
+    1. column_widths() / iter_table_lines()  → Formatting (pure, testable)
+    2. print_table()                         → Streams a frame to stdout
+    3. paginate()                            → Interactive pager (next/prev/jump)
+"""
+
+import sys
+import pandas as pd
+
+
+# Longest cell shown per column; longer text is cut with "…"
+MAX_COLUMN_WIDTH = 40
+
+# Rows formatted per batch when streaming
+STREAM_CHUNK_ROWS = 1_000
+
+DEFAULT_PAGE_SIZE = 20
+ID_COLUMN = "ID"  # stable row IDs are shown as plain integers
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Formatting
+# ----------------------------------------------------------------------------------------------------
+def _format_column(values: pd.Series) -> pd.Series:
+    """Render one column as display strings (dates as YYYY-MM-DD, numbers with 2 decimals)."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime("%Y-%m-%d").fillna("")
+    if values.name == ID_COLUMN and pd.api.types.is_integer_dtype(values):
+        return values.astype(str)
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.map(lambda v: "" if pd.isna(v) else f"{v:.2f}")
+    return values.astype(object).where(values.notna(), "").astype(str)
+
+
+def _fit(text: str, width: int, right: bool) -> str:
+    if len(text) > width:
+        text = text[: width - 1] + "…"
+    return text.rjust(width) if right else text.ljust(width)
+
+
+def column_widths(df: pd.DataFrame, max_width: int = MAX_COLUMN_WIDTH) -> dict[str, int]:
+    """
+    Compute display widths from distinct values and min/max amounts (no table is built).
+
+    Args:
+        df (pd.DataFrame): Frame to display.
+        max_width (int): Upper bound per column.
+
+    Returns:
+        dict[str, int]: Column → width.
+    """
+    widths = {}
+    for col in df.columns:
+        values = df[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            longest = 10
+        elif pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values) and len(values):
+            longest = max(len(f"{values.min():.2f}"), len(f"{values.max():.2f}"))
+        else:
+            # Measure each distinct value once (categories repeat heavily)
+            longest = max(map(len, map(str, pd.unique(values.dropna()))), default=0)
+        widths[col] = min(max(len(str(col)), longest), max_width)
+    return widths
+
+
+def iter_table_lines(df: pd.DataFrame, widths: dict[str, int] | None = None, chunk_rows: int = STREAM_CHUNK_ROWS):
+    """
+    Yield the table line by line: border, header, border, rows, border.
+
+    Args:
+        df (pd.DataFrame): Frame to display (index is not shown).
+        widths (dict | None): Precomputed column widths (default: column_widths(df)).
+        chunk_rows (int): Rows formatted per batch.
+
+    Yields:
+        str: One output line (without newline).
+    """
+    widths = widths or column_widths(df)
+    columns = list(df.columns)
+    right = [pd.api.types.is_numeric_dtype(df[col]) for col in columns]
+    border = "+" + "+".join("-" * (widths[col] + 2) for col in columns) + "+"
+
+    yield border
+    yield "| " + " | ".join(_fit(str(col), widths[col], False) for col in columns) + " |"
+    yield border.replace("-", "=")
+
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        cells = [_format_column(chunk[col]).tolist() for col in columns]
+        for row in zip(*cells):
+            yield "| " + " | ".join(
+                _fit(text, widths[col], is_right) for text, col, is_right in zip(row, columns, right)
+            ) + " |"
+
+    yield border
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+def print_table(df: pd.DataFrame, out=None, widths: dict[str, int] | None = None) -> None:
+    """
+    Stream a frame to `out` (stdout by default) as a fixed-width grid.
+
+    Args:
+        df (pd.DataFrame): Frame to display.
+        out (TextIO | None): Destination stream.
+        widths (dict | None): Precomputed column widths.
+    """
+    out = out or sys.stdout
+    for line in iter_table_lines(df, widths):
+        out.write(line + "\n")
+    out.flush()
+
+
+def paginate(df: pd.DataFrame, page_size: int = DEFAULT_PAGE_SIZE, input_fn=input, out=None) -> None:
+    """
+    Page through a frame interactively.
+
+    Commands: [n]ext, [p]rev, [j]ump <page>, [s]ize <rows>, [a]ll (stream the rest), [q]uit.
+
+    Args:
+        df (pd.DataFrame): Frame to display.
+        page_size (int): Rows per page.
+        input_fn (Callable): Prompt function (injectable for tests).
+        out (TextIO | None): Destination stream.
+    """
+    out = out or sys.stdout
+    widths = column_widths(df)  # computed once so every page lines up
+    page_size = max(1, page_size)
+    page = 0
+
+    while True:
+        pages = max(1, -(-len(df) // page_size))
+        page = min(max(page, 0), pages - 1)
+        print_table(df.iloc[page * page_size:(page + 1) * page_size], out=out, widths=widths)
+        out.write(f"Page {page + 1}/{pages} · {len(df)} rows\n")
+
+        if pages == 1:
+            return
+
+        command, _, arg = input_fn("[n]ext [p]rev [j]ump <page> [s]ize <rows> [a]ll [q]uit: ").strip().lower().partition(" ")
+        if command in ("", "n"):
+            if page == pages - 1:
+                return
+            page += 1
+        elif command == "p":
+            page -= 1
+        elif command == "j" and arg.strip().isdigit():
+            page = int(arg) - 1
+        elif command == "s" and arg.strip().isdigit() and int(arg) > 0:
+            first_row = page * page_size
+            page_size = int(arg)
+            page = first_row // page_size
+        elif command == "a":
+            print_table(df.iloc[(page + 1) * page_size:], out=out, widths=widths)
+            return
+        elif command == "q":
+            return
+        else:
+            out.write("⚠️ Invalid command.\n")
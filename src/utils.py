@@ -6,15 +6,21 @@ Common helper utilities shared across modules:
     - Date parsing and formatting.
     - Currency formatting.
     - Input validation and conversion.
+    - Iteration helpers for batched processing.
 """
 
 from datetime import datetime, date
+from itertools import islice
 from src.config import DEFAULT_CURRENCY, get_currently_symbol
 
 
 # ----------------------------------------------------------------------------------------------------
 # Date Utilities
 # ----------------------------------------------------------------------------------------------------
+# Accepted input formats, tried in order (see date_parser.parse_dates() for whole columns)
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%b %d, %Y", "%d %b %Y")
+
+
 def parse_date(text: str):
     """
     Parse a text input into a standard ISO date string (YYYY-MM-DD).
@@ -31,9 +37,7 @@ def parse_date(text: str):
         return date.today().isoformat()
     
     text = text.strip()
-    formats = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%b %d, %Y", "%d %b %Y")
-
-    for fmt in formats:
+    for fmt in DATE_FORMATS:
         try:
             dt = datetime.strptime(text, fmt)
             return dt.date().isoformat()
@@ -102,4 +106,30 @@ def safe_float(value, default=0.0):
     try:
         return float(value)
     except (ValueError, TypeError):
-        return default
\ No newline at end of file
+        return default
+
+
+
+# ----------------------------------------------------------------------------------------------------
+# Iteration Utilities
+# ----------------------------------------------------------------------------------------------------
+def chunked(iterable, size):
+    """
+    Yield successive lists of at most `size` items from any iterable.
+
+    Args:
+        iterable (Iterable): Source items (consumed lazily).
+        size (int): Maximum items per chunk (must be >= 1).
+
+    Yields:
+        list: Next chunk of items.
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -8,49 +8,83 @@ Structure:
     1. get_expenses_df()            → Core Logic (Pure Function)
     2. view_expenses_interactive()  → CLI interface
     3. helper functions             → Sorting/Filtering utilities
+
+Filtering, multi-key sorting and limits are delegated to the storage
+backend (see query_engine.py); results are shown page by page with the
+streaming formatter in table_view.py.
 """
 
 import pandas as pd
-from tabulate import tabulate
 from pathlib import Path
-from src.data_manager import ensure_csv_exists, get_data_file
+from src.data_manager import DEFAULT_HEADERS, ensure_csv_exists, get_backend
+from src.search_index import search_expenses
+from src.table_view import paginate
 
 
 # -------------------------------------------------------------------------------------------------
 # 🧠 CORE DATA FUNCTION (Pure / Testable)
 # -------------------------------------------------------------------------------------------------
-def get_expenses_df(category=None, month=None, sort_by=None, descending=False, file_path=None):
+def get_expenses_df(category=None, month=None, sort_by=None, descending=False, file_path=None, limit=None,
+                    with_ids=False, **filters):
     """
-    Load and optionally filter or sort expenses from the CSV.
+    Load (via the storage backend / shared store) and optionally filter or sort expenses.
 
     Parameters:
         category (str, optional): Filter by category.
         month (str, Optional): Filter by month (format: "YYYY-MM").
-        sort_by (str, optional): Column name to sort by ("Amount" or "Date").
-        decending (bool): Whether to sort in decending order.
+        sort_by (str | list[str], optional): Column(s) to sort by ("Amount", "Date", ...).
+        decending (bool | list[bool]): Whether to sort in decending order (per key if a list).
         file_path (Path or str, optional): CSV file to load.
+        limit (int, optional): Return only the first N rows.
+        with_ids (bool): Add an "ID" column with each row's stable ID (used by edit / delete).
+        **filters: Further query_engine filters (categories, payment_modes, start, end,
+            min_amount, max_amount, description).
 
     Return:
         pd.DataFrame: Filtered and/or sorted expense DataFrame.
     """
-    ensure_csv_exists()
-    file_path = Path(file_path or get_data_file())
-    df = pd.read_csv(file_path)
+    # ---- Filters, sorting and limit (pushed down to the storage backend) ----
+    df = get_backend(file_path).query(category=category, month=month, sort_by=sort_by,
+                                      descending=descending, limit=limit, **filters)
 
-    # ---- Filters ----
-    if category:
-        df = df[df["Category"].str.lower() == category.lower()]
+    # ✅ Always return DataFrame (not None)
+    if with_ids:
+        return df.rename_axis("ID").reset_index()
+    return df.reset_index(drop=True)
 
-    if month:
-        df = df[df["Date"].astype(str).str.startswith(month)]
 
-    # ---- Sorting ----
-    if sort_by and sort_by in df.columns:
-        df = df.sort_values(by=sort_by, ascending=not descending)
+def _prompt_custom_query() -> dict:
+    """Ask for each query_engine option (blank skips it) and return get_expenses_df() keywords."""
+    def _split(text):
+        return [part.strip() for part in text.split(",") if part.strip()] or None
+
+    def _number(text):
+        return float(text) if text else None
+
+    query = {
+        "categories": _split(input("Categories (comma-separated): ")),
+        "payment_modes": _split(input("Payment modes (comma-separated): ")),
+        "start": input("From date (YYYY-MM-DD): ").strip() or None,
+        "end": input("To date (YYYY-MM-DD): ").strip() or None,
+        "min_amount": _number(input("Minimum amount: ").strip()),
+        "max_amount": _number(input("Maximum amount: ").strip()),
+        "description": input("Description contains: ").strip() or None,
+    }
+
+    # "Amount desc, Date" → sort by Amount (high → low), then Date (old → new)
+    columns = {col.lower(): col for col in DEFAULT_HEADERS}
+    sort_keys, directions = [], []
+    for part in _split(input("Sort by (e.g. 'Amount desc, Date'): ")) or []:
+        column, _, direction = part.partition(" ")
+        if column.lower() in columns:
+            sort_keys.append(columns[column.lower()])
+            directions.append(direction.strip().lower() == "desc")
+    query["sort_by"], query["descending"] = sort_keys or None, directions or False
+
+    limit = input("Limit rows: ").strip()
+    query["limit"] = int(limit) if limit else None
+    return query
 
-    # ✅ Always return DataFrame (not None)
-    return df.reset_index(drop=True)
-    
 
 # -------------------------------------------------------------------------------------------------
 # 💬 INTERACTIVE VIEW (CLI Layer)
@@ -60,7 +94,7 @@ def view_expenses_interactive():
     CLI Function for viewing, filtering, and sorting expenses.
     """
     ensure_csv_exists()
-    df = get_expenses_df()
+    df = get_expenses_df(with_ids=True)
 
     if df.empty:
         print("⚠️ No expenses recorded yet.")
@@ -73,23 +107,34 @@ def view_expenses_interactive():
         print("3. Filter by Month (YYYY-MM)")
         print("4. Sort by Amount (High → Low)")
         print("5. Sort by Date (Newest → Oldest)")
-        print("6. Return to Main Menu")
+        print("6. Custom Query")
+        print("7. Search Descriptions")
+        print("8. Return to Main Menu")
 
-        choice = input("Choose an option (1-6): ").strip()
+        choice = input("Choose an option (1-8): ").strip()
 
         if choice == "1":
             filtered_df = df
         elif choice == "2":
             category = input("Enter Category Name: ").strip()
-            filtered_df = get_expenses_df(category=category)
+            filtered_df = get_expenses_df(category=category, with_ids=True)
         elif choice == "3":
             month = input("Enter Month (YYYY-MM): ").strip()
-            filtered_df = get_expenses_df(month=month)
+            filtered_df = get_expenses_df(month=month, with_ids=True)
         elif choice == "4":
-            filtered_df = get_expenses_df(sort_by="Amount", descending=True)
+            filtered_df = get_expenses_df(sort_by="Amount", descending=True, with_ids=True)
         elif choice == "5":
-            filtered_df = get_expenses_df(sort_by="Date", descending=True)
+            filtered_df = get_expenses_df(sort_by="Date", descending=True, with_ids=True)
         elif choice == "6":
+            try:
+                filtered_df = get_expenses_df(with_ids=True, **_prompt_custom_query())
+            except ValueError as e:
+                print(f"⚠️ Invalid query: {e}")
+                continue
+        elif choice == "7":
+            words = input("Search words (all must match, prefixes allowed): ").strip()
+            filtered_df = search_expenses(words).rename_axis("ID").reset_index()
+        elif choice == "8":
             print("Returning to Main Main...")
             break
         else:
@@ -101,13 +146,8 @@ def view_expenses_interactive():
             print("⚠️ No matching records found.")
             continue
 
-        print("\n" + tabulate(
-            filtered_df,
-            headers="keys",
-            showindex=False,
-            tablefmt="grid",
-            floatfmt=".2f"
-        ))
+        print()
+        paginate(filtered_df)
 
         total = filtered_df["Amount"].sum()
         print(f"\n💰 Total in selection: ₹{total:.2f}")
@@ -8,18 +8,26 @@ Features:
     - All charts saved automatically to /Visuals/
     - In test mode: saved under /logs/Visuals/<timestamp>/
     - Safe label placement (no overlap) and readable black text
+    - render_dashboard(): all charts rendered in parallel from one data load
+    - Unchanged charts served from a content-addressed PNG cache (chart_cache.py)
 """
 
-import os, math, datetime
+import os, math, datetime, time, shutil, functools
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextvars import ContextVar
 from pathlib import Path
 from matplotlib.transforms import Bbox
-from src.data_manager import load_expenses
+from src import chart_cache
+from src.aggregates import AnalyticsBundle, analytics_bundle
+from src.data_manager import expense_store
+from src.instrumentation import instrumented, record
+from src.label_layout import place_labels
 from src.config import (
     DATA_FILE, COLOR_PALETTE, DEFAULT_CURRENCY,
-    TEST_MODE, TEST_VISUALS_DIR, VISUALS_DIR,
     APP_NAME, VERSION, AUTHOR
 )
 
@@ -28,15 +36,10 @@ if __package__ is None or __package__ == "":
     import sys
     sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-from src.data_manager import load_expenses
 from src.config import DATA_FILE, COLOR_PALETTE, DEFAULT_CURRENCY
 
 sns.set(style="whitegrid")
 
-# Directory to store generated charts
-VISUALS_DIR = Path(__file__).resolve().parent.parent / "Visuals"
-VISUALS_DIR.mkdir(parents=True, exist_ok=True)
-
 # Core Configuration
 from src.config import (
     APP_NAME,
@@ -52,36 +55,39 @@ from src.config import (
 # 🧩 Internal Helper: Fetch and Clean Data
 # ----------------------------------------------------------------------------------------------------
 def _get_data(file_path: str | Path = DATA_FILE) -> pd.DataFrame:
-    """Fetch and clean expense data for visualization."""
-    file_path = str(file_path or DATA_FILE)
+    """Fetch and clean expense data for visualization (parsed once via the shared store)."""
     try:
-        df = load_expenses(file_path)
+        df = expense_store.get(file_path or DATA_FILE)
     except Exception:
-        if Path(file_path).exists():
-            df = pd.read_csv(file_path)
-        else:
-            return pd.DataFrame(columns=["Date", "Category", "Description", "Amount"])
+        return pd.DataFrame(columns=["Date", "Category", "Description", "Amount"])
 
     if df.empty:
         return pd.DataFrame(columns=["Date", "Category", "Description", "Amount"])
 
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0)
     df = df.dropna(subset=["Date", "Category"], how="any")
     if df.empty:
         return pd.DataFrame(columns=["Date", "Category", "Description", "Amount"])
 
-    df["Month"] = df["Date"].dt.to_period("M").astype(str)
+    # Month-level views come from the shared analytics bundle (see aggregates.analytics_bundle)
     return df
 
 
 # ----------------------------------------------------------------------------------------------------
 # 💾 Utility: Save Chart
 # ----------------------------------------------------------------------------------------------------
-def _save_chart(fig, chart_name: str):
+def _visuals_dir() -> Path:
+    from src import config  # dynamic import keeps VISUALS_DIR patchable
+
+    return Path(config.VISUALS_DIR)
+
+
+def _save_chart(fig, chart_name: str) -> Path:
     """
     Save charts in either /Visuals/ or /logs/Visuals/<timestamp>/ depending on TEST_MODE.
     Dynamically checks config.TEST_MODE every call to stay in sync with test environment.
+
+    Returns:
+        Path: Saved PNG.
     """
     from src import config  # dynamic import ensures latest TEST_MODE value
 
@@ -96,28 +102,102 @@ def _save_chart(fig, chart_name: str):
         folder.mkdir(parents=True, exist_ok=True)
         prefix = "\033[93m🟡 [Test Mode]\033[0m"  # Yellow text
     else:
-        folder = VISUALS_DIR
+        folder = _visuals_dir()
         folder.mkdir(parents=True, exist_ok=True)
         prefix = "\033[92m🟢\033[0m"  # Green text
 
     # Sanitize filename and save
-    filename = f"{chart_name.replace(' ', '_')}.png"
-    save_path = folder / filename
+    save_path = folder / _chart_filename(chart_name)
     fig.savefig(save_path, bbox_inches="tight")
     print(f"{prefix} Chart saved → {save_path}")
     plt.close(fig)
 
+    # Remember the render for identical future requests (see cached_chart)
+    cache_key = _ACTIVE_CACHE_KEY.get()
+    if cache_key and not test_mode:
+        chart_cache.store(cache_key, save_path)
+    return save_path
+
+
+def _chart_filename(chart_name: str) -> str:
+    return f"{chart_name.replace(' ', '_')}.png"
+
+
+# ----------------------------------------------------------------------------------------------------
+# ⚡ Utility: Chart Cache
+# ----------------------------------------------------------------------------------------------------
+# Cache key of the chart currently being rendered (read by _save_chart)
+_ACTIVE_CACHE_KEY: ContextVar[str | None] = ContextVar("chart_cache_key", default=None)
+
+
+def cached_chart(chart_name: str):
+    """
+    Decorator turning a drawing function into a saved, cached plot_* chart.
+
+    The drawing function only builds and returns the Figure (None without
+    data); it stays available as `.render` for callers that need the Figure.
+    The decorated function returns the saved PNG's Path (None without data)
+    whether the chart was rendered or served from the cache.
+
+    The cache key covers the chart name, the prepared data's fingerprint and
+    the style configuration. On a hit the cached PNG is copied to /Visuals/
+    without rendering; on a miss the chart is rendered and _save_chart()
+    stores it. Bypassed for show=True, cache=False and test mode.
+    """
+    def decorator(func):
+        def draw_and_save(file_path, show, df, bundle) -> Path | None:
+            fig = func(file_path=file_path, show=show, df=df, bundle=bundle)
+            if fig is None:
+                return None
+            if show:
+                plt.show()
+            return _save_chart(fig, chart_name)
+
+        @functools.wraps(func)
+        def wrapper(file_path: str | Path = DATA_FILE, show: bool = False, df: pd.DataFrame | None = None,
+                    bundle: AnalyticsBundle | None = None, cache: bool = True,
+                    data_digest: str | None = None) -> Path | None:
+            from src import config
+
+            df = _get_data(file_path) if df is None else df
+            if show or not cache or config.TEST_MODE or df.empty:
+                return draw_and_save(file_path, show, df, bundle)
+
+            key = chart_cache.chart_key(chart_name, data_digest or chart_cache.data_fingerprint(df))
+            cached = chart_cache.lookup(key)
+            if cached is not None:
+                save_path = _visuals_dir() / _chart_filename(chart_name)
+                save_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(cached, save_path)
+                print(f"\033[92m⚡\033[0m Chart unchanged (cached) → {save_path}")
+                return save_path
+
+            token = _ACTIVE_CACHE_KEY.set(key)
+            try:
+                return draw_and_save(file_path, show, df, bundle)
+            finally:
+                _ACTIVE_CACHE_KEY.reset(token)
+
+        wrapper = instrumented(f"visualization.{func.__name__}")(wrapper)
+        wrapper.chart_name = chart_name
+        wrapper.render = func
+        return wrapper
+    return decorator
+
 
 # ----------------------------------------------------------------------------------------------------
 # 1️⃣ Monthly Spending Overview
 # ----------------------------------------------------------------------------------------------------
-def plot_monthly_spending(file_path: str | Path = DATA_FILE, show: bool = False):
+@cached_chart("Monthly Spending Overview")
+def plot_monthly_spending(file_path: str | Path = DATA_FILE, show: bool = False, df: pd.DataFrame | None = None,
+                          bundle: AnalyticsBundle | None = None):
     plt.close("all")
-    df = _get_data(file_path)
+    df = _get_data(file_path) if df is None else df
     if df.empty:
         return None
 
-    monthly = df.groupby("Month", as_index=False)["Amount"].sum()
+    bundle = analytics_bundle(df) if bundle is None else bundle
+    monthly = bundle.chart_month_totals()
     fig, ax = plt.subplots(figsize=(8, 4))
     sns.barplot(data=monthly, x="Month", y="Amount", hue="Month",
                 palette=COLOR_PALETTE, legend=False, ax=ax)
@@ -127,27 +207,27 @@ def plot_monthly_spending(file_path: str | Path = DATA_FILE, show: bool = False)
     plt.xticks(rotation=45)
     plt.tight_layout()
 
-    if show:
-        plt.show()
-    _save_chart(fig, "Monthly Spending Overview")
     return fig
 
 
 # ----------------------------------------------------------------------------------------------------
 # 2️⃣ Monthly Spending by Category
 # ----------------------------------------------------------------------------------------------------
-def plot_monthly_spending_by_category(file_path: str | Path = DATA_FILE, show: bool = False):
+@cached_chart("Monthly_Spending_by_Category")
+def plot_monthly_spending_by_category(file_path: str | Path = DATA_FILE, show: bool = False, df: pd.DataFrame | None = None,
+                                      bundle: AnalyticsBundle | None = None):
     """
     Plot grouped (side-by-side) bars for each month by category
     enclosed within a faint translucent total box.
     """
     plt.close("all")
-    df = _get_data(file_path)
+    df = _get_data(file_path) if df is None else df
     if df.empty:
         return None
 
-    # --- Aggregate data ---
-    pivot_df = df.pivot_table(index="Month", columns="Category", values="Amount", aggfunc="sum", fill_value=0)
+    # --- Aggregate data (shared month × category pivot) ---
+    bundle = analytics_bundle(df) if bundle is None else bundle
+    pivot_df = bundle.pivot
     monthly_totals = pivot_df.sum(axis=1)
     months = pivot_df.index
     categories = list(pivot_df.columns)
@@ -175,22 +255,8 @@ def plot_monthly_spending_by_category(file_path: str | Path = DATA_FILE, show: b
                edgecolor="gray", linewidth=2, linestyle="--",
                label="_nolegend_" if i > 0 else "Total Spending", zorder=1)
 
-    # --- Bounding-box aware label placement ---
-    label_bboxes = []
-
-    def place_label(x, y, text):
-        """Place labels safely using bbox collision detection."""
-        text_obj = ax.text(x, y, text, ha="center", va="bottom", fontsize=8.5, color="black", zorder=5, clip_on=True)
-        fig.canvas.draw()
-        bbox_new = text_obj.get_window_extent(renderer=fig.canvas.get_renderer()).transformed(ax.transData.inverted())
-        for prev_bbox in label_bboxes:
-            if bbox_new.overlaps(prev_bbox):
-                text_obj.remove()
-                return place_label(x, y + (y_max * 0.03), text)
-        label_bboxes.append(bbox_new)
-        return text_obj
-
-    # --- Category bars and labels ---
+    # --- Category bars ---
+    labels = []
     for idx, cat in enumerate(categories):
         bars = ax.bar([pos + offsets[idx] for pos in x], pivot_df[cat], width=bar_width,
                       color=colors[idx], label=cat, edgecolor="white", zorder=3)
@@ -198,11 +264,14 @@ def plot_monthly_spending_by_category(file_path: str | Path = DATA_FILE, show: b
             height = bar.get_height()
             if height > 0:
                 x_pos = bar.get_x() + bar.get_width() / 2
-                place_label(x_pos, height + (y_max * 0.01), f"₹{int(height)}")
+                labels.append((x_pos, height + (y_max * 0.01), f"₹{int(height)}"))
 
     # --- Total labels ---
     for i, total in enumerate(monthly_totals):
-        place_label(i, total + (y_max * 0.03), f"₹{int(total):,}")
+        labels.append((i, total + (y_max * 0.03), f"₹{int(total):,}"))
+
+    # --- Collision-free label placement (measured once, grid-indexed) ---
+    place_labels(ax, labels, step=y_max * 0.03, fontsize=8.5, color="black", zorder=5, clip_on=True)
 
     # --- Aesthetics ---
     ax.set_title("Monthly Spending by Category (Side-by-Side with Total Outline)")
@@ -214,22 +283,22 @@ def plot_monthly_spending_by_category(file_path: str | Path = DATA_FILE, show: b
     ax.grid(axis="y", linestyle="--", alpha=0.4, zorder=0)
     plt.tight_layout()
 
-    if show:
-        plt.show()
-    _save_chart(fig, "Monthly_Spending_by_Category")
     return fig
 
 
 # ----------------------------------------------------------------------------------------------------
 # 3️⃣ Spending Trend (Line Chart)
 # ----------------------------------------------------------------------------------------------------
-def plot_spending_trend(file_path: str | Path = DATA_FILE, show: bool = False):
+@cached_chart("Spending Trend Over Time")
+def plot_spending_trend(file_path: str | Path = DATA_FILE, show: bool = False, df: pd.DataFrame | None = None,
+                        bundle: AnalyticsBundle | None = None):
     plt.close("all")
-    df = _get_data(file_path)
+    df = _get_data(file_path) if df is None else df
     if df.empty:
         return None
 
-    monthly = df.groupby("Month", as_index=False)["Amount"].sum()
+    bundle = analytics_bundle(df) if bundle is None else bundle
+    monthly = bundle.chart_month_totals()
     fig, ax = plt.subplots(figsize=(8, 4))
     sns.lineplot(data=monthly, x="Month", y="Amount", marker="o", color="teal", ax=ax)
     ax.set_title("Spending Trend Over Time")
@@ -239,45 +308,44 @@ def plot_spending_trend(file_path: str | Path = DATA_FILE, show: bool = False):
     plt.grid(True, linestyle="--", alpha=0.6)
     plt.tight_layout()
 
-    if show:
-        plt.show()
-    _save_chart(fig, "Spending Trend Over Time")
     return fig
 
 
 # ----------------------------------------------------------------------------------------------------
 # 4️⃣ Category Breakdown (Pie)
 # ----------------------------------------------------------------------------------------------------
-def plot_category_breakdown(file_path: str | Path = DATA_FILE, show: bool = False):
+@cached_chart("Category Breakdown")
+def plot_category_breakdown(file_path: str | Path = DATA_FILE, show: bool = False, df: pd.DataFrame | None = None,
+                            bundle: AnalyticsBundle | None = None):
     plt.close("all")
-    df = _get_data(file_path)
+    df = _get_data(file_path) if df is None else df
     if df.empty:
         return None
 
-    category_totals = df.groupby("Category", as_index=False)["Amount"].sum()
+    bundle = analytics_bundle(df) if bundle is None else bundle
+    category_totals = bundle.chart_category_totals()
     fig, ax = plt.subplots(figsize=(6, 6))
     ax.pie(category_totals["Amount"], labels=category_totals["Category"],
            autopct="%1.1f%%", startangle=140, colors=sns.color_palette("pastel"))
     ax.set_title("Spending by Category")
     plt.tight_layout()
 
-    if show:
-        plt.show()
-    _save_chart(fig, "Category Breakdown")
     return fig
 
 
 # ----------------------------------------------------------------------------------------------------
 # 5️⃣ Category Heatmap
 # ----------------------------------------------------------------------------------------------------
-def plot_category_heatmap(file_path: str | Path = DATA_FILE, show: bool = False):
+@cached_chart("Category Heatmap")
+def plot_category_heatmap(file_path: str | Path = DATA_FILE, show: bool = False, df: pd.DataFrame | None = None,
+                          bundle: AnalyticsBundle | None = None):
     plt.close("all")
-    df = _get_data(file_path)
+    df = _get_data(file_path) if df is None else df
     if df.empty:
         return None
 
-    pivot_df = df.pivot_table(index="Category", columns="Month",
-                              values="Amount", aggfunc="sum", fill_value=0)
+    bundle = analytics_bundle(df) if bundle is None else bundle
+    pivot_df = bundle.pivot.T
     fig, ax = plt.subplots(figsize=(10, 6))
     sns.heatmap(pivot_df, annot=True, fmt=".0f", cmap="YlGnBu", ax=ax)
     ax.set_title("Category Spending Heatmap")
@@ -285,18 +353,17 @@ def plot_category_heatmap(file_path: str | Path = DATA_FILE, show: bool = False)
     ax.set_ylabel("Category")
     plt.tight_layout()
 
-    if show:
-        plt.show()
-    _save_chart(fig, "Category Heatmap")
     return fig
 
 
 # ----------------------------------------------------------------------------------------------------
 # 6️⃣ Daily Spending Distribution
 # ----------------------------------------------------------------------------------------------------
-def plot_daily_distribution(file_path: str | Path = DATA_FILE, show: bool = False):
+@cached_chart("Daily Spending Distribution")
+def plot_daily_distribution(file_path: str | Path = DATA_FILE, show: bool = False, df: pd.DataFrame | None = None,
+                            bundle: AnalyticsBundle | None = None):
     plt.close("all")
-    df = _get_data(file_path)
+    df = _get_data(file_path) if df is None else df
     if df.empty:
         return None
 
@@ -307,18 +374,17 @@ def plot_daily_distribution(file_path: str | Path = DATA_FILE, show: bool = Fals
     ax.set_ylabel("Frequency")
     plt.tight_layout()
 
-    if show:
-        plt.show()
-    _save_chart(fig, "Daily Spending Distribution")
     return fig
 
 
 # ----------------------------------------------------------------------------------------------------
 # 7️⃣ Top 5 Expense Items
 # ----------------------------------------------------------------------------------------------------
-def plot_top_expense_items(file_path: str | Path = DATA_FILE, show: bool = False):
+@cached_chart("Top 5 Expense Items")
+def plot_top_expense_items(file_path: str | Path = DATA_FILE, show: bool = False, df: pd.DataFrame | None = None,
+                           bundle: AnalyticsBundle | None = None):
     plt.close("all")
-    df = _get_data(file_path)
+    df = _get_data(file_path) if df is None else df
     if df.empty:
         return None
 
@@ -335,12 +401,124 @@ def plot_top_expense_items(file_path: str | Path = DATA_FILE, show: bool = False
     plt.xticks(rotation=45, ha="right")
     plt.tight_layout()
 
-    if show:
-        plt.show()
-    _save_chart(fig, "Top 5 Expense Items")
     return fig
 
 
+# ----------------------------------------------------------------------------------------------------
+# 🧵 Worker State
+# ----------------------------------------------------------------------------------------------------
+# Prepared data held by each dashboard worker process (sent once per worker)
+_WORKER_DF: pd.DataFrame | None = None
+_WORKER_DIGEST: str | None = None
+_WORKER_BUNDLE: AnalyticsBundle | None = None
+# Config read by _save_chart() / chart_cache, copied into every worker
+_OUTPUT_SETTINGS = ("TEST_MODE", "VISUALS_DIR", "TEST_VISUALS_DIR", "CHART_CACHE_DIR")
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🖼️ Dashboard: Render All Charts in Parallel
+# ----------------------------------------------------------------------------------------------------
+# Chart label → plot function (also drives the interactive menu)
+CHARTS = {
+    "📊 Monthly Spending Overview": plot_monthly_spending,
+    "🧩 Monthly Spending by Category": plot_monthly_spending_by_category,
+    "🥧 Category Breakdown (Pie)": plot_category_breakdown,
+    "📈 Spending Trend Over Time": plot_spending_trend,
+    "🔥 Category Heatmap": plot_category_heatmap,
+    "📅 Daily Spending Distribution": plot_daily_distribution,
+    "💰 Top 5 Expense Items": plot_top_expense_items,
+}
+
+
+def _init_dashboard_worker(df: pd.DataFrame, data_digest: str, bundle: AnalyticsBundle, settings: dict):
+    """Process-pool initializer: headless backend, parent's output settings, shared data."""
+    global _WORKER_DF, _WORKER_DIGEST, _WORKER_BUNDLE
+    from src import config
+
+    plt.switch_backend("Agg")
+    for name, value in settings.items():
+        setattr(config, name, value)
+    _WORKER_DF, _WORKER_DIGEST, _WORKER_BUNDLE = df, data_digest, bundle
+
+
+def _render_chart(label: str, df: pd.DataFrame | None = None, data_digest: str | None = None,
+                  bundle: AnalyticsBundle | None = None) -> float | None:
+    """Render one chart from prepared data; returns seconds taken (None if no data)."""
+    start = time.perf_counter()
+    if df is None:
+        df, data_digest, bundle = _WORKER_DF, _WORKER_DIGEST, _WORKER_BUNDLE
+    saved = CHARTS[label](show=False, df=df, bundle=bundle, data_digest=data_digest)
+    return None if saved is None else time.perf_counter() - start
+
+
+@instrumented()
+def render_dashboard(file_path: str | Path = DATA_FILE, parallel: bool = True,
+                     max_workers: int | None = None) -> dict[str, float | None]:
+    """
+    Load and aggregate the data once, then render every chart, one process per chart.
+
+    Each worker process gets its own Agg backend and saves through _save_chart(),
+    so wall time is close to the slowest chart rather than the sum.
+
+    Args:
+        file_path (str | Path): Path to the expense data file.
+        parallel (bool): Use a process pool (falls back to in-process if unavailable).
+        max_workers (int | None): Pool size (defaults to one per chart, capped at CPU count).
+
+    Returns:
+        dict[str, float | None]: Chart label → render seconds (None if there was no data).
+    """
+    from src import config
+
+    df = _get_data(file_path)
+    if df.empty:
+        return {label: None for label in CHARTS}
+
+    # Fingerprint once for the chart cache; unchanged charts are copied, not re-rendered
+    data_digest = chart_cache.data_fingerprint(df)
+    all_cached = all(chart_cache.lookup(chart_cache.chart_key(func.chart_name, data_digest))
+                     for func in CHARTS.values())
+    if all_cached and not config.TEST_MODE:
+        parallel = False  # nothing to render: skip the pool start-up
+
+    # One month × category aggregation shared by every chart
+    bundle = analytics_bundle(df)
+
+    if parallel:
+        settings = {name: getattr(config, name) for name in _OUTPUT_SETTINGS}
+        workers = max_workers or min(len(CHARTS), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_dashboard_worker,
+                                     initargs=(df, data_digest, bundle, settings)) as pool:
+                futures = {label: pool.submit(_render_chart, label) for label in CHARTS}
+                timings = {label: future.result() for label, future in futures.items()}
+            # Workers keep their own statistics; report their render times here
+            for label, seconds in timings.items():
+                if seconds is not None:
+                    record(f"visualization.{CHARTS[label].__name__}", seconds)
+            return timings
+        except (OSError, BrokenProcessPool) as e:
+            print(f"⚠️ Parallel rendering unavailable ({e}); rendering sequentially.")
+
+    return {label: _render_chart(label, df, data_digest, bundle) for label in CHARTS}
+
+
+def render_dashboard_interactive(file_path: str | Path = DATA_FILE):
+    """CLI wrapper: render all charts and report per-chart and total time."""
+    print("\nRendering all charts ...")
+    start = time.perf_counter()
+    timings = render_dashboard(file_path)
+    elapsed = time.perf_counter() - start
+
+    if all(seconds is None for seconds in timings.values()):
+        print("⚠️ No data available for the dashboard.")
+        return
+
+    for label, seconds in timings.items():
+        print(f"  {label}: {'no data' if seconds is None else f'{seconds:.2f}s'}")
+    print(f"✅ Dashboard rendered in {elapsed:.2f}s\n")
+
+
 # ----------------------------------------------------------------------------------------------------
 # Header Display
 # ----------------------------------------------------------------------------------------------------
@@ -356,55 +534,39 @@ def show_header():
 # 💬 CLI Visualization Menu
 # ----------------------------------------------------------------------------------------------------
 def visualization_interactive(file_path: str | Path = DATA_FILE):
-    options = {
-        "1": ("📊 Monthly Spending Overview", plot_monthly_spending),
-        "2": ("🧩 Monthly Spending by Category", plot_monthly_spending_by_category),
-        "3": ("🥧 Category Breakdown (Pie)", plot_category_breakdown),
-        "4": ("📈 Spending Trend Over Time", plot_spending_trend),
-        "5": ("🔥 Category Heatmap", plot_category_heatmap),
-        "6": ("📅 Daily Spending Distribution", plot_daily_distribution),
-        "7": ("💰 Top 5 Expense Items", plot_top_expense_items),
-    }
+    options = {str(i): entry for i, entry in enumerate(CHARTS.items(), start=1)}
+    render_all = str(len(options) + 1)
+    back = str(len(options) + 2)
 
     print(f"\n=== Visualization Dashboard ({APP_NAME} v{VERSION}) ===")
     while True:
         for k, (label, _) in options.items():
             print(f"{k}. {label}")
-        print("8. 🔙 Return to Main Menu")
-
-        choice = input("\nSelect a chart (1–8): ").strip()
-
-        if choice == "1":
-            plot_monthly_spending()
-        elif choice == "2":
-            plot_monthly_spending_by_category()
-        elif choice == "3":
-            plot_category_breakdown()
-        elif choice == "4":
-            plot_spending_trend()
-        elif choice == "5":
-            plot_category_heatmap()
-        elif choice == "6":
-            plot_daily_distribution()
-        elif choice == "7":
-            plot_top_expense_items()
-        elif choice == "8":
-            print("Returning to Main Menu...")
-            break
+        print(f"{render_all}. 🖼️ Render All Charts")
+        print(f"{back}. 🔙 Return to Main Menu")
 
-        entry = options.get(choice)
-        if not entry:
-            print("⚠️ Invalid selection. Try again.")
-            continue
+        choice = input(f"\nSelect a chart (1–{back}): ").strip()
 
-        label, func = entry
-        print(f"\nGenerating: {label} ...")
-        fig = func(file_path=file_path, show=False)
+        if choice == back:
+            print("Returning to Main Menu...")
+            break
 
-        if fig is None:
-            print("⚠️ No data available for this chart.")
+        if choice == render_all:
+            render_dashboard_interactive(file_path)
         else:
-            print("✅ Chart generated and saved successfully!\n")
+            entry = options.get(choice)
+            if not entry:
+                print("⚠️ Invalid selection. Try again.")
+                continue
+
+            label, func = entry
+            print(f"\nGenerating: {label} ...")
+            saved = func(file_path=file_path, show=False)
+
+            if saved is None:
+                print("⚠️ No data available for this chart.")
+            else:
+                print("✅ Chart generated and saved successfully!\n")
 
         again = input("Would you like to view another chart? (Y/N): ").strip().lower()
         if again != "y":
@@ -0,0 +1,255 @@
+# src/write_ahead_log.py
+"""
+Module: write_ahead_log
+-----------------------
+Multi-process-safe writes for file ledgers.
+
+Two pieces:
+    - ledger_lock(): an advisory lock on a `<ledger>.lock` sidecar
+      (fcntl.flock on POSIX, msvcrt.locking on Windows). Writers take it
+      exclusively; CSV loads take it shared, so a reader never parses a
+      half-written append. Re-entrant within a thread.
+    - A redo journal (`<ledger>.wal`) for CSV appends. Each append first
+      writes the encoded rows, the ledger offset they go to and a checksum
+      to the journal (fsynced), then appends them to the ledger and clears
+      the journal. If a process dies part-way, the next writer or reader
+      replays the journal: the ledger is truncated back to the recorded
+      offset and the rows are written again, so an append lands completely
+      or not at all.
+
+Full rewrites (data_manager.save_expenses) go to a temporary file that is
+atomically renamed over the ledger under the same lock.
+
+Only the standard library is imported here.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+WAL_MAGIC = b"SETWAL01"
+_RECORD_HEADER = struct.Struct("<8sQQ32s")   # magic, ledger offset, payload length, sha256(payload)
+
+_HELD = threading.local()   # resolved lock path → [fd, depth, exclusive]
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧩 Internal Helpers
+# ----------------------------------------------------------------------------------------------------
+def lock_path(file_path: str | Path) -> Path:
+    """Return the lock sidecar of a ledger (works for files and .parts directories)."""
+    path = Path(file_path)
+    return path.with_name(path.name + ".lock")
+
+
+def wal_path(file_path: str | Path) -> Path:
+    """Return the write-ahead journal of a ledger."""
+    path = Path(file_path)
+    return path.with_name(path.name + ".wal")
+
+
+def _acquire(fd: int, exclusive: bool) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return
+    # msvcrt has no shared locks; LK_LOCK retries for ~10 s before raising
+    os.lseek(fd, 0, os.SEEK_SET)
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _release(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename on POSIX (directories cannot be opened on Windows)."""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_enabled() -> bool:
+    from src import config  # dynamic import keeps WAL_FSYNC patchable
+
+    return config.WAL_FSYNC
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🔒 Locking
+# ----------------------------------------------------------------------------------------------------
+@contextmanager
+def ledger_lock(file_path: str | Path, shared: bool = False):
+    """
+    Hold the advisory lock of a ledger for the duration of the block.
+
+    Args:
+        file_path (str | Path): Ledger path.
+        shared (bool): Take a shared (reader) lock instead of an exclusive one.
+
+    Raises:
+        RuntimeError: When upgrading a shared lock held by this thread to exclusive.
+    """
+    path = lock_path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    key = str(path.resolve())
+    held = getattr(_HELD, "locks", None)
+    if held is None:
+        held = _HELD.locks = {}
+
+    state = held.get(key)
+    if state is not None:
+        if not shared and not state[2]:
+            raise RuntimeError(f"Cannot upgrade a shared ledger lock to exclusive: {path}")
+        state[1] += 1
+        try:
+            yield
+        finally:
+            state[1] -= 1
+        return
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        _acquire(fd, exclusive=not shared)
+        held[key] = [fd, 1, not shared]
+        try:
+            yield
+        finally:
+            del held[key]
+            _release(fd)
+    finally:
+        os.close(fd)
+
+
+# ----------------------------------------------------------------------------------------------------
+# 🧠 PUBLIC API
+# ----------------------------------------------------------------------------------------------------
+def recover(file_path: str | Path) -> bool:
+    """
+    Replay an unfinished append left in the journal (caller holds the exclusive lock).
+
+    Returns:
+        bool: True if the ledger was repaired.
+    """
+    ledger, journal = Path(file_path), wal_path(file_path)
+    try:
+        with journal.open("rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return False
+    if not data:
+        return False
+
+    repaired = False
+    if len(data) >= _RECORD_HEADER.size:
+        magic, offset, length, digest = _RECORD_HEADER.unpack_from(data)
+        payload = data[_RECORD_HEADER.size:_RECORD_HEADER.size + length]
+        complete = magic == WAL_MAGIC and len(payload) == length and hashlib.sha256(payload).digest() == digest
+        # An incomplete record means the crash happened before the ledger was touched
+        if complete and ledger.exists() and ledger.stat().st_size >= offset:
+            with ledger.open("r+b") as f:
+                f.truncate(offset)
+                f.seek(offset)
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            repaired = True
+            print(f"🩹 Recovered an interrupted append to {ledger.name} from its write-ahead log.")
+
+    os.truncate(journal, 0)
+    return repaired
+
+
+def needs_recovery(file_path: str | Path) -> bool:
+    """Cheap check (one stat) for a non-empty journal."""
+    try:
+        return wal_path(file_path).stat().st_size > 0
+    except FileNotFoundError:
+        return False
+
+
+def recover_if_needed(file_path: str | Path) -> None:
+    """Replay the journal under the exclusive lock if a previous writer died mid-append."""
+    if needs_recovery(file_path):
+        with ledger_lock(file_path):
+            recover(file_path)
+
+
+def journaled_append(file_path: str | Path, payload: bytes) -> None:
+    """
+    Append bytes to a ledger through the journal (caller holds the exclusive lock).
+
+    Args:
+        file_path (str | Path): Ledger file.
+        payload (bytes): Complete, newline-terminated rows.
+    """
+    if not payload:
+        return
+    ledger, journal = Path(file_path), wal_path(file_path)
+    sync = _fsync_enabled()
+    recover(ledger)
+
+    offset = ledger.stat().st_size
+    record = _RECORD_HEADER.pack(WAL_MAGIC, offset, len(payload), hashlib.sha256(payload).digest()) + payload
+    with journal.open("wb") as f:
+        f.write(record)
+        f.flush()
+        if sync:
+            os.fsync(f.fileno())
+
+    fd = os.open(ledger, os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0))
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        if sync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    os.truncate(journal, 0)
+
+
+def atomic_write(file_path: str | Path, write) -> None:
+    """
+    Replace a file atomically: write(tmp_path) fills a sibling temp file,
+    which is fsynced and renamed over the target.
+
+    Args:
+        file_path (str | Path): Target file.
+        write (Callable[[Path], None]): Writes the new content to the given path.
+    """
+    target = Path(file_path)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp)
+        if _fsync_enabled():
+            with tmp.open("rb") as f:
+                os.fsync(f.fileno())
+        os.replace(tmp, target)
+    finally:
+        tmp.unlink(missing_ok=True)
+    if _fsync_enabled():
+        _fsync_dir(target.parent)
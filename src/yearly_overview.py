@@ -17,53 +17,34 @@ import pandas as pd
 from pathlib import Path
 from tabulate import tabulate
 from src.config import DATA_FILE
-from src.data_manager import ensure_csv_exists
+from src.aggregates import get_analytics_bundle
+from src.instrumentation import instrumented
 
 
 # ----------------------------------------------------------------------------------------------------
 # 🧠 PURE FUNCTION (Detailed: Year + Month)
 # ----------------------------------------------------------------------------------------------------
-def yearly_overview(file_path: str | Path = DATA_FILE) -> pd.DataFrame:
+@instrumented()
+def yearly_overview(file_path: str | Path = DATA_FILE, chunksize: int | None = None) -> pd.DataFrame:
     """
     Summarize total yearly expenses and monthly breakdowns.
 
     Args:
         file_path (str | Path): Path to the CSV data file.
+        chunksize (int | None): Stream the file in chunks of this many rows (constant memory).
 
     Return:
         pd.DataFrame: DataFrame with columns ['Year', 'Month', 'Total'].
                       Returns an empty DataFrame if data is missing or invalid.
     """
-    file_path = Path(file_path)
-    ensure_csv_exists()
-
-    df = pd.read_csv(file_path)
-
+    # (Year, Month, Total) rows from the shared analytics bundle (no rescan of the ledger)
+    rows = get_analytics_bundle(Path(file_path), chunksize=chunksize).year_month_totals
 
     # ---- Validate Data ----
-    if df.empty or "Date" not in df.columns or "Amount" not in df.columns:
-        return pd.DataFrame(columns=["Year", "Month", "Total"])
-    
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0)
-
-
-    # Drop rows without valid dates
-    df = df.dropna(subset=["Date"])
-    if df.empty:
+    if not rows:
         return pd.DataFrame(columns=["Year", "Month", "Total"])
-    
-    
-    # Extract Year & Month names
-    df["Year"] = df["Date"].dt.year.astype(int)
-    df["Month"] = df["Date"].dt.strftime("%b")
 
-    # Group by Year and Month
-    overview_df = (
-        df.groupby(["Year", "Month"], as_index=False)["Amount"]
-        .sum()
-        .rename(columns={"Amount": "Total"})
-    )
+    overview_df = pd.DataFrame(rows, columns=["Year", "Month", "Total"])
 
     
     # Sort chronologically by Year and calender month order
@@ -78,22 +59,31 @@ def yearly_overview(file_path: str | Path = DATA_FILE) -> pd.DataFrame:
 # ----------------------------------------------------------------------------------------------------
 # 🧮 PURE FUNCTION (Yearly Totals only)
 # ----------------------------------------------------------------------------------------------------
-def yearly_total_summary(file_path: str | Path = DATA_FILE) -> pd.DataFrame:
+@instrumented()
+def yearly_total_summary(file_path: str | Path = DATA_FILE, overview_df: pd.DataFrame | None = None,
+                         chunksize: int | None = None) -> pd.DataFrame:
     """
     Summarize total amount spent per year only.
 
     Args:
         file_path (str | Path): Path to the CSV data file.
+        overview_df (pd.DataFrame | None): Precomputed yearly_overview() result to reuse.
+        chunksize (int | None): Stream the file in chunks of this many rows (constant memory).
 
     Returns:
         pd.DataFrame: DataFrame with ['Year', 'Total'] columns.
     """
-    detailed_df = yearly_overview(file_path)
-    if detailed_df.empty:
+    if overview_df is None:
+        year_totals = get_analytics_bundle(Path(file_path), chunksize=chunksize).year_totals
+        if not year_totals:
+            return pd.DataFrame(columns=["Year", "Total"])
+        return pd.DataFrame({"Year": list(year_totals), "Total": list(year_totals.values())})
+
+    if overview_df.empty:
         return pd.DataFrame(columns=["Year", "Total"])
     
     yearly_df = (
-        detailed_df.groupby("Year", as_index=False)["Total"]
+        overview_df.groupby("Year", as_index=False)["Total"]
         .sum()
         .sort_values("Year")
         .reset_index(drop=True)
@@ -111,7 +101,7 @@ def yearly_overview_interactive(file_path: str | Path = DATA_FILE):
     Prints both month-wise and year-wise summaries.
     """
     overview_df = yearly_overview(file_path)
-    yearly_df = yearly_total_summary(file_path)
+    yearly_df = yearly_total_summary(file_path, overview_df=overview_df)
 
     if overview_df.empty:
         print("⚠️ No expense data available for yearly overview.")
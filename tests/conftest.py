@@ -1,11 +1,23 @@
 import pytest
 import pandas as pd
-import tempfile
-from pathlib import Path
+from src import config
+
+
+@pytest.fixture(autouse=True)
+def isolated_output_dirs(tmp_path, monkeypatch):
+    """Keep charts, chart cache, snapshots and logs written by tests out of the checkout."""
+    output = tmp_path / "output"
+    monkeypatch.setattr(config, "VISUALS_DIR", output / "Visuals")
+    monkeypatch.setattr(config, "CHART_CACHE_DIR", output / "Visuals" / ".cache")
+    monkeypatch.setattr(config, "TEST_VISUALS_DIR", output / "logs" / "Visuals")
+    monkeypatch.setattr(config, "LOGS_DIR", output / "logs")
+    monkeypatch.setattr(config, "CACHE_DIR", output / "logs" / "cache")
+    return output
+
 
 @pytest.fixture
-def sample_csv_file():
-    """Create a temporary sample CSV file for testing."""
+def sample_csv_file(tmp_path):
+    """Create a sample CSV file for testing (its lock, WAL and edit sidecars go to tmp_path too)."""
     # Sample data
     data = [
         ["2025-10-01", "Food", "Lunch", 250],
@@ -16,14 +28,7 @@ def sample_csv_file():
     ]
     columns = ["Date", "Category", "Description", "Amount"]
 
-    # Create Temporary File
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv", mode="w", newline="") as tmp:
-        df = pd.DataFrame(data, columns=columns)
-        df.to_csv(tmp.name, index=False)
-        tmp_path = Path(tmp.name)
-
-    yield tmp_path
-
-    # Clean after path
-    if tmp_path.exists():
-        tmp_path.unlink()
\ No newline at end of file
+    # Create the file inside the per-test directory, removed by pytest with everything next to it
+    csv_file = tmp_path / "sample_expenses.csv"
+    pd.DataFrame(data, columns=columns).to_csv(csv_file, index=False)
+    return csv_file
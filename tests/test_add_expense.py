@@ -10,7 +10,7 @@ Purpose:
 
 import pytest
 import pandas as pd
-from src.add_expense import add_expense
+from src.add_expense import add_expense, add_expenses_bulk
 
 def test_add_expense_adds_entry(sample_csv_file):
     """Ensure add_module correctly adds a new row to the CSV."""
@@ -25,4 +25,35 @@ def test_add_expense_adds_entry(sample_csv_file):
 def test_add_expense_invalid_amount(sample_csv_file):
     """Ensure function handles invalid amount gracefully."""
     with pytest.raises(ValueError):
-        add_expense("2025-10-12", "Transport", "Invalid Entry", -100, file_path=sample_csv_file)
\ No newline at end of file
+        add_expense("2025-10-12", "Transport", "Invalid Entry", -100, file_path=sample_csv_file)
+
+def test_add_expenses_bulk_adds_all_entries(sample_csv_file):
+    """Ensure bulk insert appends every record across several chunks."""
+    initial_len = len(pd.read_csv(sample_csv_file))
+    entries = ({"Date": "2025-11-01", "Category": "Food", "Description": f"Item {i}", "Amount": i + 1}
+               for i in range(25))
+
+    added = add_expenses_bulk(entries, file_path=sample_csv_file, chunksize=10)
+
+    updated_df = pd.read_csv(sample_csv_file)
+    assert added == 25
+    assert len(updated_df) == initial_len + 25, "All bulk rows should be added to CSV"
+
+def test_add_expenses_bulk_invalid_amount(sample_csv_file):
+    """Ensure an invalid record aborts its chunk before anything is written."""
+    before = sample_csv_file.read_bytes()
+    with pytest.raises(ValueError):
+        add_expenses_bulk([{"Date": "2025-11-01", "Category": "Food", "Amount": 10},
+                           {"Date": "2025-11-02", "Category": "Food", "Amount": "abc"}],
+                          file_path=sample_csv_file)
+    assert sample_csv_file.read_bytes() == before
+
+
+def test_add_expenses_bulk_invalid_date(sample_csv_file):
+    """Ensure an unparsable date rejects its chunk instead of being stored and dropped on load."""
+    before = sample_csv_file.read_bytes()
+    with pytest.raises(ValueError, match="Invalid date"):
+        add_expenses_bulk([{"Date": "12/10/2025", "Category": "Food", "Amount": 10},
+                           {"Date": "someday", "Category": "Food", "Amount": 20}],
+                          file_path=sample_csv_file)
+    assert sample_csv_file.read_bytes() == before
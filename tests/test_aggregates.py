@@ -0,0 +1,104 @@
+# tests/test_aggregates.py
+"""
+Test Module: test_aggregates.py
+Purpose:
+    - Validate aggregates.py for O(1) updates on append and rebuilds after out-of-band edits.
+    - Check chunked (streaming) summaries against the in-memory ones.
+    - Check the shared analytics bundle against direct group-bys.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from src import aggregates
+from src.add_expense import add_expense
+from src.data_manager import append_expenses, load_expenses
+from src.monthly_summary import monthly_summary
+from src.category_insight import category_insight
+from src.yearly_overview import yearly_overview, yearly_total_summary
+
+
+@pytest.fixture
+def rebuild_counter(monkeypatch):
+    """Count full aggregate rebuilds."""
+    calls = {"rebuilds": 0}
+    original = aggregates.rebuild_aggregates
+
+    def counting_rebuild(file_path=None):
+        calls["rebuilds"] += 1
+        return original(file_path)
+
+    monkeypatch.setattr(aggregates, "rebuild_aggregates", counting_rebuild)
+    return calls
+
+
+def test_aggregates_follow_appends_without_rebuild(sample_csv_file, rebuild_counter):
+    """Ensure appends made through the app update the summaries incrementally."""
+    assert monthly_summary(sample_csv_file)["Total"].tolist() == [2690]
+
+    add_expense("2025-10-20", "Food", "Snack", 60.0, file_path=sample_csv_file)
+    add_expense("2025-11-01", "Travel", "Cab", 300.0, file_path=sample_csv_file)
+
+    summary_df = monthly_summary(sample_csv_file)
+    insight_df = category_insight(sample_csv_file).set_index("Category")
+    assert rebuild_counter["rebuilds"] == 1, "Only the first read should scan the ledger"
+    assert summary_df["Total"].tolist() == [2750, 300]
+    assert insight_df.loc["Food", "Entries"] == 3
+    assert insight_df.loc["Food", "Average Spent"] == pytest.approx(610 / 3)
+
+
+def test_incremental_append_parses_dates_like_rebuild(sample_csv_file):
+    """Ensure a DD/MM/YYYY append is booked to the same month incrementally as on a rebuild."""
+    aggregates.get_aggregates(sample_csv_file)
+    append_expenses([{"Date": "12/10/2025", "Category": "Food", "Description": "Old export",
+                      "Amount": 5.0, "Payment_Mode": "UPI"}], file_path=sample_csv_file)
+
+    incremental = aggregates.get_aggregates(sample_csv_file).month_totals()
+    assert incremental == aggregates.rebuild_aggregates(sample_csv_file).month_totals() == {"2025-10": 2695}
+
+
+def test_aggregates_rebuild_after_external_edit(sample_csv_file, rebuild_counter):
+    """Ensure an out-of-band edit of the ledger triggers a rebuild."""
+    monthly_summary(sample_csv_file)
+
+    df = pd.read_csv(sample_csv_file)
+    df.loc[0, "Amount"] = 1000
+    df.to_csv(sample_csv_file, index=False)
+
+    assert monthly_summary(sample_csv_file)["Total"].tolist() == [3440]
+    assert rebuild_counter["rebuilds"] == 2
+
+
+def test_chunked_summaries_match_in_memory(tmp_path):
+    """Ensure summaries streamed in small chunks equal the in-memory results exactly."""
+    rng = np.random.default_rng(7)
+    n = 2000
+    csv_file = tmp_path / "big.csv"
+    pd.DataFrame({
+        "Date": pd.to_datetime("2023-01-01") + pd.to_timedelta(rng.integers(0, 900, n), unit="D"),
+        "Category": rng.choice(["Food", "Travel", "Bills", "Shopping"], n),
+        "Description": "Item",
+        "Amount": rng.integers(1, 500_000, n) / 100,
+        "Payment_Mode": "UPI",
+    }).to_csv(csv_file, index=False)
+
+    for summary in (monthly_summary, category_insight, yearly_overview, yearly_total_summary):
+        pd.testing.assert_frame_equal(summary(csv_file, chunksize=7), summary(csv_file), check_exact=True)
+
+
+def test_analytics_bundle_matches_groupbys(sample_csv_file):
+    """Ensure every bundle view equals the per-view pandas computation and is reused until a write."""
+    df = load_expenses(sample_csv_file)
+    bundle = aggregates.analytics_bundle(df)
+
+    expected_pivot = df.assign(Month=df["Date"].dt.strftime("%Y-%m")).pivot_table(
+        index="Month", columns="Category", values="Amount", aggfunc="sum", fill_value=0)
+    pd.testing.assert_frame_equal(bundle.pivot, expected_pivot.astype("float64"), check_names=False)
+    assert bundle.chart_category_totals().set_index("Category")["Amount"].to_dict() == \
+        df.groupby("Category")["Amount"].sum().to_dict()
+    assert bundle.month_totals == {"2025-10": 2690}
+
+    shared = aggregates.get_analytics_bundle(sample_csv_file)
+    assert aggregates.get_analytics_bundle(sample_csv_file) is shared
+    add_expense("2025-11-01", "Travel", "Cab", 300.0, file_path=sample_csv_file)
+    assert aggregates.get_analytics_bundle(sample_csv_file).month_totals == {"2025-10": 2690, "2025-11": 300}
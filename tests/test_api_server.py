@@ -0,0 +1,104 @@
+# tests/test_api_server.py
+"""
+Test Module: test_api_server.py
+Purpose:
+    - Validate api_server.py query and summary endpoints over a real socket.
+    - Check that single and bulk adds go through the writer and are visible to later reads.
+"""
+
+import asyncio
+import json
+from src.api_server import ExpenseAPI
+
+
+async def _raw_status(port: int, raw: bytes) -> int:
+    """Send raw request bytes and return the response status."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return int(response.split(b" ")[1])
+
+
+async def _request(port: int, method: str, path: str, payload=None, headers: dict | None = None):
+    """Send one HTTP/1.1 request and return (status, decoded JSON body)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    extra = "".join(f"{key}: {value}\r\n" for key, value in (headers or {}).items())
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n{extra}"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, content = raw.partition(b"\r\n\r\n")
+    return int(head.split(b" ")[1]), json.loads(content)
+
+
+def _run(file_path, scenario, token=None):
+    async def main():
+        api = ExpenseAPI(file_path, token=token)
+        server = await api.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return await scenario(port)
+        finally:
+            server.close()
+            await server.wait_closed()
+            await api.close()
+    return asyncio.run(main())
+
+
+def test_query_and_summaries(sample_csv_file):
+    """Ensure filters, sorting and summaries come back as JSON and malformed requests get a 400."""
+    async def scenario(port):
+        results = await asyncio.gather(
+            _request(port, "GET", "/expenses?category=food&sort_by=Amount&descending=true"),
+            _request(port, "GET", "/summary/category"),
+            _request(port, "GET", "/expenses?bogus=1"),
+        )
+        bad_lengths = [await _raw_status(port, f"POST /expenses HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode())
+                       for length in ("abc", "-5")]
+        return results, bad_lengths
+
+    ((status, found), (_, categories), (bad_status, _)), bad_lengths = _run(sample_csv_file, scenario)
+    assert status == 200
+    assert found["count"] == 2
+    assert [row["Description"] for row in found["expenses"]] == ["Dinner", "Lunch"]
+    assert found["expenses"][0]["Date"] == "2025-10-05"
+    assert sum(row["Total Spent"] for row in categories) == 2690
+    assert bad_status == 400
+    assert bad_lengths == [400, 400], "A malformed Content-Length must get a response, not a dropped connection"
+
+
+def test_adds_are_written_and_visible(sample_csv_file):
+    """Ensure single and bulk adds are persisted, invalid bulks (amount or date) write nothing, and the token is enforced."""
+    auth = {"Authorization": "Bearer secret"}
+
+    async def scenario(port):
+        denied = await _request(port, "GET", "/health")
+        one = await _request(port, "POST", "/expenses", {"Date": "2025-11-01", "Category": "Food",
+                                                         "Description": "Snack", "Amount": 60}, auth)
+        bulk = await _request(port, "POST", "/expenses/bulk", [
+            {"Date": "2025-11-02", "Category": "Bills", "Description": "Water", "Amount": 150},
+            {"Date": "2025-11-03", "Category": "Travel", "Description": "Cab", "Amount": 400},
+        ], auth)
+        invalid = await _request(port, "POST", "/expenses/bulk", [
+            {"Date": "2025-11-04", "Category": "Food", "Description": "Tea", "Amount": 20},
+            {"Date": "2025-11-04", "Category": "Food", "Description": "Bad", "Amount": -5},
+        ], auth)
+        bad_date = await _request(port, "POST", "/expenses/bulk", [
+            {"Date": "2025-11-05", "Category": "Food", "Description": "Tea", "Amount": 20},
+            {"Date": "someday", "Category": "Food", "Description": "Lost", "Amount": 30},
+        ], auth)
+        month = await _request(port, "GET", "/expenses?month=2025-11", headers=auth)
+        return denied, one, bulk, invalid, bad_date, month
+
+    denied, one, bulk, invalid, bad_date, month = _run(sample_csv_file, scenario, token="secret")
+    assert denied[0] == 401
+    assert one == (201, {"added": 1})
+    assert bulk == (201, {"added": 2})
+    assert invalid[0] == 400
+    assert bad_date[0] == 400 and "someday" in bad_date[1]["error"]
+    assert month[1]["count"] == 3
+    assert {row["Description"] for row in month[1]["expenses"]} == {"Snack", "Water", "Cab"}
@@ -19,4 +19,13 @@ def test_category_insights_structure(sample_csv_file):
 def test_category_insights_non_negative(sample_csv_file):
     """Ensure category totals are non-negative."""
     insight_df = category_insight(file_path=sample_csv_file)
-    assert (insight_df["Total Spent"] >= 0).all(), "Category totals must be non-negative"
\ No newline at end of file
+    assert (insight_df["Total Spent"] >= 0).all(), "Category totals must be non-negative"
+
+
+def test_category_insights_skip_undated_rows(sample_csv_file):
+    """Ensure rows whose date cannot be parsed are excluded, like in the other summaries."""
+    with sample_csv_file.open("a", encoding="utf-8") as f:
+        f.write("someday,Food,Bad date,999\n")
+    insight_df = category_insight(file_path=sample_csv_file).set_index("Category")
+    assert insight_df.loc["Food", "Entries"] == 2
+    assert insight_df["Total Spent"].sum() == 2690
@@ -0,0 +1,57 @@
+# tests/test_chart_cache.py
+"""
+Test Module: test_chart_cache.py
+Purpose:
+    - Validate chart_cache.py hits, invalidation on data change, and size/age eviction.
+"""
+
+import os
+import time
+import pytest
+import matplotlib
+matplotlib.use("Agg")  # Use non-GUI backend for tests
+
+from src import chart_cache, config, visualization
+from src.add_expense import add_expense
+from src.visualization import plot_monthly_spending
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Isolated chart cache directory."""
+    monkeypatch.setattr(config, "CHART_CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+def test_unchanged_chart_is_served_from_cache(sample_csv_file, cache_dir, monkeypatch):
+    """Ensure a repeat render is a cache hit and a ledger change forces a re-render."""
+    first = plot_monthly_spending(file_path=sample_csv_file)
+    assert first.exists(), "First render must draw and save the chart"
+    assert len(list(cache_dir.glob("*.png"))) == 1
+
+    def no_render(*args, **kwargs):
+        raise AssertionError("cached chart must not be re-rendered")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(visualization.plt, "subplots", no_render)
+        hit = plot_monthly_spending(file_path=sample_csv_file)
+    assert hit == first, "Hits and misses return the same saved chart path"
+
+    add_expense("2025-11-02", "Food", "Snack", 75.0, file_path=sample_csv_file)
+    plot_monthly_spending(file_path=sample_csv_file)
+    assert len(list(cache_dir.glob("*.png"))) == 2
+
+
+def test_evict_by_age_then_size(cache_dir):
+    """Ensure expired entries go first, then least recently used ones beyond the size budget."""
+    cache_dir.mkdir()
+    now = time.time()
+    for name, age_days in [("old", 40), ("a", 3), ("b", 2), ("c", 1)]:
+        path = cache_dir / f"{name}.png"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age_days * 86400, now - age_days * 86400))
+
+    removed = chart_cache.evict(max_bytes=250, max_age_days=30)
+
+    assert removed == 2
+    assert sorted(p.stem for p in cache_dir.glob("*.png")) == ["b", "c"]
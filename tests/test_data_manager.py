@@ -0,0 +1,109 @@
+# tests/test_data_manager.py
+"""
+Test Module: test_data_manager.py
+Purpose:
+    - Validate data_manager.py for loading, appending and header handling.
+"""
+
+import pytest
+import pandas as pd
+from src import data_manager
+from src.data_manager import (ExpenseStore, append_expense, get_csv_header, iter_expenses, load_expenses,
+                              load_expenses_compact, memory_footprint)
+
+
+def test_append_expense_keeps_existing_bytes(sample_csv_file):
+    """Ensure appending writes only the new row and leaves existing content untouched."""
+    before = sample_csv_file.read_bytes()
+
+    append_expense({"Date": "2025-10-12", "Category": "Food", "Description": "Snack", "Amount": 50.0},
+                   file_path=sample_csv_file)
+
+    after = sample_csv_file.read_bytes()
+    assert after.startswith(before), "Existing rows must not be rewritten"
+    assert after[len(before):].decode("utf-8").strip() == "2025-10-12,Food,Snack,50.0"
+
+
+def test_append_expense_follows_header_order(tmp_path):
+    """Ensure values are written in the file's own column order."""
+    csv_file = tmp_path / "reordered.csv"
+    csv_file.write_text("Amount,Date,Payment_Mode,Category,Description", encoding="utf-8")
+
+    append_expense({"Date": "2025-10-12", "Category": "Bills", "Description": "Water",
+                    "Amount": 99.5, "Payment Mode": "UPI"}, file_path=csv_file)
+
+    df = load_expenses(csv_file)
+    assert len(df) == 1
+    assert df.iloc[0]["Amount"] == 99.5
+    assert df.iloc[0]["Payment_Mode"] == "UPI"
+
+
+def test_header_cache_refreshes_after_external_rewrite(sample_csv_file):
+    """Ensure the cached header is re-read when the file is rewritten out-of-band."""
+    assert get_csv_header(sample_csv_file) == ["Date", "Category", "Description", "Amount"]
+
+    pd.DataFrame(columns=["Date", "Category", "Description", "Amount", "Payment_Mode"]).to_csv(
+        sample_csv_file, index=False)
+
+    assert get_csv_header(sample_csv_file)[-1] == "Payment_Mode"
+
+
+def test_expense_store_parses_once_until_changed(sample_csv_file, monkeypatch):
+    """Ensure the store reuses its parsed frame and reloads after an app write."""
+    store = ExpenseStore()
+    monkeypatch.setattr(data_manager, "expense_store", store)
+
+    first = store.get(sample_csv_file)
+    first["Amount"] = 0  # callers get a copy; the cache must stay intact
+    second = store.get(sample_csv_file)
+    assert store.loads == 1, "Unchanged ledger should be parsed only once"
+    assert second["Amount"].sum() == 2690
+
+    append_expense({"Date": "2025-10-12", "Category": "Food", "Description": "Snack", "Amount": 10},
+                   file_path=sample_csv_file)
+    third = store.get(sample_csv_file)
+    assert store.loads == 2
+    assert len(third) == len(second) + 1
+
+
+def test_iter_expenses_streams_cleaned_chunks(sample_csv_file):
+    """Ensure chunked iteration covers every row with the same cleaning as a full load."""
+    chunks = list(iter_expenses(sample_csv_file, chunksize=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), load_expenses(sample_csv_file))
+
+
+def test_rejected_dates_reported_once_per_load(sample_csv_file, capsys):
+    """Ensure a bad date is reported once by a load, not by every chunk or cached read."""
+    with sample_csv_file.open("a", encoding="utf-8") as f:
+        f.write("someday,Food,Lost,50\n")
+
+    assert sum(len(chunk) for chunk in iter_expenses(sample_csv_file, chunksize=2)) == 5
+    assert capsys.readouterr().out == ""
+
+    data_manager.expense_store.get(sample_csv_file)
+    data_manager.expense_store.get(sample_csv_file)
+    assert capsys.readouterr().out.count("Skipped 1 row(s) with an unrecognised date") == 1
+
+
+def test_load_expenses_compact_types_and_date_fallback(tmp_path, capsys):
+    """Ensure the compact loader declares dtypes, parses non-ISO dates and reports unparsable ones."""
+    csv_file = tmp_path / "mixed.csv"
+    csv_file.write_text(
+        "Date,Category,Description,Amount,Payment_Mode\n"
+        "2025-10-01,Food,Lunch,250,UPI\n"
+        "12/10/2025,Food,Dinner,300.5,Cash\n"
+        ",Bills,No date,10,Cash\n"
+        "someday,Bills,Bad date,20,Cash\n",
+        encoding="utf-8",
+    )
+
+    df = load_expenses_compact(csv_file)
+
+    assert isinstance(df["Category"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["Payment_Mode"].dtype, pd.CategoricalDtype)
+    assert df["Amount"].dtype == "float64"
+    assert df["Date"].dt.strftime("%Y-%m-%d").tolist() == ["2025-10-01", "2025-10-12"]
+    assert "Skipped 1 row(s) with an unrecognised date (row 3: 'someday')" in capsys.readouterr().out
+    assert memory_footprint(df)["Total"] > 0
@@ -0,0 +1,48 @@
+# tests/test_date_parser.py
+"""
+Test Module: test_date_parser.py
+Purpose:
+    - Validate date_parser.py for vectorized multi-format date parsing.
+    - Check that mixed-format ledgers and imports keep every valid row.
+"""
+
+import pandas as pd
+from src.data_manager import load_expenses
+from src.date_parser import parse_dates
+from src.import_expenses import import_expenses_csv
+from src.utils import parse_date
+
+
+def test_parse_dates_matches_parse_date_per_row():
+    """Ensure batch parsing agrees with parse_date() and reports formats and rejected rows."""
+    raw = ["2025-10-01", "12/10/2025", " 13-10-2025 ", "Oct 14, 2025", "15 Oct 2025",
+           "2025-02-30", "someday", "12/10/2025", None, "", "2025-10-01"]
+    values = pd.Series(raw, index=range(10, 21))
+
+    dates, stats = parse_dates(values, block_size=2)  # small blocks force per-block detection
+
+    expected = [parse_date(v) if v else None for v in raw]
+    assert dates.dt.strftime("%Y-%m-%d").where(dates.notna(), None).tolist() == expected
+    assert stats["formats"] == {"%Y-%m-%d": 2, "%d/%m/%Y": 2, "%d-%m-%Y": 1, "%b %d, %Y": 1, "%d %b %Y": 1}
+    assert (stats["parsed"], stats["blank"], stats["rows_rejected"]) == (7, 2, 2)
+    assert stats["rejected"].to_dict() == {15: "2025-02-30", 16: "someday"}
+    assert parse_dates(values, blank_as_today=True)[0][19].date().isoformat() == parse_date("")
+
+
+def test_mixed_format_ledger_and_import_keep_rows(sample_csv_file, tmp_path, capsys):
+    """Ensure DD/MM/YYYY rows from older exports are loaded and imported, and bad dates are reported."""
+    with sample_csv_file.open("a", encoding="utf-8") as f:
+        f.write("03/11/2025,Food,Old export,100\nsomeday,Food,Lost,50\n04/11/2025,Bills,Old export,200\n")
+
+    df = load_expenses(sample_csv_file)
+    assert len(df) == 7
+    assert df["Date"].dt.strftime("%Y-%m-%d").tolist()[-2:] == ["2025-11-03", "2025-11-04"]
+    assert "Skipped 1 row(s) with an unrecognised date (row 6: 'someday')" in capsys.readouterr().out
+
+    ledger = tmp_path / "Imported.csv"
+    stats = import_expenses_csv(sample_csv_file, file_path=ledger)
+    assert stats["rows_imported"] == 7
+    assert stats["rejected"] == [(8, "invalid date 'someday'")]
+    assert stats["date_formats"] == {"%Y-%m-%d": 5, "%d/%m/%Y": 2}
+    pd.testing.assert_frame_equal(load_expenses(ledger)[["Date", "Amount"]],
+                                  df[["Date", "Amount"]].reset_index(drop=True), check_dtype=False)
@@ -0,0 +1,47 @@
+# tests/test_diagnostics.py
+"""
+Test Module: test_diagnostics.py
+Purpose:
+    - Validate diagnostics.py fingerprinting and the skip-when-unchanged cache.
+"""
+
+import pytest
+from src import config, diagnostics
+
+
+def test_fingerprint_tracks_sources_schema_and_machine(tmp_path, sample_csv_file, monkeypatch):
+    """Ensure the fingerprint changes when a source file, the ledger header or the machine changes."""
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    module = src_dir / "module.py"
+    module.write_text("VALUE = 1\n", encoding="utf-8")
+
+    first = diagnostics.diagnostics_fingerprint(sample_csv_file, src_dir=src_dir)
+    assert diagnostics.diagnostics_fingerprint(sample_csv_file, src_dir=src_dir) == first
+
+    module.write_text("VALUE = 2\n", encoding="utf-8")
+    second = diagnostics.diagnostics_fingerprint(sample_csv_file, src_dir=src_dir)
+    assert second != first
+
+    sample_csv_file.write_text("Date,Category,Description,Amount,Payment_Mode\n", encoding="utf-8")
+    third = diagnostics.diagnostics_fingerprint(sample_csv_file, src_dir=src_dir)
+    assert third != second
+
+    monkeypatch.setattr(diagnostics.platform, "node", lambda: "another-machine")
+    assert diagnostics.diagnostics_fingerprint(sample_csv_file, src_dir=src_dir) != third
+
+
+def test_start_diagnostics_skips_after_passing_run(tmp_path, sample_csv_file, monkeypatch):
+    """Ensure no test process is launched when the last passing run still matches."""
+    monkeypatch.setattr(config, "LOGS_DIR", tmp_path)
+
+    def fail_popen(*args, **kwargs):
+        raise AssertionError("diagnostics should have been skipped")
+
+    diagnostics.record_pass(diagnostics.diagnostics_fingerprint(sample_csv_file))
+    monkeypatch.setattr(diagnostics.subprocess, "Popen", fail_popen)
+
+    assert diagnostics.start_diagnostics(data_file=sample_csv_file) is None
+
+    with pytest.raises(AssertionError):
+        diagnostics.start_diagnostics(force=True, data_file=sample_csv_file)
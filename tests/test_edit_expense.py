@@ -0,0 +1,72 @@
+# tests/test_edit_expense.py
+"""
+Test Module: test_edit_expense.py
+Purpose:
+    - Validate edit_expense.py updates and deletions by stable row ID on CSV ledgers,
+      including patched caches, summaries and search.
+    - Check that SQLite and log-structured ledgers give the same results.
+"""
+
+import pytest
+import pandas as pd
+from src.add_expense import add_expense
+from src.aggregates import get_analytics_bundle
+from src.category_insight import category_insight
+from src.data_manager import expense_store, load_expenses, load_expenses_compact
+from src.edit_expense import delete_expense, get_expense, update_expense
+from src.import_expenses import import_expenses_csv
+from src.search_index import search_expenses
+from src.view_expenses import get_expenses_df
+
+
+def _id_of(description, file_path):
+    df = get_expenses_df(with_ids=True, file_path=file_path)
+    return int(df.loc[df["Description"] == description, "ID"].iloc[0])
+
+
+def test_csv_edits_patch_caches_and_survive_reload(sample_csv_file):
+    """Ensure edits change views, totals and search without rereading the CSV, and persist."""
+    get_analytics_bundle(sample_csv_file)
+    search_expenses("lunch", sample_csv_file)
+    loads = expense_store.loads
+
+    updated = update_expense(2, description="Jeans", amount=1500, file_path=sample_csv_file)
+    deleted = delete_expense(1, file_path=sample_csv_file)
+    assert updated["Amount"] == 1500.0 and deleted["Description"] == "Bus"
+    assert expense_store.loads == loads  # cached frame patched, not reloaded
+
+    stats = category_insight(sample_csv_file).set_index("Category")
+    assert stats.loc["Shopping", "Total Spent"] == 1500
+    assert "Transport" not in stats.index
+    assert list(search_expenses("jeans", sample_csv_file).index) == [2]
+    assert search_expenses("shirt", sample_csv_file).empty
+    compact = load_expenses_compact(sample_csv_file)
+    assert list(compact.index) == [0, 2, 3, 4] and compact.loc[2, "Description"] == "Jeans"
+    assert isinstance(compact["Category"].dtype, pd.CategoricalDtype)
+
+    add_expense("2025-10-06", "Food", "Snack", 50.0, file_path=sample_csv_file)
+    expense_store.clear()
+    df = load_expenses(sample_csv_file)
+    assert list(df.index) == [0, 2, 3, 4, 5]
+    assert df["Amount"].sum() == 2690 - 40 + 300 + 50
+    assert get_expense(5, sample_csv_file)["Description"] == "Snack"
+    with pytest.raises(ValueError):
+        delete_expense(1, file_path=sample_csv_file)
+
+
+@pytest.mark.parametrize("suffix", [".db", ".lsm"])
+def test_other_backends_match_csv(sample_csv_file, tmp_path, suffix):
+    """Ensure SQLite and log-structured ledgers apply the same edits as CSV."""
+    ledger = tmp_path / f"Expenses{suffix}"
+    import_expenses_csv(sample_csv_file, file_path=ledger)
+
+    for path in (sample_csv_file, ledger):
+        update_expense(_id_of("Dinner", path), category="Entertainment", date="2025-11-01", file_path=path)
+        delete_expense(_id_of("Electricity", path), file_path=path)
+
+    columns = ["Date", "Category", "Description", "Amount"]
+    expected = get_expenses_df(file_path=sample_csv_file)[columns]
+    pd.testing.assert_frame_equal(get_expenses_df(file_path=ledger)[columns], expected, check_dtype=False)
+    pd.testing.assert_frame_equal(category_insight(ledger), category_insight(sample_csv_file), check_dtype=False)
+    with pytest.raises(ValueError):
+        update_expense(999, amount=10, file_path=ledger)
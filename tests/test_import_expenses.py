@@ -0,0 +1,42 @@
+# tests/test_import_expenses.py
+"""
+Test Module: test_import_expenses.py
+Purpose:
+    - Validate import_expenses.py for streaming CSV imports and row validation.
+"""
+
+import pytest
+import pandas as pd
+from src.import_expenses import import_expenses_csv
+
+
+def test_import_expenses_adds_valid_rows(sample_csv_file, tmp_path):
+    """Ensure valid rows are imported and invalid ones are rejected with a reason."""
+    source = tmp_path / "bank_export.csv"
+    source.write_text(
+        "date,category,description,amount,payment mode\n"
+        "12/10/2025,Food,Groceries,450.50,Card\n"
+        "2025-10-13,Travel,Cab,\"1,200\",UPI\n"
+        "not-a-date,Food,Bad Date,100,Cash\n"
+        "2025-10-14,Food,Bad Amount,-5,Cash\n",
+        encoding="utf-8",
+    )
+    initial_len = len(pd.read_csv(sample_csv_file))
+
+    stats = import_expenses_csv(source, file_path=sample_csv_file, chunksize=1)
+
+    df = pd.read_csv(sample_csv_file)
+    assert stats["rows_read"] == 4
+    assert stats["rows_imported"] == 2
+    assert [line for line, _ in stats["rejected"]] == [4, 5]
+    assert len(df) == initial_len + 2
+    assert df.iloc[-2]["Date"] == "2025-10-12", "Dates should be normalized to ISO format"
+    assert df.iloc[-1]["Amount"] == 1200
+
+
+def test_import_expenses_requires_date_and_amount(sample_csv_file, tmp_path):
+    """Ensure a source without the required columns is refused."""
+    source = tmp_path / "bad.csv"
+    source.write_text("foo,bar\n1,2\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        import_expenses_csv(source, file_path=sample_csv_file)
@@ -0,0 +1,53 @@
+# tests/test_instrumentation.py
+"""
+Test Module: test_instrumentation.py
+Purpose:
+    - Validate instrumentation.py call counts, latencies and rows on instrumented entry points.
+    - Check that profile mode writes cProfile and JSON reports.
+"""
+
+import json
+import pytest
+from src import instrumentation
+from src.data_manager import load_expenses
+from src.monthly_summary import monthly_summary
+
+
+def test_entry_points_record_calls_and_rows(sample_csv_file):
+    """Ensure instrumented loads and summaries show up with call counts and rows."""
+    instrumentation.reset()
+    load_expenses(sample_csv_file)
+    load_expenses(sample_csv_file)
+
+    stats = {item["name"]: item for item in instrumentation.snapshot()}
+    assert stats["data_manager.load_expenses"]["calls"] == 2
+    assert stats["data_manager.load_expenses"]["rows"] == 10
+    assert stats["data_manager.load_expenses"]["max_ms"] > 0
+
+    monthly_summary(sample_csv_file)
+    stats = {item["name"]: item for item in instrumentation.snapshot()}
+    assert stats["monthly_summary.monthly_summary"]["calls"] == 1
+    assert stats["aggregates.group_by"]["rows"] == 5
+    assert "monthly_summary.monthly_summary" in instrumentation.format_report()
+
+    @instrumentation.instrumented("tests.failing")
+    def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        failing()
+    assert {item["name"]: item for item in instrumentation.snapshot()}["tests.failing"]["calls"] == 1
+
+
+def test_profiling_writes_reports(sample_csv_file, tmp_path):
+    """Ensure stopping a profile run writes .prof, text and JSON reports."""
+    instrumentation.start_profiling()
+    load_expenses(sample_csv_file)
+    paths = instrumentation.stop_profiling(tmp_path)
+
+    assert [path.suffix for path in paths] == [".prof", ".txt", ".json"]
+    assert all(path.exists() for path in paths)
+    assert "load_expenses" in paths[1].read_text(encoding="utf-8")
+    report = json.loads(paths[2].read_text(encoding="utf-8"))
+    assert any(item["name"] == "data_manager.load_expenses" for item in report["operations"])
+    assert instrumentation.stop_profiling(tmp_path) == []
@@ -0,0 +1,59 @@
+# tests/test_label_layout.py
+"""
+Test Module: test_label_layout.py
+Purpose:
+    - Validate label_layout.py placement against a brute-force reference.
+    - Check that dense grouped-bar charts render within a time budget.
+"""
+
+import random
+import time
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Use non-GUI backend for tests
+
+from src.label_layout import LabelLayout
+from src.visualization import plot_monthly_spending_by_category
+
+
+def _brute_force(labels, step):
+    """Reference placement: compare every label with every earlier one."""
+    placed, result = [], []
+    for x, y, w, h in labels:
+        while any(x - w / 2 < px1 and px0 < x + w / 2 and y < py1 and py0 < y + h
+                  for px0, py0, px1, py1 in placed):
+            y += step
+        placed.append((x - w / 2, y, x + w / 2, y + h))
+        result.append(y)
+    return result
+
+
+def test_grid_layout_matches_brute_force():
+    """Ensure the grid index resolves collisions exactly like the all-pairs check."""
+    rng = random.Random(3)
+    labels = [(rng.uniform(0, 20), rng.uniform(0, 50), rng.uniform(0.2, 1.5), rng.uniform(0.5, 2))
+              for _ in range(400)]
+
+    layout = LabelLayout(cell_width=1.5, cell_height=2)
+    placed = [layout.place(x, y, w, h, step=0.7) for x, y, w, h in labels]
+
+    assert placed == _brute_force(labels, step=0.7)
+
+
+def test_dense_category_chart_renders_quickly(tmp_path):
+    """Ensure hundreds of labelled bars render well within the time budget."""
+    rng = np.random.default_rng(5)
+    months = pd.period_range("2022-01", periods=36, freq="M")
+    rows = [(f"{month}-{rng.integers(1, 28):02d}", f"Category {c}", "Item", int(rng.integers(50, 5000)), "UPI")
+            for month in months for c in range(12)]
+    csv_file = tmp_path / "dense.csv"
+    pd.DataFrame(rows, columns=["Date", "Category", "Description", "Amount", "Payment_Mode"]).to_csv(
+        csv_file, index=False)
+
+    start = time.perf_counter()
+    fig = plot_monthly_spending_by_category.render(file_path=csv_file)
+    elapsed = time.perf_counter() - start
+
+    assert len(fig.axes[0].texts) == 36 * 12 + 36
+    assert elapsed < 10, f"432 bars took {elapsed:.1f}s"
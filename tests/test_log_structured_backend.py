@@ -0,0 +1,77 @@
+# tests/test_log_structured_backend.py
+"""
+Test Module: test_log_structured_backend.py
+Purpose:
+    - Validate log_structured_backend.py for appends, summaries and stable row ids.
+    - Check that compaction drops superseded rows and tombstones while readers see consistent data.
+"""
+
+import threading
+import pytest
+import pandas as pd
+from src import config
+from src.add_expense import add_expense
+from src.data_manager import get_backend, load_expenses
+from src.import_expenses import import_expenses_csv
+from src.log_structured_backend import compact_ledger, wait_for_compaction
+from src.monthly_summary import monthly_summary
+
+
+@pytest.fixture
+def lsm_ledger(sample_csv_file, tmp_path):
+    """Create a log-structured ledger from the sample CSV."""
+    ledger = tmp_path / "Expenses.lsm"
+    import_expenses_csv(sample_csv_file, file_path=ledger)
+    return ledger
+
+
+def test_appends_and_summaries_match_flat_csv(sample_csv_file, lsm_ledger):
+    """Ensure rows get stable ids and summaries match the CSV ledger, before and after compaction."""
+    add_expense("2025-11-03", "Food", "Brunch", 410.0, file_path=lsm_ledger)
+    add_expense("2025-11-03", "Food", "Brunch", 410.0, file_path=sample_csv_file)
+
+    df = load_expenses(lsm_ledger)
+    assert list(df.index) == [0, 1, 2, 3, 4, 5]
+    pd.testing.assert_frame_equal(monthly_summary(lsm_ledger), monthly_summary(sample_csv_file))
+
+    backend = get_backend(lsm_ledger)
+    fingerprint = backend.fingerprint()
+    backend.flush_log()
+    assert backend.fingerprint() == fingerprint  # compaction does not change the logical version
+    add_expense("2025-11-04", "Travel", "Metro", 60.0, file_path=lsm_ledger)
+    assert compact_ledger(lsm_ledger) == {"segments": 1, "rows": 7}
+    assert load_expenses(lsm_ledger).loc[6, "Description"] == "Metro"
+    assert get_backend(lsm_ledger).name == "log"
+
+
+def test_compaction_drops_superseded_rows(lsm_ledger, monkeypatch):
+    """Ensure newer records win, tombstones hide rows, and background merges keep reads consistent."""
+    monkeypatch.setattr(config, "LSM_FLUSH_BYTES", 1)
+    monkeypatch.setattr(config, "LSM_MAX_SEGMENTS", 2)
+    backend = get_backend(lsm_ledger)
+
+    backend.write_records([{"op": "put", "id": 1, "Date": "2025-10-02", "Category": "Transport",
+                            "Description": "Metro", "Amount": 45, "Payment_Mode": "UPI"}])
+    backend.write_records([{"op": "del", "id": 3}])
+    expected = load_expenses(lsm_ledger)
+    assert list(expected.index) == [0, 1, 2, 4]
+    assert expected.loc[1, "Description"] == "Metro"
+
+    seen, stop = [], threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            seen.append(backend.load())
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    for n in range(3):
+        backend.write_records([{"op": "del", "id": 100 + n}])  # no-op deletes just create segments
+    wait_for_compaction(lsm_ledger)
+    stop.set()
+    thread.join()
+
+    assert seen and all(df.equals(expected) for df in seen)
+    assert compact_ledger(lsm_ledger)["segments"] == 1
+    segment = backend.read_segment(backend.read_manifest()["segments"][0])
+    assert len(segment["rows"]) == 4 and len(segment["tombstones"]) == 0
@@ -0,0 +1,38 @@
+# tests/test_main.py
+"""
+Test Module: test_main.py
+Purpose:
+    - Validate that main.py starts without importing the heavy plotting / data / test stack.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from src.main import EXIT_CHOICE
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def test_main_import_defers_heavy_modules():
+    """Ensure importing the CLI does not load pandas, matplotlib, seaborn or pytest."""
+    probe = (
+        f"import sys; sys.path.insert(0, {str(ROOT_DIR)!r}); import src.main; "
+        "print(','.join(m for m in ('pandas', 'matplotlib', 'seaborn', 'pytest') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+def test_main_menu_exits_without_diagnostics(tmp_path):
+    """Ensure the menu appears and exits cleanly when diagnostics are skipped (on a throwaway ledger)."""
+    ledger = tmp_path / "Expenses.csv"
+    result = subprocess.run(
+        [sys.executable, str(ROOT_DIR / "src" / "main.py"), "--no-diagnostics"],
+        input=f"{EXIT_CHOICE}\n", capture_output=True, text=True, encoding="utf-8", cwd=tmp_path,
+        env={**os.environ, "EXPENSE_TRACKER_DATA_FILE": str(ledger)},
+    )
+    assert result.returncode == 0
+    assert "Select an option" in result.stdout
+    assert ledger.exists(), "The CLI must create the ledger named by the override, not data/Expenses.csv"
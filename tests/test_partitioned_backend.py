@@ -0,0 +1,55 @@
+# tests/test_partitioned_backend.py
+"""
+Test Module: test_partitioned_backend.py
+Purpose:
+    - Validate partitioned_backend.py for month pruning, local appends and summaries.
+"""
+
+import pytest
+import pandas as pd
+from src.add_expense import add_expense
+from src.data_manager import ExpenseStore, get_backend
+from src.import_expenses import import_expenses_csv
+from src.monthly_summary import monthly_summary
+from src.view_expenses import get_expenses_df
+from src.yearly_overview import yearly_overview
+
+
+@pytest.fixture
+def partitioned_ledger(sample_csv_file, tmp_path):
+    """Create a partitioned ledger spanning two months."""
+    ledger = tmp_path / "Expenses.parts"
+    import_expenses_csv(sample_csv_file, file_path=ledger)
+    add_expense("2025-11-03", "Food", "Brunch", 410.0, file_path=ledger)
+    return ledger
+
+
+def test_partitioned_month_query_opens_one_partition(partitioned_ledger, monkeypatch):
+    """Ensure a month filter only loads the matching partition file."""
+    from src import partitioned_backend
+    store = ExpenseStore()
+    monkeypatch.setattr(partitioned_backend, "expense_store", store)
+
+    df = get_expenses_df(month="2025-11", file_path=partitioned_ledger)
+
+    assert list(df["Description"]) == ["Brunch"]
+    assert store.loads == 1, "Only the 2025-11 partition should be parsed"
+
+
+def test_partitioned_append_touches_current_month_only(partitioned_ledger):
+    """Ensure an append leaves other month files untouched."""
+    october = get_backend(partitioned_ledger).partition_path("2025-10")
+    before = october.read_bytes()
+
+    add_expense("2025-11-04", "Travel", "Metro", 60.0, file_path=partitioned_ledger)
+
+    assert october.read_bytes() == before
+    assert get_backend(partitioned_ledger).read_manifest()["partitions"]["2025-11"]["rows"] == 2
+
+
+def test_partitioned_summaries_match_flat_csv(sample_csv_file, partitioned_ledger):
+    """Ensure partition-by-partition summaries equal the flat-file results."""
+    add_expense("2025-11-03", "Food", "Brunch", 410.0, file_path=sample_csv_file)
+
+    pd.testing.assert_frame_equal(monthly_summary(partitioned_ledger), monthly_summary(sample_csv_file))
+    pd.testing.assert_frame_equal(yearly_overview(partitioned_ledger), yearly_overview(sample_csv_file))
@@ -0,0 +1,50 @@
+# tests/test_query_engine.py
+"""
+Test Module: test_query_engine.py
+Purpose:
+    - Validate query_engine.py combined filters, multi-key sorting and limits.
+    - Check that SQLite pushdown returns the same rows as the in-memory engine.
+"""
+
+import pytest
+from src.import_expenses import import_expenses_csv
+from src.query_engine import query_expenses
+from src.view_expenses import get_expenses_df
+
+
+def test_combined_filters(sample_csv_file):
+    """Ensure every filter narrows the result and filters combine with AND."""
+    df = query_expenses(sample_csv_file, categories=["food", "BILLS"], start="2025-10-02", end="2025-10-05")
+    assert sorted(df["Description"]) == ["Dinner", "Electricity"]
+
+    df = query_expenses(sample_csv_file, min_amount=250, max_amount=900, description="N")
+    assert sorted(df["Description"]) == ["Dinner", "Lunch"]
+
+    df = query_expenses(sample_csv_file, month="2025", description="shirt")
+    assert df["Amount"].tolist() == [1200]
+
+    with pytest.raises(TypeError):
+        query_expenses(sample_csv_file, colour="red")
+    with pytest.raises(ValueError):
+        query_expenses(sample_csv_file, category="Food", categories=["Bills"])
+
+
+def test_multi_key_sort_and_limit(sample_csv_file):
+    """Ensure multi-key sorting honours per-key direction and limit keeps the top rows."""
+    df = get_expenses_df(sort_by=["Category", "Amount"], descending=[False, True], file_path=sample_csv_file)
+    assert df["Description"].tolist() == ["Electricity", "Dinner", "Lunch", "T-Shirt", "Bus"]
+
+    top = get_expenses_df(sort_by="Amount", descending=True, limit=2, file_path=sample_csv_file)
+    assert top["Amount"].tolist() == [1200, 900]
+
+
+def test_sqlite_pushdown_matches_in_memory(sample_csv_file, tmp_path):
+    """Ensure the SQLite backend answers full queries exactly like the CSV engine."""
+    db_path = tmp_path / "Expenses.db"
+    import_expenses_csv(sample_csv_file, file_path=db_path)
+
+    query = dict(categories=["Food", "shopping"], min_amount=260, description="i",
+                 sort_by=["Amount"], descending=True, limit=5)
+    csv_df = get_expenses_df(file_path=sample_csv_file, **query)
+    db_df = get_expenses_df(file_path=db_path, **query)
+    assert db_df["Description"].tolist() == csv_df["Description"].tolist() == ["T-Shirt", "Dinner"]
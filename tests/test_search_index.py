@@ -0,0 +1,43 @@
+# tests/test_search_index.py
+"""
+Test Module: test_search_index.py
+Purpose:
+    - Validate search_index.py multi-word AND queries and prefix matching.
+    - Check that appends extend the index instead of rebuilding it, and that
+      the persisted index is reused across processes.
+"""
+
+import pytest
+from src import config, search_index
+from src.add_expense import add_expense
+from src.search_index import DescriptionIndex, search_expenses
+
+
+def test_search_words_and_prefixes(sample_csv_file):
+    """Ensure every word must match, case-insensitively, with optional prefix matching."""
+    add_expense("2025-10-06", "Travel", "Hello Steel trip", 500.0, file_path=sample_csv_file)
+    add_expense("2025-10-07", "Travel", "Steel works visit", 200.0, file_path=sample_csv_file)
+
+    assert search_expenses("hello steel", sample_csv_file)["Amount"].tolist() == [500]
+    assert search_expenses("STEEL", sample_csv_file)["Amount"].tolist() == [500, 200]
+    assert search_expenses("din", sample_csv_file)["Description"].tolist() == ["Dinner"]
+    assert search_expenses("din", sample_csv_file, prefix=False).empty
+    assert search_expenses("steel dinner", sample_csv_file).empty
+
+
+def test_appends_extend_persisted_index(sample_csv_file, tmp_path, monkeypatch):
+    """Ensure appends are indexed incrementally and the sidecar survives a restart."""
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(config, "SEARCH_INDEX_MIN_ROWS", 1)
+
+    builds = {"rows": []}
+    original = DescriptionIndex.add_frame
+    monkeypatch.setattr(DescriptionIndex, "add_frame",
+                        lambda self, df: (builds["rows"].append(len(df)), original(self, df))[1])
+
+    assert search_expenses("lunch", sample_csv_file)["Amount"].tolist() == [250]
+    add_expense("2025-10-08", "Food", "Team lunch", 900.0, file_path=sample_csv_file)
+
+    search_index.invalidate_search_index(sample_csv_file)  # simulate a fresh process
+    assert search_expenses("lunch", sample_csv_file)["Amount"].tolist() == [250, 900]
+    assert builds["rows"] == [5, 1], "Only the appended row should be tokenized after the first build"
@@ -0,0 +1,57 @@
+# tests/test_snapshot_cache.py
+"""
+Test Module: test_snapshot_cache.py
+Purpose:
+    - Validate snapshot_cache.py for tail replay and safe rebuilds after hand edits.
+"""
+
+import pytest
+import pandas as pd
+from src import config, snapshot_cache
+from src.data_manager import TEXT_DTYPES, append_expense, clean_expenses, load_expenses
+
+
+@pytest.fixture
+def snapshot_env(tmp_path, monkeypatch):
+    """Route snapshots to a temp dir and enable them for tiny files; count full rebuilds."""
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(config, "SNAPSHOT_MIN_BYTES", 0)
+    calls = {"rebuilds": 0}
+    original = snapshot_cache._full_rebuild
+
+    def counting_rebuild(file_path):
+        calls["rebuilds"] += 1
+        return original(file_path)
+
+    monkeypatch.setattr(snapshot_cache, "_full_rebuild", counting_rebuild)
+    return calls
+
+
+def _full_parse(file_path):
+    return clean_expenses(pd.read_csv(file_path, dtype=TEXT_DTYPES))
+
+
+def test_snapshot_replays_appended_tail(sample_csv_file, snapshot_env):
+    """Ensure appended rows are parsed from the tail without a full rebuild."""
+    first = load_expenses(sample_csv_file)
+    assert snapshot_cache.snapshot_path(sample_csv_file).exists()
+
+    append_expense({"Date": "2025-10-20", "Category": "Food", "Description": "Snack", "Amount": 75},
+                   file_path=sample_csv_file)
+    second = load_expenses(sample_csv_file)
+
+    assert snapshot_env["rebuilds"] == 1, "Only the cold start should parse the whole file"
+    assert len(second) == len(first) + 1
+    pd.testing.assert_frame_equal(second, _full_parse(sample_csv_file))
+
+
+def test_snapshot_rebuilds_after_hand_edit(sample_csv_file, snapshot_env):
+    """Ensure an out-of-band edit to covered bytes forces a full rebuild."""
+    load_expenses(sample_csv_file)
+    sample_csv_file.write_text(sample_csv_file.read_text().replace("Lunch,250", "Lunch,999"))
+
+    df = load_expenses(sample_csv_file)
+
+    assert snapshot_env["rebuilds"] == 2
+    assert df["Amount"].max() == 1200
+    assert 999 in df["Amount"].values
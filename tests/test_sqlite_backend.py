@@ -0,0 +1,76 @@
+# tests/test_sqlite_backend.py
+"""
+Test Module: test_sqlite_backend.py
+Purpose:
+    - Validate sqlite_backend.py for inserts, indexed query pushdown and CSV import/export.
+"""
+
+import sqlite3
+import pytest
+import pandas as pd
+from contextlib import closing
+from src.add_expense import add_expense
+from src.data_manager import export_expenses_csv, get_backend, load_expenses
+from src.edit_expense import delete_expense, get_expense
+from src.import_expenses import import_expenses_csv
+from src.view_expenses import get_expenses_df
+
+
+@pytest.fixture
+def sqlite_ledger(sample_csv_file, tmp_path):
+    """Create a SQLite ledger populated from the sample CSV."""
+    db_path = tmp_path / "Expenses.db"
+    import_expenses_csv(sample_csv_file, file_path=db_path)
+    return db_path
+
+
+def test_sqlite_roundtrip_matches_csv(sample_csv_file, sqlite_ledger):
+    """Ensure the SQLite ledger loads the same data as the CSV it was imported from."""
+    add_expense("2025-11-02", "Food", "Breakfast", 120.0, "UPI", file_path=sqlite_ledger)
+
+    df = load_expenses(sqlite_ledger)
+    csv_df = load_expenses(sample_csv_file)
+    assert len(df) == len(csv_df) + 1
+    assert df["Amount"].sum() == csv_df["Amount"].sum() + 120
+    assert df.iloc[-1]["Payment_Mode"] == "UPI"
+
+
+def test_sqlite_filters_use_indexes(sqlite_ledger):
+    """Ensure category/month filters are pushed down as indexed SQL."""
+    df = get_expenses_df(category="food", month="2025-10", file_path=sqlite_ledger)
+    assert len(df) == 2
+    assert set(df["Category"]) == {"Food"}
+
+    backend = get_backend(sqlite_ledger)
+    sql, params = backend.select_sql(category="Food", month="2025-10")
+    with closing(backend.connect()) as conn:
+        plan = " ".join(str(row) for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+    assert "USING INDEX" in plan
+
+
+def test_sqlite_export_csv(sqlite_ledger, tmp_path):
+    """Ensure a SQLite ledger can be exported back to CSV."""
+    dest = tmp_path / "export.csv"
+    exported = export_expenses_csv(dest, file_path=sqlite_ledger)
+
+    df = pd.read_csv(dest)
+    assert exported == len(df) == 5
+    assert df.iloc[0]["Date"] == "2025-10-01"
+
+
+def test_deleted_ids_are_never_reused(tmp_path):
+    """Ensure a new row never takes the id of a deleted one, also in databases made before AUTOINCREMENT."""
+    db_path = tmp_path / "Legacy.db"
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.execute("CREATE TABLE expenses (id INTEGER PRIMARY KEY, Date TEXT, Category TEXT, "
+                     "Description TEXT, Amount REAL NOT NULL DEFAULT 0, Payment_Mode TEXT)")
+        conn.executemany("INSERT INTO expenses VALUES (?, ?, ?, ?, ?, ?)",
+                         [(1, "2025-10-01", "Food", "a", 10, "Cash"), (2, "2025-10-02", "Food", "b", 20, "Cash")])
+
+    delete_expense(2, file_path=db_path)
+    add_expense("2025-10-03", "Food", "c", 30.0, file_path=db_path)
+
+    assert list(load_expenses(db_path).index) == [1, 3]
+    assert get_expense(1, db_path)["Description"] == "a"
+    with pytest.raises(ValueError):
+        get_expense(2, db_path)
@@ -0,0 +1,36 @@
+# tests/test_table_view.py
+"""
+Test Module: test_table_view.py
+Purpose:
+    - Validate table_view.py fixed-width streaming output and the interactive pager.
+"""
+
+import io
+import pytest
+from src.data_manager import load_expenses
+from src.table_view import iter_table_lines, paginate
+
+
+def test_streamed_table_is_aligned(sample_csv_file):
+    """Ensure every streamed line has the same width and values are formatted."""
+    df = load_expenses(sample_csv_file)
+    lines = list(iter_table_lines(df, chunk_rows=2))
+
+    assert len(lines) == len(df) + 4
+    assert len({len(line) for line in lines}) == 1
+    assert "2025-10-03" in lines[5] and "1200.00" in lines[5]
+
+    long_df = df.assign(Description="x" * 100)
+    assert "…" in list(iter_table_lines(long_df))[3]
+
+
+def test_paginate_next_prev_jump(sample_csv_file):
+    """Ensure the pager moves between pages and stops on quit."""
+    df = load_expenses(sample_csv_file)
+    commands = iter(["n", "p", "j 3", "q"])
+    out = io.StringIO()
+    paginate(df, page_size=2, input_fn=lambda _: next(commands), out=out)
+
+    pages = [line for line in out.getvalue().splitlines() if line.startswith("Page ")]
+    assert [page.split()[1] for page in pages] == ["1/3", "2/3", "1/3", "3/3"]
+    assert "Dinner" in out.getvalue()
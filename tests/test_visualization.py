@@ -9,6 +9,7 @@ import pytest
 import matplotlib
 matplotlib.use("Agg") # Use non-GUI backend for tests
 
+from src import chart_cache
 from src.visualization import (
     plot_monthly_spending,
     plot_monthly_spending_by_category,
@@ -16,28 +17,39 @@ from src.visualization import (
     plot_spending_trend,
     plot_category_heatmap,
     plot_daily_distribution,
+    render_dashboard,
+    CHARTS,
 )
 
 def test_plot_monthly_totals(sample_csv_file):
     """Ensure monthly bar chart executes without exception."""
-    plot_monthly_spending(file_path=sample_csv_file)
+    assert plot_monthly_spending(file_path=sample_csv_file).exists()
 
 def test_plot_category_bar(sample_csv_file):
     """Ensure category-wise bar chart executes without exception."""
-    plot_monthly_spending_by_category(file_path=sample_csv_file)
+    assert plot_monthly_spending_by_category(file_path=sample_csv_file).exists()
 
 def test_plot_category_pie(sample_csv_file):
     """Ensure pie chart executes without exception."""
-    plot_category_breakdown(file_path=sample_csv_file)
+    assert plot_category_breakdown(file_path=sample_csv_file).exists()
 
 def test_plot_trend_line(sample_csv_file):
     """Ensure trend line chart executes without exception."""
-    plot_spending_trend(file_path=sample_csv_file)
+    assert plot_spending_trend(file_path=sample_csv_file).exists()
 
 def test_plot_heat_map(sample_csv_file):
     """Ensure heat map executes without exception."""
-    plot_category_heatmap(file_path=sample_csv_file)
+    assert plot_category_heatmap(file_path=sample_csv_file).exists()
 
 def test_plot_top5_expenses(sample_csv_file):
     """Ensure Top 5 Expenses chart executes without exception."""
-    plot_daily_distribution(file_path=sample_csv_file)
\ No newline at end of file
+    assert plot_daily_distribution(file_path=sample_csv_file).exists()
+
+def test_render_dashboard_renders_every_chart(sample_csv_file, isolated_output_dirs):
+    """Ensure the dashboard renders all charts from one data load, in parallel and sequentially."""
+    for parallel in (True, False):
+        chart_cache.clear()  # render for real both times
+        timings = render_dashboard(file_path=sample_csv_file, parallel=parallel, max_workers=2)
+        assert list(timings) == list(CHARTS)
+        assert all(seconds is not None for seconds in timings.values())
+        assert len(list((isolated_output_dirs / "Visuals" / ".cache").glob("*.png"))) == len(CHARTS)
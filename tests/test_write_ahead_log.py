@@ -0,0 +1,71 @@
+# tests/test_write_ahead_log.py
+"""
+Test Module: test_write_ahead_log.py
+Purpose:
+    - Stress concurrent appends from parallel processes (no lost or torn rows).
+    - Validate that an append interrupted mid-write is replayed from the journal.
+"""
+
+import hashlib
+import multiprocessing
+import pandas as pd
+from src import write_ahead_log
+from src.data_manager import append_expenses, expense_store, get_backend, load_expenses, save_expenses
+
+WRITERS = 4
+BATCHES = 25
+
+
+def _writer(path: str, worker: int) -> None:
+    """Append BATCHES small batches from a separate process."""
+    from src import config
+    config.WAL_FSYNC = False  # contention is what is being tested, not disk speed
+    for batch in range(BATCHES):
+        append_expenses([
+            {"Date": "2025-11-01", "Category": "Food", "Description": f"w{worker}-b{batch}-{i}",
+             "Amount": 10, "Payment_Mode": "Cash"}
+            for i in range(2)
+        ], path)
+
+
+def test_parallel_writers_lose_nothing(sample_csv_file):
+    """Ensure rows appended concurrently by several processes all land intact."""
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_writer, args=(str(sample_csv_file), n)) for n in range(WRITERS)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(timeout=120)
+        assert process.exitcode == 0
+
+    expense_store.clear()
+    df = load_expenses(sample_csv_file)
+    added = df[df["Description"].str.startswith("w")]
+    assert len(added) == WRITERS * BATCHES * 2
+    assert added["Description"].is_unique
+    assert (added["Amount"] == 10).all()
+    assert len(sample_csv_file.read_text(encoding="utf-8").splitlines()) == 6 + WRITERS * BATCHES * 2
+    assert write_ahead_log.wal_path(sample_csv_file).stat().st_size == 0
+
+
+def test_interrupted_append_is_replayed(sample_csv_file):
+    """Ensure a journaled append torn by a crash is completed, and rewrites stay atomic."""
+    offset = sample_csv_file.stat().st_size
+    payload = b"2025-11-02,Bills,Water,150\n2025-11-03,Travel,Cab,400\n"
+    record = write_ahead_log._RECORD_HEADER.pack(write_ahead_log.WAL_MAGIC, offset, len(payload),
+                                                 hashlib.sha256(payload).digest()) + payload
+    write_ahead_log.wal_path(sample_csv_file).write_bytes(record)
+    with sample_csv_file.open("ab") as f:
+        f.write(payload[:20])  # the crash happened part-way through the ledger write
+
+    chunks = list(get_backend(sample_csv_file).iter_chunks(2))  # streaming readers recover too
+    assert sum(len(chunk) for chunk in chunks) == 7
+
+    expense_store.clear()
+    df = load_expenses(sample_csv_file)
+    assert len(df) == 7
+    assert df["Amount"].sum() == 2690 + 550
+
+    save_expenses(df[df["Category"] != "Travel"], sample_csv_file)
+    assert len(pd.read_csv(sample_csv_file)) == 6
+    assert not list(sample_csv_file.parent.glob(f".{sample_csv_file.name}.*.tmp"))